@@ -0,0 +1,30 @@
+"""Request metrics administration API."""
+
+from fastapi import APIRouter, Depends, Response
+
+from ...models import User
+from ...services.metrics import MetricsService
+from ..authentication import registered_user
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+openapi_tags = {
+    "name": "(Admin) Metrics",
+    "description": "Latency and database use of the requests served, for monitoring.",
+}
+
+api = APIRouter(prefix="/api/admin/metrics")
+
+
+@api.get("", tags=["(Admin) Metrics"])
+def get_metrics(
+    subject: User = Depends(registered_user),
+    metrics_service: MetricsService = Depends(),
+) -> Response:
+    """Report the latency and database use of requests, by route, in the Prometheus text format."""
+    return Response(
+        content=metrics_service.prometheus(subject),
+        media_type="text/plain; version=0.0.4",
+    )
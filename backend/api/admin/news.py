@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from backend.models.cache_statistics import CacheStatistics
 from backend.models.news_post import NewsPost
 from backend.models.pagination import EventPaginationParams
 from backend.services.news_post import NewsPostService
@@ -34,3 +35,15 @@ def list_posts(
         return news_service.get_paginated_posts(pagination_params, subject)
     except UserPermissionException as e:
         raise HTTPException(status_code=403, detail=str(e))
+
+
+@api.get("/cache", tags=["(Admin) News"])
+def get_feed_cache_statistics(
+    subject: User = Depends(registered_user),
+    news_service: NewsPostService = Depends(),
+) -> CacheStatistics:
+    """Report hits and misses of the public news feed's cache."""
+    try:
+        return news_service.get_feed_cache_statistics(subject)
+    except UserPermissionException as e:
+        raise HTTPException(status_code=403, detail=str(e))
@@ -93,7 +93,7 @@ def registered_user(
             auth_info = jwt.decode(
                 token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
             )
-            user = user_service.get(auth_info["pid"])
+            user = user_service.get_by_pid(auth_info["pid"])
             if user:
                 return user
         except:
@@ -0,0 +1,81 @@
+"""Conditional GET support for read endpoints.
+
+Responses carry validators of the resource they represent: a weak `ETag` and the
+`Last-Modified` date. Clients holding a copy of the response send them back through the
+`If-None-Match` and `If-Modified-Since` headers, and are answered with an empty
+304 Not Modified response while their copy is still current.
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+from ..models.cache_validator import CacheValidator
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def not_modified(
+    request: Request, response: Response, validator: CacheValidator
+) -> Response | None:
+    """Check whether the client's copy of a resource is current.
+
+    The validator headers are added to `response`, so that they accompany the resource
+    when the client's copy is outdated. Clients are asked to revalidate their copy
+    before every reuse.
+
+    Args:
+        request: the request, possibly conditional, for the resource.
+        response: the response whose headers the resource is returned with.
+        validator: the current version of the resource.
+
+    Returns:
+        Response | None: a 304 Not Modified response if the client's copy is current,
+            otherwise None.
+    """
+    headers = {"ETag": validator.etag, "Cache-Control": "no-cache"}
+    last_modified = None
+    if validator.last_modified is not None:
+        # Naive timestamps are stored in the server's local time
+        last_modified = validator.last_modified.astimezone(timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    # If-Modified-Since is only considered when If-None-Match is absent, since the
+    # latest modification alone does not reflect rows which were removed
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        current = _etag_matches(if_none_match, validator)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        current = (
+            if_modified_since is not None
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+
+    return Response(status_code=304, headers=headers) if current else None
+
+
+def _etag_matches(if_none_match: str, validator: CacheValidator) -> bool:
+    """Weakly compare the entity tags of an `If-None-Match` header to the validator."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == f'"{validator.digest}"':
+            return True
+    return False
+
+
+def _not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Check an `If-Modified-Since` header, ignoring it when it is not a valid date."""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates are only precise to the second
+    return last_modified.replace(microsecond=0) <= since
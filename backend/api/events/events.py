@@ -2,7 +2,20 @@
 
 Event routes are used to create, retrieve, and update Events."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import csv
+import io
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timedelta
 from typing import Sequence
 from backend.models.public_user import PublicUser
@@ -15,8 +28,11 @@ from ...services.user import UserService
 from ...services.exceptions import ResourceNotFoundException, UserPermissionException
 from ...models.event import DraftEvent
 from ...models.event_details import EventDetails
+from ...models.event_registration import BulkEventRegistrationResult
+from ...models.registration_type import RegistrationType
 from ...models.coworking.time_range import TimeRange
 from ...api.authentication import registered_user
+from ..conditional_requests import not_modified
 from ...models.user import User
 
 __authors__ = [
@@ -45,8 +61,16 @@ def list_events(
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page: int = Query(default=0, ge=0),
+    page_size: int = Query(default=10, ge=1, le=100),
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
 ) -> Paginated[EventDetails]:
-    """List events in time range via standard backend pagination query parameters."""
+    """List events in time range via standard backend pagination query parameters.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    retrieves the neighboring page by cursor rather than by `page`."""
 
     pagination_params = EventPaginationParams(
         order_by=order_by,
@@ -54,20 +78,39 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page=page,
+        page_size=page_size,
+        after=after,
+        before=before,
+        include_total=include_total,
     )
-    return event_service.get_paginated_events(pagination_params, subject)
+    try:
+        return event_service.get_paginated_events(pagination_params, subject)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
 
 @api.get("/paginate/unauthenticated", tags=["Events"])
 def list_events_unauthenticated(
+    request: Request,
+    response: Response,
     event_service: EventService = Depends(),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    page: int = Query(default=0, ge=0),
+    page_size: int = Query(default=10, ge=1, le=100),
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
 ) -> Paginated[EventDetails]:
-    """List events in time range via standard backend pagination query parameters for unauthenticated users."""
+    """List events in time range via standard backend pagination query parameters for unauthenticated users.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    retrieves the neighboring page by cursor rather than by `page`. Conditional requests
+    for an unchanged listing are answered with 304 Not Modified."""
 
     pagination_params = EventPaginationParams(
         order_by=order_by,
@@ -75,8 +118,19 @@ def list_events_unauthenticated(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        page=page,
+        page_size=page_size,
+        after=after,
+        before=before,
+        include_total=include_total,
     )
-    return event_service.get_paginated_events(pagination_params)
+    try:
+        validator = event_service.get_paginated_events_validator(pagination_params)
+        if (unchanged := not_modified(request, response, validator)) is not None:
+            return unchanged
+        return event_service.get_paginated_events(pagination_params)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
 
 @api.get("", response_model=list[EventDetails], tags=["Events"])
@@ -172,14 +226,19 @@ def get_event_by_id(
 
 @api.get("/range/unauthenticated", response_model=list[EventDetails], tags=["Events"])
 def get_events_in_time_range_unauthenticated(
+    request: Request,
+    response: Response,
     start: datetime | None = None,
     end: datetime | None = None,
     event_service: EventService = Depends(),
 ) -> list[EventDetails]:
     """
-    Get all events in the time range for unauthenticated users
+    Get all events in the time range for unauthenticated users, answering conditional
+    requests for unchanged events with 304 Not Modified
 
     Args:
+        request: the request, possibly conditional
+        response: the response the events are returned with
         start (optional): a datetime object representing the start time of the range.
         end (optional): a datetime object representing the start time of the range.
         event_service: a valid EventService
@@ -191,6 +250,9 @@ def get_events_in_time_range_unauthenticated(
     end = datetime.now() + timedelta(days=365) if end is None else end
     time_range = TimeRange(start=start, end=end)
 
+    validator = event_service.get_events_in_time_range_validator(time_range)
+    if (unchanged := not_modified(request, response, validator)) is not None:
+        return unchanged
     return event_service.get_events_in_time_range(time_range)
 
 
@@ -201,14 +263,19 @@ def get_events_in_time_range_unauthenticated(
 )
 def get_events_by_organization_unauthenticated(
     slug: str,
+    request: Request,
+    response: Response,
     event_service: EventService = Depends(),
     organization_service: OrganizationService = Depends(),
 ) -> list[EventDetails]:
     """
-    Get all events from an organization for unauthenticated users
+    Get all events from an organization for unauthenticated users, answering
+    conditional requests for unchanged events with 304 Not Modified
 
     Args:
         slug: a valid str representing a unique Organization
+        request: the request, possibly conditional
+        response: the response the events are returned with
         event_service: a valid EventService
         organization_service: a valid OrganizationService
 
@@ -216,6 +283,9 @@ def get_events_by_organization_unauthenticated(
         list[EventDetails]: All `EventDetails`s in the `Event` database table from a specific organization
     """
     organization = organization_service.get_by_slug(slug)
+    validator = event_service.get_events_by_organization_validator(organization)
+    if (unchanged := not_modified(request, response, validator)) is not None:
+        return unchanged
     return event_service.get_events_by_organization(organization)
 
 
@@ -226,18 +296,27 @@ def get_events_by_organization_unauthenticated(
     tags=["Events"],
 )
 def get_event_by_id_unauthenticated(
-    id: int, event_service: EventService = Depends()
+    id: int,
+    request: Request,
+    response: Response,
+    event_service: EventService = Depends(),
 ) -> EventDetails:
     """
-    Get event with matching id for unauthenticated users
+    Get event with matching id for unauthenticated users, answering conditional
+    requests for an unchanged event with 304 Not Modified
 
     Args:
         id: an int representing a unique Event ID
+        request: the request, possibly conditional
+        response: the response the event is returned with
         event_service: a valid EventService
 
     Returns:
         EventDetails: a valid EventDetails model corresponding to the given event id
     """
+    validator = event_service.get_event_validator(id)
+    if (unchanged := not_modified(request, response, validator)) is not None:
+        return unchanged
     return event_service.get_by_id(id)
 
 
@@ -304,6 +383,7 @@ def delete_event(
 def register_for_event(
     event_id: int,
     user_id: int = -1,
+    waitlist: bool = False,
     subject: User = Depends(registered_user),
     event_service: EventService = Depends(),
     user_service: UserService = Depends(),
@@ -315,9 +395,15 @@ def register_for_event(
     logged in user's ID as the user_id. Another user's ID is expected when a
     user is being registered by an administrator.
 
+    If the event is full and the waitlist parameter is set, the user joins the
+    waitlist of the event rather than the request failing. Their position on the
+    waitlist is available from `GET /api/events/{event_id}/waitlist`, and they are
+    registered as soon as a seat is released to them.
+
     Args:
         event_id: an int representing a unique event ID
         user_id: (optional) an int representing the user being registered for an event
+        waitlist: (optional) whether to join the waitlist if the event is full
         subject: a valid User model representing the currently logged in User
         event_service: a valid EventService
 
@@ -330,7 +416,7 @@ def register_for_event(
         user = user_service.get_by_id(user_id)
 
     event: EventDetails = event_service.get_by_id(event_id, subject)
-    return event_service.register(subject, user, event)
+    return event_service.register(subject, user, event, waitlist)
 
 
 @api.get("/{event_id}/registration", tags=["Events"])
@@ -349,12 +435,48 @@ def get_event_registration_of_user(
     """
     event: EventDetails = event_service.get_by_id(event_id, subject)
     event_registration = event_service.get_registration(subject, subject, event)
-    if event_registration is None:
+    if (
+        event_registration is None
+        or event_registration.registration_type == RegistrationType.WAITLIST
+    ):
         raise ResourceNotFoundException("You are not registered for this event")
     else:
         return event_registration
 
 
+@api.get("/{event_id}/waitlist", tags=["Events"])
+def get_event_waitlist_position(
+    event_id: int,
+    user_id: int = -1,
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+    user_service: UserService = Depends(),
+) -> int:
+    """
+    Get the position of a user on the waitlist of an event, raise ResourceNotFound if not waiting.
+
+    Args:
+        event_id: the int identifier of an Event
+        user_id: (optional) the int identifier of the user waiting, defaulting to the subject
+        subject: the logged in user making the request
+        event_service: the backing service
+        user_service: UserService
+
+    Returns:
+        int: the position of the user, 1 being the next to be registered
+    """
+    if user_id == -1 and subject.id is not None:
+        user = subject
+    else:
+        user = user_service.get_by_id(user_id)
+
+    event: EventDetails = event_service.get_by_id(event_id, subject)
+    position = event_service.get_waitlist_position(subject, user, event)
+    if position is None:
+        raise ResourceNotFoundException("You are not on the waitlist for this event")
+    return position
+
+
 @api.get("/{event_id}/registrations", tags=["Events"])
 def get_event_registrations(
     event_id: int,
@@ -434,3 +556,89 @@ def get_registered_users_of_event(
         )
     except UserPermissionException as e:
         raise HTTPException(status_code=403, detail=str(e))
+
+
+@api.post("/{event_id}/registrations", tags=["Events"])
+def register_users_for_event(
+    event_id: int,
+    identifiers: list[int | str] = Body(),
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+) -> BulkEventRegistrationResult:
+    """
+    Register many users for an event at once, e.g. every student of a class.
+
+    Args:
+        event_id: an int representing a unique event ID
+        identifiers: a list of the onyens or PIDs of the users being registered
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        BulkEventRegistrationResult: the users registered, and those who were not
+    """
+    event: EventDetails = event_service.get_by_id(event_id, subject)
+    return event_service.register_many(
+        subject, event, [str(identifier) for identifier in identifiers]
+    )
+
+
+@api.post("/{event_id}/registrations/csv", tags=["Events"])
+def register_users_for_event_from_csv(
+    event_id: int,
+    file: UploadFile,
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+) -> BulkEventRegistrationResult:
+    """
+    Register the users listed by a CSV file for an event at once.
+
+    The first column of every row holds the onyen or PID of a user. A header row, whose
+    first column is `onyen` or `pid`, is skipped.
+
+    Args:
+        event_id: an int representing a unique event ID
+        file: the CSV file listing the users being registered
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        BulkEventRegistrationResult: the users registered, and those who were not
+    """
+    rows = csv.reader(io.TextIOWrapper(file.file, encoding="utf-8-sig"))
+    identifiers = [
+        row[0].strip()
+        for row in rows
+        if len(row) > 0
+        and row[0].strip() != ""
+        and row[0].strip().lower() not in ("onyen", "pid")
+    ]
+    event: EventDetails = event_service.get_by_id(event_id, subject)
+    return event_service.register_many(subject, event, identifiers)
+
+
+@api.get("/{event_id}/registrations/users/csv", tags=["Events"])
+def export_registered_users_of_event(
+    event_id: int,
+    subject: User = Depends(registered_user),
+    event_service: EventService = Depends(),
+) -> StreamingResponse:
+    """
+    Export every user registered for an event as a CSV file, without paginating.
+
+    Args:
+        event_id: an int representing a unique Event
+        subject: a valid User model representing the currently logged in User
+        event_service: a valid EventService
+
+    Returns:
+        StreamingResponse: the CSV file of registered users
+    """
+    event: EventDetails = event_service.get_by_id(event_id, subject)
+    return StreamingResponse(
+        event_service.export_registered_users_of_event(subject, event),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="event-{event_id}-registrations.csv"'
+        },
+    )
@@ -5,6 +5,7 @@ Production systems monitor these end points upon deployment, and at regular inte
 
 
 from fastapi import APIRouter, Depends
+from ..models.pool_statistics import PoolStatistics
 from ..services.health import HealthService
 
 
@@ -23,3 +24,9 @@ api = APIRouter(prefix="/api/health")
 @api.get("", tags=["System Health"])
 def health_check(health_svc: HealthService = Depends()) -> str:
     return health_svc.check()
+
+
+@api.get("/pool", tags=["System Health"])
+def pool_statistics(health_svc: HealthService = Depends()) -> list[PoolStatistics]:
+    """Report how many database connections of each pool are in use, and how long requests have waited for one."""
+    return health_svc.pool_statistics()
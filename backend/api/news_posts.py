@@ -2,9 +2,10 @@
 
 News Post routes are used to create, retrieve, update, and delete News Posts."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from backend.models.news_post_details import NewsPostDetails
+from backend.models.news_post_summary import NewsPostSummary
 from backend.models.pagination import EventPaginationParams, Paginated
 from backend.services.organization import OrganizationService
 from backend.services.user import UserService
@@ -12,8 +13,10 @@ from backend.services.user import UserService
 from ..models.news_post import NewsPost
 
 from ..services.news_post import NewsPostService
+from ..services.news_feed import NewsFeedService
 
 from ..api.authentication import registered_user
+from .conditional_requests import not_modified
 from ..models.user import User
 
 api = APIRouter(prefix="/api/news")
@@ -51,6 +54,45 @@ def get_posts_by_organization(
     organization = organization_service.get_by_slug(slug)
     return news_service.get_posts_by_organization(organization, subject)
 
+@api.get("/organization/{slug}/paginate", responses={404: {"model": None}}, tags=["News"])
+def list_posts_by_organization(
+    slug: str,
+    subject: User = Depends(registered_user),
+    news_service: NewsPostService = Depends(),
+    organization_service: OrganizationService = Depends(),
+    page_size: int = Query(default=10, ge=1, le=100),
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
+    fields: str = "details",
+) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+    """List an organization's published posts, newest first.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    retrieves the neighboring page. Passing `fields=summary` lists `NewsPostSummary`s,
+    which omit each post's main story."""
+    organization = organization_service.get_by_slug(slug)
+    pagination_params = EventPaginationParams(
+        page_size=page_size, after=after, before=before, include_total=include_total
+    )
+    try:
+        return news_service.get_paginated_posts_by_organization(
+            organization, pagination_params, fields == "summary", subject
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+@api.get("/organization/{slug}/count", responses={404: {"model": None}}, response_model=int, tags=["News"])
+def count_posts_by_organization(
+    slug: str,
+    subject: User = Depends(registered_user),
+    news_service: NewsPostService = Depends(),
+    organization_service: OrganizationService = Depends(),
+) -> int:
+    """Count an organization's published posts."""
+    organization = organization_service.get_by_slug(slug)
+    return news_service.count_posts_by_organization(organization)
+
 @api.get("/author/{id}", responses={404: {"model": None}}, response_model=list[NewsPostDetails], tags=["News"])
 def get_posts_by_author(
     id: int,
@@ -73,6 +115,34 @@ def get_posts_by_author(
     author = user_service.get_by_id(id)
     return news_service.get_posts_by_user(author, subject)
 
+@api.get("/author/{id}/paginate", responses={404: {"model": None}}, tags=["News"])
+def list_posts_by_author(
+    id: int,
+    subject: User = Depends(registered_user),
+    news_service: NewsPostService = Depends(),
+    user_service: UserService = Depends(),
+    page_size: int = Query(default=10, ge=1, le=100),
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
+    fields: str = "details",
+) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+    """List a user's published posts, newest first.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    retrieves the neighboring page. Passing `fields=summary` lists `NewsPostSummary`s,
+    which omit each post's main story."""
+    author = user_service.get_by_id(id)
+    pagination_params = EventPaginationParams(
+        page_size=page_size, after=after, before=before, include_total=include_total
+    )
+    try:
+        return news_service.get_paginated_posts_by_user(
+            author, subject, pagination_params, summary=fields == "summary"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
 @api.get("/author/drafts/{id}", responses={404: {"model": None}}, response_model=list[NewsPostDetails], tags=["News"])
 def get_drafts_by_author(
     id: int,
@@ -98,50 +168,163 @@ def get_drafts_by_author(
 
 @api.get("/paginate", tags=["News"])
 def list_posts(
+    request: Request,
+    response: Response,
     subject: User = Depends(registered_user),
     news_service: NewsPostService = Depends(),
+    page: int = 0,
+    page_size: int = 10,
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
-) -> Paginated[NewsPostDetails]:
-    """List posts in time range via standard backend pagination query parameters."""
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
+    fields: str = "details",
+) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+    """List posts in time range via standard backend pagination query parameters.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    paginates by cursor rather than by `page`. Ordering by `rank` lists the posts
+    most relevant to `filter` first. Passing `fields=summary` lists `NewsPostSummary`s,
+    which omit each post's main story.
+
+    Responses carry an `ETag` specific to the caller, since listed posts mark whether
+    the caller can update them, and conditional requests for an unchanged listing are
+    answered with 304 Not Modified."""
 
     pagination_params = EventPaginationParams(
+        page=page,
+        page_size=page_size,
         order_by=order_by,
         ascending=ascending,
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        after=after,
+        before=before,
+        include_total=include_total,
     )
-    return news_service.get_paginated_posts(pagination_params, subject)
+    try:
+        validator = news_service.get_published_validator(
+            pagination_params, subject
+        )
+        if (unchanged := not_modified(request, response, validator)) is not None:
+            return unchanged
+        return news_service.get_paginated_posts(
+            pagination_params, subject, summary=fields == "summary"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
 @api.get("/paginate/unauthenticated", tags=["News"])
 def list_posts_unauthenticated(
+    request: Request,
+    response: Response,
     news_service: NewsPostService = Depends(),
+    page: int = 0,
+    page_size: int = 10,
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
-) -> Paginated[NewsPostDetails]:
-    """List posts in time range via standard backend pagination query parameters."""
+    after: str = "",
+    before: str = "",
+    include_total: bool = True,
+    fields: str = "details",
+) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+    """List posts in time range via standard backend pagination query parameters.
+
+    Passing the `next_cursor` or `previous_cursor` of a page as `after` or `before`
+    paginates by cursor rather than by `page`. Ordering by `rank` lists the posts
+    most relevant to `filter` first. Passing `fields=summary` lists `NewsPostSummary`s,
+    which omit each post's main story.
+
+    Responses carry an `ETag` and `Last-Modified` date, and conditional requests for
+    an unchanged listing are answered with 304 Not Modified."""
 
     pagination_params = EventPaginationParams(
+        page=page,
+        page_size=page_size,
         order_by=order_by,
         ascending=ascending,
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        after=after,
+        before=before,
+        include_total=include_total,
     )
-    return news_service.get_paginated_posts(pagination_params)
+    try:
+        validator = news_service.get_published_validator(
+            pagination_params, summary=fields == "summary"
+        )
+        if (unchanged := not_modified(request, response, validator)) is not None:
+            return unchanged
+        return news_service.get_paginated_posts(
+            pagination_params, summary=fields == "summary"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@api.get(
+    "/published",
+    response_model=list[NewsPostDetails] | list[NewsPostSummary],
+    tags=["News"],
+)
+def get_published_posts(
+    request: Request,
+    response: Response,
+    news_service: NewsPostService = Depends(),
+    fields: str = "details",
+) -> list[NewsPostDetails] | list[NewsPostSummary]:
+    """List published posts, or their `NewsPostSummary`s when passed `fields=summary`.
+
+    Conditional requests for unchanged posts are answered with 304 Not Modified."""
+    validator = news_service.get_published_validator(summary=fields == "summary")
+    if (unchanged := not_modified(request, response, validator)) is not None:
+        return unchanged
+    return news_service.get_published(summary=fields == "summary")
 
 
-@api.get("/published", response_model=list[NewsPostDetails], tags=["News"])
-def get_published_posts(news_service: NewsPostService = Depends()) -> list[NewsPostDetails]:
+@api.get(
+    "/feed.xml",
+    response_class=Response,
+    responses={200: {"content": {"application/atom+xml": {}}}, 404: {"model": None}},
+    tags=["News"],
+)
+def get_atom_feed(
+    request: Request,
+    feed_service: NewsFeedService = Depends(),
+    limit: int = Query(default=20, ge=1, le=100),
+    organization: str = "",
+) -> Response:
+    """Syndicate the newest published posts, or those of the organization with the slug
+    `organization`, as an Atom feed."""
+    document = feed_service.atom(request.url.path, limit, organization)
+    return Response(content=document, media_type="application/atom+xml")
 
-    return news_service.get_published()
+
+@api.get(
+    "/feed.json",
+    response_class=Response,
+    responses={200: {"content": {"application/feed+json": {}}}, 404: {"model": None}},
+    tags=["News"],
+)
+def get_json_feed(
+    request: Request,
+    feed_service: NewsFeedService = Depends(),
+    limit: int = Query(default=20, ge=1, le=100),
+    organization: str = "",
+) -> Response:
+    """Syndicate the newest published posts, or those of the organization with the slug
+    `organization`, as a JSON Feed."""
+    document = feed_service.json_feed(request.url.path, limit, organization)
+    return Response(content=document, media_type="application/feed+json")
 
 
 @api.get("/incoming", response_model=list[NewsPostDetails], tags=["News"])
@@ -170,7 +353,16 @@ def get_drafts(news_service: NewsPostService = Depends(),
     response_model=NewsPostDetails,
     tags=["News"],
 )
-def get_post_by_slug(slug: str, news_service: NewsPostService = Depends()) -> NewsPostDetails:
+def get_post_by_slug(
+    slug: str,
+    request: Request,
+    response: Response,
+    news_service: NewsPostService = Depends(),
+) -> NewsPostDetails:
+    """Get a post, answering conditional requests for an unchanged post with 304 Not Modified."""
+    validator = news_service.get_post_validator(slug)
+    if (unchanged := not_modified(request, response, validator)) is not None:
+        return unchanged
     return news_service.get_by_slug(slug)
 
 
@@ -0,0 +1,82 @@
+"""Request metrics middleware.
+
+Records the latency of every request, along with the SQL statements it executed, in
+`request_metrics` under the path template of the route which served it. Requests which
+exceed the statement or latency budget are logged, so slow and chatty endpoints are
+noticed before they are reported.
+"""
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..services.metrics import RequestMetrics, request_metrics, track_queries
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+# Route label of requests not served by a route, such as those for static files
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording the latency and database use of HTTP requests."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        statement_budget: int,
+        latency_budget: float,
+        metrics: RequestMetrics = request_metrics,
+    ) -> None:
+        """
+        Args:
+            app: the application to record the requests of.
+            statement_budget: statements a request may execute before it is logged.
+            latency_budget: seconds a request may take before it is logged.
+            metrics: the registry to record requests in.
+        """
+        self.app = app
+        self.statement_budget = statement_budget
+        self.latency_budget = latency_budget
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                seconds = time.perf_counter() - start
+                # The router records the route it matched in the scope it was passed
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                self.metrics.record(scope["method"], route, seconds, queries)
+                if (
+                    queries.statements > self.statement_budget
+                    or seconds > self.latency_budget
+                ):
+                    logger.warning(
+                        "%s %s responded %d in %.0f ms after %d statements taking %.0f ms",
+                        scope["method"],
+                        scope["path"],
+                        status,
+                        seconds * 1000,
+                        queries.statements,
+                        queries.seconds * 1000,
+                    )
@@ -17,6 +17,7 @@ from .user_entity import UserEntity
 from .role_entity import RoleEntity
 from .room_entity import RoomEntity
 from .permission_entity import PermissionEntity
+from .permission_version_entity import PermissionVersionEntity
 from .user_role_table import user_role_table
 from .organization_entity import OrganizationEntity
 from .event_entity import EventEntity
@@ -24,6 +25,7 @@ from .event_registration_entity import EventRegistrationEntity
 from .application_entity import ApplicationEntity
 from .section_application_table import section_application_table
 from .news_post_entity import NewsPostEntity
+from .news_post_slug_entity import NewsPostSlugEntity
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
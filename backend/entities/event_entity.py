@@ -1,12 +1,13 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Events."""
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..models.event_details import EventDetails
 from .entity_base import EntityBase
 from typing import Self
 from ..models.event import DraftEvent, Event
 from ..models.registration_type import RegistrationType
+from ..models.public_user import PublicUser
 from ..models.user import User
 
 from datetime import datetime
@@ -21,6 +22,18 @@ class EventEntity(EntityBase):
 
     # Name for the events table in the PostgreSQL database
     __tablename__ = "event"
+    __table_args__ = (
+        # Backs time range filters and keyset pagination of events, ordered by `(time, id)`
+        Index("event__time_idx", "time", "id", unique=False),
+        # Backs listing an organization's events in time order
+        Index(
+            "event__organization_time_idx",
+            "organization_id",
+            "time",
+            "id",
+            unique=False,
+        ),
+    )
 
     # Event properties (columns in the database table)
 
@@ -38,6 +51,16 @@ class EventEntity(EntityBase):
     public: Mapped[bool] = mapped_column(Boolean)
     # Maximim number of people who can register for the event
     registration_limit: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Number of people registered to attend the event
+    # NOTE: Maintained by `EventService` as attendees register and unregister, so that
+    # capacity is enforced by a single conditional UPDATE of this row.
+    registration_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Time the event was last modified
+    modification_date: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.now, onupdate=datetime.now
+    )
 
     # Organization hosting the event
     # NOTE: This defines a one-to-many relationship between the organization and events tables.
@@ -98,13 +121,12 @@ class EventEntity(EntityBase):
         Returns:
             Event: `Event` object from the entity
         """
-        attendees = [
-            registration.to_flat_model()
-            for registration in self.registrations
-            if registration.registration_type == RegistrationType.ATTENDEE
-        ]
         is_attendee = (
-            len([attendee for attendee in attendees if attendee.id == subject.id]) > 0
+            any(
+                registration.user_id == subject.id
+                and registration.registration_type == RegistrationType.ATTENDEE
+                for registration in self.registrations
+            )
             if subject is not None
             else False
         )
@@ -123,6 +145,27 @@ class EventEntity(EntityBase):
             else False
         )
 
+        return self.to_summarized_model(
+            registration_count=self.registration_count,
+            is_attendee=is_attendee,
+            is_organizer=is_organizer,
+            organizers=organizers,
+        )
+
+    def to_summarized_model(
+        self,
+        registration_count: int,
+        is_attendee: bool,
+        is_organizer: bool,
+        organizers: list[PublicUser],
+    ) -> Event:
+        """
+        Converts a `EventEntity` object into a `Event` model object, given a summary of
+        its registrations computed without loading every registration of the event
+
+        Returns:
+            Event: `Event` object from the entity
+        """
         return Event(
             id=self.id,
             name=self.name,
@@ -132,7 +175,7 @@ class EventEntity(EntityBase):
             public=self.public,
             registration_limit=self.registration_limit,
             organization_id=self.organization_id,
-            registration_count=len(attendees),
+            registration_count=registration_count,
             is_attendee=is_attendee,
             is_organizer=is_organizer,
             organizers=organizers,
@@ -145,8 +188,15 @@ class EventEntity(EntityBase):
             EventDetails: An EventDetails model for API usage.
         """
 
-        event = self.to_model(subject)
+        return self.to_summarized_details_model(self.to_model(subject))
+
+    def to_summarized_details_model(self, event: Event) -> EventDetails:
+        """Create a EventDetails model from an EventEntity, given its `Event` model
+        summarizing its registrations.
 
+        Returns:
+            EventDetails: An EventDetails model for API usage.
+        """
         return EventDetails(
             id=self.id,
             name=self.name,
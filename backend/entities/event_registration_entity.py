@@ -1,6 +1,8 @@
 """Definition of SQLAlchemy table-backed object mapping entity for Event Registrations."""
 
-from sqlalchemy import ForeignKey
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.entities.event_entity import EventEntity
@@ -47,6 +49,11 @@ class EventRegistrationEntity(EntityBase):
         SQLAlchemyEnum(RegistrationType)
     )
 
+    # Time the user registered, ordering the waitlist of the event first come first served
+    registered_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.clock_timestamp()
+    )
+
     @classmethod
     def from_model(cls, model: EventRegistration) -> Self:
         """
@@ -1,25 +1,69 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Boolean
+from sqlalchemy import ColumnElement, event, func, select, text, update
+from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR, to_tsvector
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 from .entity_base import EntityBase
-from typing import Self
+from .organization_entity import OrganizationEntity
+from .user_entity import UserEntity
+from typing import Any, Self
 from ..models.news_post import NewsPost
 from ..models.news_post_details import NewsPostDetails
+from ..models.news_post_summary import NewsPostSummary
+from ..models.news_post_state import NewsPostState
 
 
 class NewsPostEntity(EntityBase):
 
     __tablename__ = "news_post"
+    __table_args__ = (
+        # Backs keyset pagination of the news feed, ordered by `(time, id)` within a state
+        Index("news_post__state_time_idx", "state", "time", "id", unique=False),
+        # Back keyset pagination of an organization's and an author's posts
+        Index(
+            "news_post__organization_state_time_idx",
+            "organization_id",
+            "state",
+            "time",
+            "id",
+            unique=False,
+        ),
+        Index(
+            "news_post__author_state_time_idx",
+            "author_id",
+            "state",
+            "time",
+            "id",
+            unique=False,
+        ),
+        # Backs full-text search of the news feed
+        Index("news_post__search_idx", "search_vector", postgresql_using="gin"),
+        # Backs the scheduler's search for posts due to be published
+        Index(
+            "news_post__publish_at_idx",
+            "publish_at",
+            postgresql_where=text("publish_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     headline: Mapped[str] = mapped_column(String, nullable=False, default="")
     main_story: Mapped[str] = mapped_column(String, nullable=False, default="")
-    state: Mapped[str] = mapped_column(String)
+    state: Mapped[NewsPostState] = mapped_column(
+        SQLAlchemyEnum(
+            NewsPostState, values_callable=lambda states: [state.value for state in states]
+        ),
+        nullable=False,
+        default=NewsPostState.DRAFT,
+    )
     slug: Mapped[str] = mapped_column(String, unique=True)
     image_url: Mapped[str] = mapped_column(String, nullable=True)
     time: Mapped[datetime] = mapped_column(DateTime)
     modification_date: Mapped[datetime] = mapped_column(DateTime)
     synopsis: Mapped[str] = mapped_column(String)
+    # Time the post is scheduled to be published, if it is scheduled
+    publish_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # NOTE: This defines a one-to-many relationship between the user and news post tables.
     author_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
@@ -29,6 +73,37 @@ class NewsPostEntity(EntityBase):
     organization_id: Mapped[int] = mapped_column(ForeignKey("organization.id"), nullable=True)
     organization: Mapped["OrganizationEntity"] = relationship(back_populates="posts")
 
+    # Full-text search document of the post, maintained on every insert and update.
+    # NOTE: The organization and author names are denormalized into the document, so
+    # renaming either must call `NewsPostEntity.refresh_search_vectors`.
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
+    @classmethod
+    def search_document(cls) -> ColumnElement:
+        """
+        Builds the weighted `tsvector` expression indexed for full-text search of each post.
+
+        Returns:
+            ColumnElement: SQL expression producing a post's search document from its row
+        """
+        return _search_document(
+            cls.headline, cls.synopsis, cls.main_story, cls.organization_id, cls.author_id
+        )
+
+    @classmethod
+    def refresh_search_vectors(cls, session: Session, *criteria: Any) -> None:
+        """
+        Recomputes the search documents of all posts matching the criteria.
+
+        Parameters:
+            session (Session): Session to execute the update in (not committed)
+            criteria: Filters selecting the posts to refresh
+        """
+        session.execute(
+            update(cls).where(*criteria).values(search_vector=cls.search_document()),
+            execution_options={"synchronize_session": False},
+        )
+
     @classmethod
     def from_model(cls, model: NewsPost) -> Self:
         return cls(
@@ -43,6 +118,7 @@ class NewsPostEntity(EntityBase):
             time=model.time,
             modification_date=model.modification_date,
             synopsis=model.synopsis,
+            publish_at=model.publish_at,
         )
 
     def to_model(self) -> NewsPost:
@@ -58,6 +134,7 @@ class NewsPostEntity(EntityBase):
             time=self.time,
             modification_date=self.modification_date,
             synopsis=self.synopsis,
+            publish_at=self.publish_at,
         )
 
     def to_details_model(self) -> NewsPostDetails:
@@ -74,5 +151,72 @@ class NewsPostEntity(EntityBase):
             image_url=self.image_url,
             time=self.time,
             modification_date=self.modification_date,
-            synopsis=self.synopsis
+            synopsis=self.synopsis,
+            publish_at=self.publish_at,
         )
+
+    def to_summary_model(self) -> NewsPostSummary:
+        return NewsPostSummary(
+            id=self.id,
+            headline=self.headline,
+            slug=self.slug,
+            author_id=self.author_id,
+            author=self.author.to_model(),
+            organization_id=self.organization_id,
+            organization=self.organization.to_model() if self.organization else None,
+            state=self.state,
+            image_url=self.image_url,
+            time=self.time,
+            modification_date=self.modification_date,
+            synopsis=self.synopsis,
+            publish_at=self.publish_at,
+        )
+
+
+def _search_document(
+    headline: Any,
+    synopsis: Any,
+    main_story: Any,
+    organization_id: Any,
+    author_id: Any,
+) -> ColumnElement:
+    """
+    Builds a post's search document from either its columns or in-memory values.
+
+    Headlines weigh most, followed by synopses along with organization and author
+    names, and finally the main story.
+    """
+    organization = (
+        select(func.concat_ws(" ", OrganizationEntity.name, OrganizationEntity.slug))
+        .where(OrganizationEntity.id == organization_id)
+        .scalar_subquery()
+    )
+    author = (
+        select(func.concat_ws(" ", UserEntity.first_name, UserEntity.last_name))
+        .where(UserEntity.id == author_id)
+        .scalar_subquery()
+    )
+
+    def weighted(text: Any, weight: str) -> ColumnElement:
+        return func.setweight(to_tsvector("english", func.coalesce(text, "")), weight)
+
+    return (
+        weighted(headline, "A")
+        .op("||")(weighted(synopsis, "B"))
+        .op("||")(weighted(organization, "B"))
+        .op("||")(weighted(author, "B"))
+        .op("||")(weighted(main_story, "C"))
+    )
+
+
+@event.listens_for(NewsPostEntity, "before_insert")
+@event.listens_for(NewsPostEntity, "before_update")
+def _maintain_search_vector(mapper, connection, target: NewsPostEntity) -> None:
+    """Embeds the recomputed search document into the flushed INSERT or UPDATE."""
+    target.search_vector = _search_document(
+        target.headline,
+        target.synopsis,
+        target.main_story,
+        target.organization_id,
+        target.author_id,
+    )
@@ -0,0 +1,50 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for News Post Slugs."""
+
+from sqlalchemy import Integer, String
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from .entity_base import EntityBase
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class NewsPostSlugEntity(EntityBase):
+    """Serves as the database model schema counting how many posts requested each slug"""
+
+    # Name for the news post slug table in the PostgreSQL database
+    __tablename__ = "news_post_slug"
+
+    # Slug requested for a post, before any suffix was appended to make it unique
+    slug: Mapped[str] = mapped_column(String, primary_key=True)
+    # Number of posts which have requested the slug
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    @classmethod
+    def allocate(cls, session: Session, slug: str) -> str:
+        """
+        Reserve a unique slug derived from `slug` in a single statement.
+
+        The first post requesting a slug is given the slug itself, while the Nth is
+        given `slug-N`. Concurrent transactions requesting the same slug queue on its
+        row, so each is counted exactly once, and the row lock is held until the
+        reserving transaction ends so a rolled back reservation is reused.
+
+        Args:
+            session: the session whose transaction reserves the slug.
+            slug: the requested slug.
+
+        Returns:
+            str: the reserved slug.
+        """
+        statement = (
+            insert(cls)
+            .values(slug=slug, count=1)
+            .on_conflict_do_update(
+                index_elements=[cls.slug], set_={"count": cls.count + 1}
+            )
+            .returning(cls.count)
+        )
+        count = session.execute(statement).scalar_one()
+        return slug if count == 1 else f"{slug}-{count}"
@@ -0,0 +1,46 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for the Permission Version."""
+
+from sqlalchemy import Integer, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from .entity_base import EntityBase
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class PermissionVersionEntity(EntityBase):
+    """Serves as the database model schema of the single row versioning all permissions.
+
+    The version is incremented by every transaction changing which permissions users
+    hold, directly or through their roles, so that each process of the application can
+    tell whether the permissions it cached are current."""
+
+    # Name for the permission version table in the PostgreSQL database
+    __tablename__ = "permission_version"
+
+    # The table holds a single row, whose id is always `ROW_ID`
+    ROW_ID = 1
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=ROW_ID)
+    # Number of changes made to permissions
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    @classmethod
+    def current(cls, session: Session) -> int:
+        """Read the current version of permissions, which is 0 if never incremented."""
+        version = session.scalar(select(cls.version).where(cls.id == cls.ROW_ID))
+        return version or 0
+
+    @classmethod
+    def increment(cls, session: Session) -> None:
+        """Increment the version of permissions in the session's transaction."""
+        statement = (
+            insert(cls)
+            .values(id=cls.ROW_ID, version=1)
+            .on_conflict_do_update(
+                index_elements=[cls.id], set_={"version": cls.version + 1}
+            )
+        )
+        session.execute(statement)
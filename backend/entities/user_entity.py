@@ -8,7 +8,7 @@ from backend.entities.academics.section_member_entity import SectionMemberEntity
 from backend.models.academics.section_member import SectionMember
 from .entity_base import EntityBase
 from .user_role_table import user_role_table
-from ..models import User
+from ..models import PublicUser, User
 
 __authors__ = ["Kris Jordan", "Matt Vu"]
 __copyright__ = "Copyright 2023 - 2024"
@@ -120,6 +120,22 @@ class UserEntity(EntityBase):
             accepted_community_agreement=self.accepted_community_agreement,
         )
 
+    def to_public_model(self) -> PublicUser:
+        """
+        Create a PublicUser model from a UserEntity.
+
+        Returns:
+            PublicUser: A PublicUser model for API usage.
+        """
+        return PublicUser(
+            id=self.id,
+            first_name=self.first_name,
+            last_name=self.last_name,
+            pronouns=self.pronouns,
+            email=self.email,
+            github_avatar=self.github_avatar,
+        )
+
     def update(self, model: User) -> None:
         """
         Update a UserEntity from a User model.
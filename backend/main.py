@@ -1,5 +1,6 @@
 """Entrypoint of backend API exposing the FastAPI `app` to be served by an application server such as uvicorn."""
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
@@ -25,11 +26,18 @@ from .api.academics import term, course, section
 from .api.admin import users as admin_users
 from .api.admin import roles as admin_roles
 from .api.admin import news as admin_posts
+from .api.admin import metrics as admin_metrics
+from .api.request_metrics import RequestMetricsMiddleware
 from .services.exceptions import (
     EventRegistrationException,
     UserPermissionException,
     ResourceNotFoundException,
 )
+from .services.news_post_scheduler import NewsPostScheduler
+from .services.event_registration_reconciler import EventRegistrationReconciler
+from .services.metrics import instrument_engine
+from .database import Session, engine, replica_engine
+from .env import getenv
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -39,8 +47,22 @@ description = """
 Welcome to the UNC Computer Science **Experience Labs** RESTful Application Programming Interface.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background workers for as long as the application is served."""
+    news_post_scheduler = NewsPostScheduler(lambda: Session(engine))
+    news_post_scheduler.start()
+    registration_reconciler = EventRegistrationReconciler(lambda: Session(engine))
+    registration_reconciler.start()
+    yield
+    registration_reconciler.stop()
+    news_post_scheduler.stop()
+
+
 # Metadata to improve the usefulness of OpenAPI Docs /docs API Explorer
 app = FastAPI(
+    lifespan=lifespan,
     title="UNC CS Experience Labs API",
     version="0.0.1",
     description=description,
@@ -57,6 +79,7 @@ app = FastAPI(
         admin_users.openapi_tags,
         admin_roles.openapi_tags,
         admin_posts.openapi_tags,
+        admin_metrics.openapi_tags,
         news_posts.openapi_tags
     ],
 )
@@ -64,6 +87,16 @@ app = FastAPI(
 # Use GZip middleware for compressing HTML responses over the network
 app.add_middleware(GZipMiddleware)
 
+# Record the latency and SQL statements of every request, logging those over budget
+for instrumented_engine in (engine, replica_engine):
+    if instrumented_engine is not None:
+        instrument_engine(instrumented_engine)
+app.add_middleware(
+    RequestMetricsMiddleware,
+    statement_budget=int(getenv("METRICS_STATEMENT_BUDGET", "25")),
+    latency_budget=float(getenv("METRICS_LATENCY_BUDGET_MS", "1000")) / 1000,
+)
+
 # Plugging in each of the router APIs
 feature_apis = [
     status,
@@ -84,7 +117,8 @@ feature_apis = [
     room,
     application,
     news_posts,
-    admin_posts
+    admin_posts,
+    admin_metrics,
 ]
 
 for feature_api in feature_apis:
@@ -0,0 +1,55 @@
+"""Create the news_post table where it is missing
+
+The `news_post` table was introduced without a migration, so deployments created their
+schema with it from the entities. It is only created here for databases built solely
+from migrations, which lack it.
+
+Revision ID: 3f1d9a7c5e20
+Revises: 92214831537d
+Create Date: 2026-10-18 09:10:02.571846
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f1d9a7c5e20"
+down_revision = "92214831537d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if sa.inspect(op.get_bind()).has_table("news_post"):
+        return
+    op.create_table(
+        "news_post",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("headline", sa.String(), nullable=False),
+        sa.Column("main_story", sa.String(), nullable=False),
+        sa.Column("state", sa.String(), nullable=True),
+        sa.Column("slug", sa.String(), nullable=True),
+        sa.Column("image_url", sa.String(), nullable=True),
+        sa.Column("time", sa.DateTime(), nullable=True),
+        sa.Column("modification_date", sa.DateTime(), nullable=True),
+        sa.Column("synopsis", sa.String(), nullable=True),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["author_id"],
+            ["user.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organization.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("slug"),
+    )
+
+
+def downgrade() -> None:
+    # The table predates migrations on existing deployments, so it is not dropped
+    pass
@@ -0,0 +1,45 @@
+"""Count the registrations of events on the event
+
+Revision ID: a4c1e9d27b53
+Revises: d9a5b3f17c42
+Create Date: 2026-10-18 17:12:48.204115
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "a4c1e9d27b53"
+down_revision = "d9a5b3f17c42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column(
+            "registration_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+    op.execute(
+        text(
+            """
+            UPDATE event SET registration_count = (
+                SELECT count(*) FROM event_registration
+                WHERE event_registration.event_id = event.id
+                AND event_registration.registration_type = 'ATTENDEE'
+            )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("event", "registration_count")
@@ -0,0 +1,70 @@
+"""Schedule news posts and convert their state to an enum
+
+Revision ID: a6d3f2c91b48
+Revises: e5b92c4f1a07
+Create Date: 2026-10-18 13:05:52.771934
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "a6d3f2c91b48"
+down_revision = "e5b92c4f1a07"
+branch_labels = None
+depends_on = None
+
+news_post_state = postgresql.ENUM(
+    "draft", "incoming", "published", "archived", name="newspoststate"
+)
+
+
+def upgrade() -> None:
+    news_post_state.create(op.get_bind())
+    # States were free-form strings matched regardless of case, so they are normalized,
+    # and posts in an unknown state are hidden as drafts
+    op.execute(
+        text(
+            """
+            UPDATE news_post SET state = CASE
+                WHEN lower(trim(state)) IN ('draft', 'incoming', 'published', 'archived')
+                THEN lower(trim(state))
+                ELSE 'draft'
+            END
+            """
+        )
+    )
+    op.alter_column(
+        "news_post",
+        "state",
+        type_=news_post_state,
+        existing_type=sa.String(),
+        nullable=False,
+        postgresql_using="state::newspoststate",
+    )
+    op.add_column("news_post", sa.Column("publish_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "news_post__publish_at_idx",
+        "news_post",
+        ["publish_at"],
+        unique=False,
+        postgresql_where=sa.text("publish_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("news_post__publish_at_idx", table_name="news_post")
+    op.drop_column("news_post", "publish_at")
+    op.alter_column(
+        "news_post",
+        "state",
+        type_=sa.String(),
+        existing_type=news_post_state,
+        nullable=True,
+        postgresql_using="state::text",
+    )
+    news_post_state.drop(op.get_bind())
@@ -0,0 +1,48 @@
+"""Add waitlists to events
+
+Revision ID: b7e3d5f0a918
+Revises: a4c1e9d27b53
+Create Date: 2026-10-18 18:05:33.917246
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "b7e3d5f0a918"
+down_revision = "a4c1e9d27b53"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(text("ALTER TYPE registrationtype ADD VALUE 'WAITLIST'"))
+    op.add_column(
+        "event_registration",
+        sa.Column(
+            "registered_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("clock_timestamp()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("event_registration", "registered_at")
+    # Values cannot be dropped from a PostgreSQL enum, so the type is recreated without it
+    op.execute(
+        text("DELETE FROM event_registration WHERE registration_type = 'WAITLIST'")
+    )
+    op.execute(text("ALTER TYPE registrationtype RENAME TO registrationtype_old"))
+    op.execute(text("CREATE TYPE registrationtype AS ENUM ('ATTENDEE', 'ORGANIZER')"))
+    op.execute(
+        text(
+            "ALTER TABLE event_registration ALTER COLUMN registration_type "
+            "TYPE registrationtype USING registration_type::text::registrationtype"
+        )
+    )
+    op.execute(text("DROP TYPE registrationtype_old"))
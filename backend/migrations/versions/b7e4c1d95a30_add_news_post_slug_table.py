@@ -0,0 +1,41 @@
+"""Count the posts requesting each news post slug
+
+Revision ID: b7e4c1d95a30
+Revises: a6d3f2c91b48
+Create Date: 2026-10-18 14:21:37.402816
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "b7e4c1d95a30"
+down_revision = "a6d3f2c91b48"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "news_post_slug",
+        sa.Column("slug", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("slug"),
+    )
+    # Existing slugs have been requested once. Suffixes already taken by other posts
+    # are skipped when they are next reserved.
+    op.execute(
+        text(
+            """
+            INSERT INTO news_post_slug (slug, count)
+            SELECT slug, 1 FROM news_post WHERE slug IS NOT NULL
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("news_post_slug")
@@ -0,0 +1,36 @@
+"""Index news posts by organization and author for keyset pagination
+
+Revision ID: c2f8a4e6d713
+Revises: b7e4c1d95a30
+Create Date: 2026-10-18 14:58:09.116342
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c2f8a4e6d713"
+down_revision = "b7e4c1d95a30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "news_post__organization_state_time_idx",
+        "news_post",
+        ["organization_id", "state", "time", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "news_post__author_state_time_idx",
+        "news_post",
+        ["author_id", "state", "time", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("news_post__author_state_time_idx", table_name="news_post")
+    op.drop_index("news_post__organization_state_time_idx", table_name="news_post")
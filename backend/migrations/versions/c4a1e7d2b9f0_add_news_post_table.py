@@ -0,0 +1,29 @@
+"""Index news posts for keyset pagination of the feed
+
+Revision ID: c4a1e7d2b9f0
+Revises: 3f1d9a7c5e20
+Create Date: 2026-10-18 09:12:40.218114
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c4a1e7d2b9f0"
+down_revision = "3f1d9a7c5e20"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "news_post__state_time_idx",
+        "news_post",
+        ["state", "time", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("news_post__state_time_idx", table_name="news_post")
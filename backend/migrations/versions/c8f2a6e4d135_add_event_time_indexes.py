@@ -0,0 +1,31 @@
+"""Index events by time and organization for range filters and keyset pagination
+
+Revision ID: c8f2a6e4d135
+Revises: b7e3d5f0a918
+Create Date: 2026-10-18 19:21:40.662385
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "c8f2a6e4d135"
+down_revision = "b7e3d5f0a918"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("event__time_idx", "event", ["time", "id"], unique=False)
+    op.create_index(
+        "event__organization_time_idx",
+        "event",
+        ["organization_id", "time", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("event__organization_time_idx", table_name="event")
+    op.drop_index("event__time_idx", table_name="event")
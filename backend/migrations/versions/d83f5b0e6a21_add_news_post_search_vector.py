@@ -0,0 +1,57 @@
+"""Add full-text search vector to news posts
+
+Revision ID: d83f5b0e6a21
+Revises: c4a1e7d2b9f0
+Create Date: 2026-10-18 10:02:17.540932
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "d83f5b0e6a21"
+down_revision = "c4a1e7d2b9f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "news_post",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    # Backfill search documents of existing posts, mirroring NewsPostEntity.search_document
+    op.execute(
+        text(
+            """
+            UPDATE news_post SET search_vector =
+                setweight(to_tsvector('english', coalesce(headline, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(synopsis, '')), 'B') ||
+                setweight(to_tsvector('english', coalesce((
+                    SELECT concat_ws(' ', organization.name, organization.slug)
+                    FROM organization WHERE organization.id = news_post.organization_id
+                ), '')), 'B') ||
+                setweight(to_tsvector('english', coalesce((
+                    SELECT concat_ws(' ', "user".first_name, "user".last_name)
+                    FROM "user" WHERE "user".id = news_post.author_id
+                ), '')), 'B') ||
+                setweight(to_tsvector('english', coalesce(main_story, '')), 'C')
+            """
+        )
+    )
+    op.create_index(
+        "news_post__search_idx",
+        "news_post",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("news_post__search_idx", table_name="news_post")
+    op.drop_column("news_post", "search_vector")
@@ -0,0 +1,32 @@
+"""Version permissions for caching them across processes
+
+Revision ID: d9a5b3f17c42
+Revises: c2f8a4e6d713
+Create Date: 2026-10-18 15:40:26.583019
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+
+# revision identifiers, used by Alembic.
+revision = "d9a5b3f17c42"
+down_revision = "c2f8a4e6d713"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "permission_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(text("INSERT INTO permission_version (id, version) VALUES (1, 0)"))
+
+
+def downgrade() -> None:
+    op.drop_table("permission_version")
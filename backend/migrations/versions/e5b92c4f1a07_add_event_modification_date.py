@@ -0,0 +1,33 @@
+"""Add modification date to events
+
+Revision ID: e5b92c4f1a07
+Revises: d83f5b0e6a21
+Create Date: 2026-10-18 11:47:05.318620
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5b92c4f1a07"
+down_revision = "d83f5b0e6a21"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event",
+        sa.Column(
+            "modification_date",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("event", "modification_date")
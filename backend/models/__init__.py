@@ -26,12 +26,17 @@ from .event_details import EventDetails
 from .room import Room
 from .room_details import RoomDetails
 from .event_registration import (
+    BulkEventRegistrationResult,
     EventRegistration,
     NewEventRegistration,
 )
 from .registration_type import RegistrationType
+from .news_post_state import NewsPostState
 from .news_post import NewsPost
 from .news_post_details import NewsPostDetails
+from .news_post_summary import NewsPostSummary
+from .cache_statistics import CacheStatistics
+from .pool_statistics import PoolStatistics
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
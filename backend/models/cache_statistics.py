@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class CacheStatistics(BaseModel):
+    """
+    Pydantic model to represent the effectiveness of an in-process cache.
+
+    Hits are lookups answered without touching the database, while misses had to
+    load the value from the database.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    ttl: float
@@ -0,0 +1,24 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class CacheValidator(BaseModel):
+    """
+    Pydantic model to represent the version of a collection of rows, with which
+    clients holding a copy of a response can check whether it is still current.
+
+    The digest changes whenever a row of the collection is added, removed or
+    modified, while `last_modified` is the latest modification of any of its rows.
+    """
+
+    digest: str
+    last_modified: datetime | None = None
+
+    @property
+    def etag(self) -> str:
+        """Weak entity tag of the collection, as sent in the `ETag` header."""
+        return f'W/"{self.digest}"'
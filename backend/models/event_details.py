@@ -11,3 +11,5 @@ class EventDetails(Event):
     """
 
     organization: Organization
+    # Whether the subject may update the event, as an organizer or an administrator
+    can_update: bool = False
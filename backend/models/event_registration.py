@@ -2,6 +2,7 @@ from pydantic import BaseModel
 from .event import Event
 from .user import User
 from .registration_type import RegistrationType
+from .public_user import PublicUser
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2023"
@@ -33,3 +34,21 @@ class EventRegistration(NewEventRegistration):
 
     event: Event
     user: User
+
+
+class BulkEventRegistrationResult(BaseModel):
+    """
+    Pydantic model to represent the outcome of registering many users for an event at once.
+
+    Users are `registered` by the request unless they were `already_registered` for the
+    event (as attendees or organizers), or the event was full. Users of a full event
+    stay `waitlisted` if they were on its waitlist, and are otherwise `not_registered`.
+    Users on the waitlist are registered when seats are free. Onyens and PIDs matching
+    no user are listed as `unmatched`.
+    """
+
+    registered: list[PublicUser]
+    already_registered: list[PublicUser]
+    waitlisted: list[PublicUser]
+    not_registered: list[PublicUser]
+    unmatched: list[str]
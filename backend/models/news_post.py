@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel
 
+from .news_post_state import NewsPostState
+
 # from backend.test.services.news_post.news_post_demo_data import date_maker
 
 
@@ -24,9 +26,10 @@ class NewsPost(BaseModel):
     main_story: str
     author_id: int 
     organization_id: int | None = None
-    state: str
+    state: NewsPostState
     slug: str
     image_url: str | None = None
     time: datetime
     modification_date: datetime
-    synopsis: str | None = None
\ No newline at end of file
+    synopsis: str | None = None
+    publish_at: datetime | None = None
\ No newline at end of file
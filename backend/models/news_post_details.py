@@ -13,3 +13,5 @@ class NewsPostDetails(NewsPost):
 
     author: User | None = None
     organization: Organization | None = None
+    # Whether the subject may update the post, as its author or an administrator
+    can_update: bool = False
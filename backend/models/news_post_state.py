@@ -0,0 +1,30 @@
+"""Determines the state of a news post in its publication workflow."""
+
+from enum import Enum
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class NewsPostState(str, Enum):
+    """
+    Determines the state of a news post.
+
+    Authors write `DRAFT`s and submit them as `INCOMING` posts for review, which are
+    then `PUBLISHED` to the news feed and eventually `ARCHIVED`.
+    """
+
+    DRAFT = "draft"
+    INCOMING = "incoming"
+    PUBLISHED = "published"
+    ARCHIVED = "archived"
+
+    @classmethod
+    def _missing_(cls, value: object) -> "NewsPostState | None":
+        # States were once free-form strings matched regardless of case
+        if isinstance(value, str):
+            for state in cls:
+                if state.value == value.strip().lower():
+                    return state
+        return None
@@ -0,0 +1,35 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+from backend.models.news_post_state import NewsPostState
+from backend.models.organization import Organization
+from backend.models.user import User
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class NewsPostSummary(BaseModel):
+    """
+    Pydantic model to represent a `NewsPost` in listings of the news feed.
+
+    Unlike `NewsPostDetails`, this model omits the post's `main_story`, which
+    news feed cards do not display.
+    """
+
+    id: int
+    headline: str
+    author_id: int
+    author: User | None = None
+    organization_id: int | None = None
+    organization: Organization | None = None
+    state: NewsPostState
+    slug: str
+    image_url: str | None = None
+    time: datetime
+    modification_date: datetime
+    synopsis: str | None = None
+    publish_at: datetime | None = None
+    # Whether the subject may update the post, as its author or an administrator
+    can_update: bool = False
@@ -1,6 +1,10 @@
 """Models for paginating results via the API."""
 
-from typing import Generic, TypeVar
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Generic, Self, TypeVar
 from pydantic import BaseModel
 
 __authors__ = ["Kris Jordan"]
@@ -20,18 +24,60 @@ class PaginationParams(BaseModel):
 
 
 class EventPaginationParams(PaginationParams):
-    """Parameters passed from the client to paginate event results."""
+    """Parameters passed from the client to paginate event results.
+
+    When `after` or `before` holds a cursor returned in a previous page, results are
+    paginated by keyset rather than by `page` offset. Clients which do not need the
+    total number of results (e.g. infinite scroll) can set `include_total` to False
+    to skip counting every matching row."""
 
     order_by: str = ""
     ascending: str = "true"
     filter: str = ""
     range_start: str = ""
     range_end: str = ""
+    after: str = ""
+    before: str = ""
+    include_total: bool = True
+
+
+class PaginationCursor(BaseModel):
+    """Position of a row within a `(time, id)` ordered result set.
+
+    Cursors are handed to clients as opaque, URL-safe strings and should not be
+    constructed or parsed by clients."""
+
+    time: datetime
+    id: int
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque, URL-safe token."""
+        payload = json.dumps([self.time.isoformat(), self.id]).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Decode a token produced by `PaginationCursor.encode`.
+
+        Raises:
+            ValueError: If the token is not a valid cursor.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            time, id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(time=datetime.fromisoformat(time), id=int(id))
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError(f"Invalid pagination cursor: {token}")
 
 
 class Paginated(BaseModel, Generic[T]):
-    """Generic class for returning paginating results to the client."""
+    """Generic class for returning paginating results to the client.
+
+    `length` is None when the client opted out of counting results. `next_cursor` and
+    `previous_cursor` are only populated for keyset paginated results."""
 
     items: list[T]
-    length: int
+    length: int | None
     params: PaginationParams | EventPaginationParams
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class PoolStatistics(BaseModel):
+    """
+    Pydantic model to represent the utilization of a database connection pool, labeled
+    by the engine it pools connections for, such as "primary" or "replica".
+
+    `size` connections are kept open, and up to `max_overflow` more are opened under
+    load. Once every connection is checked out, checkouts wait up to `timeout` seconds
+    for a connection to be returned before timing out.
+    """
+
+    pool: str
+    size: int
+    max_overflow: int
+    timeout: float
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
@@ -14,3 +14,5 @@ class RegistrationType(Enum):
 
     ATTENDEE = 0
     ORGANIZER = 1
+    # Waiting, first come first served, for a seat at a full event
+    WAITLIST = 2
@@ -0,0 +1,162 @@
+"""
+This script compares the latency and throughput of the hottest read endpoints when
+served by sync handlers, which FastAPI runs on its worker threadpool, and by async
+handlers awaiting an asyncpg engine created by `create_async_engine`. Async reads run
+the same queries as sync reads, through `AsyncSession.run_sync`.
+
+Each read is issued by a number of concurrent clients, each issuing its requests one
+after another. Sync reads are dispatched to the threadpool exactly as FastAPI dispatches
+`def` handlers, so both paths contend for the same connection pool limits as in production.
+
+Usage: python3 -m backend.script.benchmark_async_reads [--clients 200] [--requests 10000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable
+
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import create_async_engine, engine
+from ..models import EventPaginationParams, User
+from ..services import EventService, NewsPostService, PermissionService, UserService
+from ..services.coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+    StatusService,
+)
+from ..services.news_post import news_feed_cache
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def sync_news_feed(session: Session, _subject: User | None) -> None:
+    NewsPostService(session, PermissionService(session)).get_paginated_posts(
+        EventPaginationParams()
+    )
+
+
+def sync_events(session: Session, _subject: User | None) -> None:
+    permission = PermissionService(session)
+    EventService(
+        session, permission, UserService(session, permission)
+    ).get_paginated_events(EventPaginationParams(order_by="time"))
+
+
+def sync_status(session: Session, subject: User | None) -> None:
+    permission = PermissionService(session)
+    policies = PolicyService()
+    operating_hours = OperatingHoursService(session, permission)
+    seats = SeatService(session)
+    reservations = ReservationService(
+        session, permission, policies, operating_hours, seats
+    )
+    StatusService(policies, operating_hours, seats, reservations).get_coworking_status(
+        subject
+    )
+
+
+READS: dict[str, Callable[[Session, User | None], None]] = {
+    "news feed pagination": sync_news_feed,
+    "event pagination": sync_events,
+    "coworking status": sync_status,
+}
+
+
+async def run_sync(read: Callable[[Session, User | None], None], subject, cache):
+    def request():
+        if not cache:
+            news_feed_cache.clear()
+        with Session(engine) as session:
+            read(session, subject)
+
+    await anyio.to_thread.run_sync(request)
+
+
+async def run_async(
+    async_engine: AsyncEngine,
+    read: Callable[[Session, User | None], None],
+    subject,
+    cache,
+):
+    if not cache:
+        news_feed_cache.clear()
+    async with AsyncSession(async_engine) as session:
+        await session.run_sync(read, subject)
+
+
+async def benchmark(
+    request: Callable[[], Awaitable[None]], clients: int, requests: int
+) -> str:
+    """Issue `requests` requests from `clients` concurrent clients and summarize their latency."""
+    latencies: list[float] = []
+    remaining = requests
+
+    async def client():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return (
+        f"p50 {quantiles[49] * 1000:8.1f} ms  "
+        f"p99 {quantiles[98] * 1000:8.1f} ms  "
+        f"{len(latencies) / elapsed:8.1f} requests/sec"
+    )
+
+
+async def main(clients: int, requests: int, pid: int, cache: bool):
+    with Session(engine) as session:
+        subject = UserService(session, PermissionService(session)).get_by_pid(pid)
+    async_engine = create_async_engine()
+    for name, read in READS.items():
+        if name == "coworking status" and subject is None:
+            print(f"Skipping {name}: no user has PID {pid}")
+            continue
+        # Warm both connection pools so neither pays for connecting in its measurements
+        await run_sync(read, subject, cache)
+        await run_async(async_engine, read, subject, cache)
+        sync = await benchmark(
+            lambda: run_sync(read, subject, cache), clients, requests
+        )
+        async_ = await benchmark(
+            lambda: run_async(async_engine, read, subject, cache), clients, requests
+        )
+        print(f"{name} ({clients} clients, {requests} requests)")
+        print(f"  sync   {sync}")
+        print(f"  async  {async_}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument(
+        "--pid",
+        type=int,
+        default=999999999,
+        help="PID of the user whose status is read",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="serve news feed pages from the cache rather than the database",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.requests, args.pid, args.cache))
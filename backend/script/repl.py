@@ -18,7 +18,7 @@ sys.path.append("/workspace")
 
 from sqlalchemy import select, join
 from sqlalchemy.orm import joinedload, aliased
-from backend.database import db_session
+from backend.database import Session, engine
 from backend.services import PermissionService, UserService
 
 print("=== CSXL Development Repl ===\n")
@@ -39,7 +39,7 @@ from backend.models.coworking import *
 print(" - all models in backend/models/__init__.py")
 print(" - all models in backend/models/coworking/__init__.py")
 
-session = next(db_session())
+session = Session(engine)
 print(" - session: a SQLAlchemy ORM Session")
 
 permission_svc = PermissionService(session)
@@ -7,3 +7,4 @@ from .event import EventService
 from .exceptions import ResourceNotFoundException, UserPermissionException
 from .room import RoomService
 from .news_post import NewsPostService
+from .news_feed import NewsFeedService
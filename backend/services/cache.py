@@ -0,0 +1,162 @@
+"""
+Caching of values computed from the database.
+
+`TTLCache` is an in-process cache of values such as responses identical for every
+anonymous visitor. Each process of the application keeps its own cache, so entries are
+only invalidated by writes made through the same process. The time-to-live of entries
+bounds how long other processes may serve values made stale by writes they did not observe.
+
+`cache_validator` computes the version of a collection of rows, with which clients can
+revalidate their own cached copy of a response.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Sequence, TypeVar
+
+from sqlalchemy import ColumnElement, String, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from ..models.cache_statistics import CacheStatistics
+from ..models.cache_validator import CacheValidator
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe cache evicting entries after `ttl` seconds, or least recently used
+    entries first once holding `maxsize` entries."""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(self, key: Hashable, load: Callable[[], V]) -> V:
+        """Get the value cached under `key`, loading and caching it on a miss.
+
+        The value is loaded outside of the cache's lock, so concurrent misses of the
+        same key may each load it. A value loaded while the cache was cleared is
+        returned but not cached, since it may have been read before the write which
+        cleared the cache was committed.
+
+        Args:
+            key: a hashable key identifying the value.
+            load: computes the value when it is not cached.
+
+        Returns:
+            V: the cached or freshly loaded value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            generation = self._generation
+
+        value = load()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + self._ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """Invalidate the value cached under `key`.
+
+        Values being loaded meanwhile are not cached, as after `clear`, since they may
+        have been read before the write which discarded the key was committed."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Invalidate every cached value."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def reset(self) -> None:
+        """Invalidate every cached value and reset the cache's statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._hits = 0
+            self._misses = 0
+
+    def statistics(self) -> CacheStatistics:
+        """Summarize how effective the cache has been since it was last reset."""
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+                ttl=self._ttl,
+            )
+
+
+def cache_validator(
+    session: Session,
+    id: InstrumentedAttribute[int],
+    modification_date: InstrumentedAttribute,
+    *criteria: ColumnElement[bool],
+    dependencies: Sequence[ColumnElement] = (),
+) -> CacheValidator:
+    """Compute the version of the rows matching `criteria` with a single aggregate query.
+
+    The version digests the set of matching ids along with their latest modification,
+    so it changes when rows are added to or removed from the collection as well as
+    when they are modified.
+
+    Args:
+        session: the session to query with.
+        id: the primary key column of the rows.
+        modification_date: the column recording when each row was last modified.
+        *criteria: filters selecting the rows of the collection.
+        dependencies: scalar subqueries digesting related rows which are embedded in
+            the representation of the collection but not tracked by `modification_date`.
+
+    Returns:
+        CacheValidator: the version of the collection.
+    """
+    ids = func.string_agg(cast(id, String), aggregate_order_by(literal(","), id))
+    statement = (
+        select(func.count(), func.max(modification_date), func.md5(ids), *dependencies)
+        .select_from(id.class_)
+        .where(*criteria)
+    )
+    count, last_modified, *digests = session.execute(statement).one()
+    version = ":".join(
+        [
+            str(count),
+            last_modified.isoformat() if last_modified else "",
+            *(digest or "" for digest in digests),
+        ]
+    )
+    return CacheValidator(
+        digest=hashlib.sha1(version.encode()).hexdigest(),
+        last_modified=last_modified,
+    )
@@ -2,35 +2,53 @@
 The Event Service allows the API to manipulate event data in the database.
 """
 
-from typing import Sequence
+import csv
+import io
+from datetime import datetime
+from typing import Iterator, Sequence
 
 from fastapi import Depends
-from sqlalchemy import func, select, and_, func, or_, exists, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import (
+    ColumnElement,
+    Engine,
+    String,
+    and_,
+    cast,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+
 from backend.entities.user_entity import UserEntity
-from backend.models.event_registration import EventRegistration
-from ..models.public_user import PublicUser
+from backend.models.coworking.time_range import TimeRange
+from backend.models.event import Event, DraftEvent
+from backend.models.event_details import EventDetails
+from backend.models.event_registration import (
+    BulkEventRegistrationResult,
+    EventRegistration,
+)
 from backend.models.organization_details import OrganizationDetails
-from backend.models.pagination import Paginated, PaginationParams
+from backend.models.pagination import Paginated, PaginationCursor, PaginationParams
 from backend.models.registration_type import RegistrationType
 
-from ..models import User, Event, EventDetails, Paginated, EventPaginationParams
 from ..database import db_session
-from backend.models.event import Event, DraftEvent
-from backend.models.event_details import EventDetails
-from backend.models.coworking.time_range import TimeRange
-from ..entities import (
-    EventEntity,
-    EventRegistrationEntity,
-)
-from ..entities import EventEntity, OrganizationEntity
-from .permission import PermissionService
+from ..entities import EventEntity, EventRegistrationEntity, OrganizationEntity
+from ..models import User, Event, EventDetails, Paginated, EventPaginationParams
+from ..models.cache_validator import CacheValidator
+from ..models.public_user import PublicUser
+from . import UserService
+from .cache import cache_validator
 from .exceptions import (
     ResourceNotFoundException,
     EventRegistrationException,
 )
-from . import UserService
-from datetime import datetime
+from .permission import PermissionService
 
 __authors__ = [
     "Ajay Gandecha",
@@ -64,43 +82,37 @@ class EventService:
     ) -> Paginated[EventDetails]:
         """List Events.
 
+        Passing the `next_cursor` or `previous_cursor` of a page as the `after` or
+        `before` parameter retrieves the neighboring page by keyset on `(time, id)`,
+        rather than by `page` offset.
+
         Parameters:
             pagination_params: The pagination parameters.
 
         Returns:
             Paginated[Event]: The paginated list of events.
+
+        Raises:
+            ValueError: If the pagination cursor or time range is invalid.
         """
 
-        statement = select(EventEntity)
-        length_statement = select(func.count()).select_from(EventEntity)
-        if pagination_params.range_start != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
-            criteria = and_(
-                EventEntity.time
-                >= datetime.strptime(range_start, "%d/%m/%Y, %H:%M:%S"),
-                EventEntity.time <= datetime.strptime(range_end, "%d/%m/%Y, %H:%M:%S"),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+        criteria = self._paginated_criteria(pagination_params)
+        statement = (
+            select(EventEntity)
+            .options(selectinload(EventEntity.organization))
+            .where(*criteria)
+        )
+        length_statement = select(func.count()).select_from(EventEntity).where(*criteria)
 
-        if pagination_params.filter != "":
-            query = pagination_params.filter
+        # Counting every matching event is skipped for clients that opt out of totals
+        length = (
+            self._session.execute(length_statement).scalar()
+            if pagination_params.include_total
+            else None
+        )
 
-            criteria = or_(
-                EventEntity.name.ilike(f"%{query}%"),
-                EventEntity.description.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == EventEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
-                ),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+        if pagination_params.after != "" or pagination_params.before != "":
+            return self._paginate_by_cursor(statement, length, pagination_params, subject)
 
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
@@ -112,15 +124,251 @@ class EventService:
                     getattr(EventEntity, pagination_params.order_by).desc()
                 )
 
+        # Ties in time are broken by id, to let the last event of the page serve as the
+        # cursor of the next page
+        soonest_first = (
+            pagination_params.order_by == "time" and pagination_params.ascending != ""
+        )
+        if soonest_first:
+            statement = statement.order_by(EventEntity.id)
+
         statement = statement.offset(offset).limit(limit)
 
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        entities = self._session.execute(statement).scalars().all()
+
+        next_cursor = None
+        if soonest_first and len(entities) == limit:
+            next_cursor = self._cursor_of(entities[-1])
+
+        return Paginated(
+            items=self._with_permissions(
+                subject, self._to_details_models(entities, subject)
+            ),
+            length=length,
+            params=pagination_params,
+            next_cursor=next_cursor,
+        )
+
+    def _paginate_by_cursor(
+        self,
+        statement,
+        length: int | None,
+        pagination_params: EventPaginationParams,
+        subject: User | None,
+    ) -> Paginated[EventDetails]:
+        """Retrieve a page of events, soonest first, by keyset on `(time, id)`.
+
+        Unlike offset pagination, the cost of retrieving a page does not grow with how
+        deep into the listing the page is, since the `(time, id)` index seeks directly
+        to the cursor's position.
+
+        Args:
+            statement: the select statement of events, with filters applied.
+            length: the total number of matching events, if counted.
+            pagination_params: parameters holding an `after` or `before` cursor.
+            subject: The User making the request, if signed in.
+
+        Returns:
+            Paginated[EventDetails]: the page of events and cursors to its neighbors.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        position = tuple_(EventEntity.time, EventEntity.id)
+        limit = pagination_params.page_size
+
+        if pagination_params.before == "":
+            cursor = PaginationCursor.decode(pagination_params.after)
+            statement = statement.where(position > (cursor.time, cursor.id)).order_by(
+                EventEntity.time, EventEntity.id
+            )
+            # One extra event is fetched to determine whether a next page exists
+            entities = self._session.scalars(statement.limit(limit + 1)).all()
+            has_next, has_previous = len(entities) > limit, True
+            entities = entities[:limit]
+        else:
+            cursor = PaginationCursor.decode(pagination_params.before)
+            statement = statement.where(position < (cursor.time, cursor.id)).order_by(
+                EventEntity.time.desc(), EventEntity.id.desc()
+            )
+            entities = self._session.scalars(statement.limit(limit + 1)).all()
+            has_next, has_previous = True, len(entities) > limit
+            entities = list(reversed(entities[:limit]))
 
         return Paginated(
-            items=[entity.to_details_model(subject) for entity in entities],
+            items=self._with_permissions(
+                subject, self._to_details_models(entities, subject)
+            ),
             length=length,
             params=pagination_params,
+            next_cursor=(
+                self._cursor_of(entities[-1]) if entities and has_next else None
+            ),
+            previous_cursor=(
+                self._cursor_of(entities[0]) if entities and has_previous else None
+            ),
+        )
+
+    def _cursor_of(self, entity: EventEntity) -> str:
+        """Encode the position of an event in the listing as a pagination cursor."""
+        return PaginationCursor(time=entity.time, id=entity.id).encode()
+
+    def _paginated_criteria(
+        self, pagination_params: EventPaginationParams
+    ) -> list[ColumnElement[bool]]:
+        """Criteria selecting the events listed by the given pagination parameters."""
+        criteria = []
+        if pagination_params.range_start != "":
+            range_start = pagination_params.range_start
+            range_end = pagination_params.range_end
+            criteria.append(
+                and_(
+                    EventEntity.time
+                    >= datetime.strptime(range_start, "%d/%m/%Y, %H:%M:%S"),
+                    EventEntity.time
+                    <= datetime.strptime(range_end, "%d/%m/%Y, %H:%M:%S"),
+                )
+            )
+
+        if pagination_params.filter != "":
+            query = pagination_params.filter
+
+            criteria.append(
+                or_(
+                    EventEntity.name.ilike(f"%{query}%"),
+                    EventEntity.description.ilike(f"%{query}%"),
+                    exists().where(
+                        OrganizationEntity.id == EventEntity.organization_id,
+                        OrganizationEntity.name.ilike(f"%{query}%"),
+                    ),
+                    exists().where(
+                        OrganizationEntity.id == EventEntity.organization_id,
+                        OrganizationEntity.slug.ilike(f"%{query}%"),
+                    ),
+                )
+            )
+        return criteria
+
+    def get_paginated_events_validator(
+        self, pagination_params: EventPaginationParams
+    ) -> CacheValidator:
+        """
+        Compute the version of the events listed by the given pagination parameters,
+        with which clients revalidate their copy of the listing.
+
+        Args:
+            pagination_params: The pagination parameters.
+
+        Returns:
+            CacheValidator: the version of the listed events.
+        """
+        return self._validator(*self._paginated_criteria(pagination_params))
+
+    def get_events_in_time_range_validator(self, time_range: TimeRange) -> CacheValidator:
+        """
+        Compute the version of the events in the time range
+
+        Args:
+            time_range: The period over which to search for events.
+
+        Returns:
+            CacheValidator: the version of the events in the time range.
+        """
+        return self._validator(
+            EventEntity.time >= time_range.start, EventEntity.time < time_range.end
+        )
+
+    def get_events_by_organization_validator(
+        self, organization: OrganizationDetails
+    ) -> CacheValidator:
+        """
+        Compute the version of the events hosted by an organization
+
+        Args:
+            organization: the organization hosting the events.
+
+        Returns:
+            CacheValidator: the version of the organization's events.
+        """
+        return self._validator(EventEntity.organization_id == organization.id)
+
+    def get_event_validator(self, id: int) -> CacheValidator:
+        """
+        Compute the version of the event with a matching id
+
+        Args:
+            id: a valid int representing a unique event ID
+
+        Returns:
+            CacheValidator: the version of the event.
+        """
+        return self._validator(EventEntity.id == id)
+
+    def _validator(self, *criteria: ColumnElement[bool]) -> CacheValidator:
+        """Compute the version of the events matching `criteria`.
+
+        Registrations are embedded in events' details, so the version also digests the
+        registrations of the events, along with the organizations hosting the events and
+        the users organizing them."""
+        registrations = (
+            select(
+                func.md5(
+                    func.string_agg(
+                        func.concat_ws(
+                            ":",
+                            EventRegistrationEntity.event_id,
+                            EventRegistrationEntity.user_id,
+                            cast(EventRegistrationEntity.registration_type, String),
+                        ),
+                        aggregate_order_by(
+                            literal(","),
+                            EventRegistrationEntity.event_id,
+                            EventRegistrationEntity.user_id,
+                        ),
+                    )
+                )
+            )
+            .where(
+                EventRegistrationEntity.event_id.in_(
+                    select(EventEntity.id).where(*criteria)
+                )
+            )
+            .scalar_subquery()
+        )
+        organizer_ids = select(EventRegistrationEntity.user_id).where(
+            EventRegistrationEntity.event_id.in_(
+                select(EventEntity.id).where(*criteria)
+            ),
+            EventRegistrationEntity.registration_type == RegistrationType.ORGANIZER,
+        )
+        embedded = [
+            (
+                OrganizationEntity,
+                OrganizationEntity.id.in_(
+                    select(EventEntity.organization_id).where(*criteria)
+                ),
+            ),
+            (UserEntity, UserEntity.id.in_(organizer_ids)),
+        ]
+        digests = [
+            select(
+                func.md5(
+                    func.string_agg(
+                        func.concat_ws(":", *entity.__table__.columns),
+                        aggregate_order_by(literal(","), entity.id),
+                    )
+                )
+            )
+            .where(embedded_criterion)
+            .scalar_subquery()
+            for entity, embedded_criterion in embedded
+        ]
+        return cache_validator(
+            self._session,
+            EventEntity.id,
+            EventEntity.modification_date,
+            *criteria,
+            dependencies=[registrations, *digests],
         )
 
     def all(
@@ -137,12 +385,16 @@ class EventService:
             list[EventDetails]: List of all `EventDetails`
         """
         # Select all entries in `Event` table
-        event_entities = (self._session.query(EventEntity)).all()
+        event_entities = (
+            self._session.query(EventEntity)
+            .options(selectinload(EventEntity.organization))
+            .all()
+        )
 
         # Convert entities to details models and return
-        return [
-            event_entity.to_details_model(subject) for event_entity in event_entities
-        ]
+        return self._with_permissions(
+            subject, self._to_details_models(event_entities, subject)
+        )
 
     def get_events_in_time_range(
         self, time_range: TimeRange, subject: User | None = None
@@ -159,11 +411,15 @@ class EventService:
         """
         event_entities = (
             self._session.query(EventEntity)
+            .options(selectinload(EventEntity.organization))
             .where(EventEntity.time >= time_range.start)
             .where(EventEntity.time < time_range.end)
+            .all()
         )
 
-        return [entity.to_details_model(subject) for entity in event_entities]
+        return self._with_permissions(
+            subject, self._to_details_models(event_entities, subject)
+        )
 
     def create(self, subject: User, event: DraftEvent) -> EventDetails:
         """
@@ -231,7 +487,9 @@ class EventService:
             raise ResourceNotFoundException(f"No event found with matching ID: {id}")
 
         # Convert entry to a model and return
-        return entity.to_details_model(subject)
+        return self._with_permissions(
+            subject, self._to_details_models([entity], subject)
+        )[0]
 
     def get_events_by_organization(
         self, organization: OrganizationDetails, subject: User | None = None
@@ -249,12 +507,100 @@ class EventService:
         # Query the event with matching organization slug
         events = (
             self._session.query(EventEntity)
+            .options(selectinload(EventEntity.organization))
             .filter(EventEntity.organization_id == organization.id)
             .all()
         )
 
         # Convert entities to models and return
-        return [event.to_details_model(subject) for event in events]
+        return self._with_permissions(subject, self._to_details_models(events, subject))
+
+    def _to_details_models(
+        self, entities: Sequence[EventEntity], subject: User | None
+    ) -> list[EventDetails]:
+        """
+        Convert events to details models, summarizing their registrations in SQL
+
+        Rather than loading every registration of every event, attendees are counted by
+        the events' `registration_count`, the subject's registrations are selected at once,
+        and organizers are selected in a single batch. The statements executed are constant,
+        and the rows read bounded by the events' organizers, however many attend them.
+
+        Args:
+            entities: the events to convert.
+            subject: The User making the request, if signed in.
+
+        Returns:
+            list[EventDetails]: the details of the events, in the same order.
+        """
+        if len(entities) == 0:
+            return []
+        in_events = EventRegistrationEntity.event_id.in_(
+            [entity.id for entity in entities]
+        )
+
+        subject_registrations: set[tuple[int, RegistrationType]] = set()
+        if subject is not None:
+            subject_registrations = set(
+                self._session.execute(
+                    select(
+                        EventRegistrationEntity.event_id,
+                        EventRegistrationEntity.registration_type,
+                    ).where(in_events, EventRegistrationEntity.user_id == subject.id)
+                ).all()
+            )
+
+        organizers: dict[int, list[PublicUser]] = {entity.id: [] for entity in entities}
+        for registration in self._session.scalars(
+            select(EventRegistrationEntity)
+            .options(joinedload(EventRegistrationEntity.user))
+            .where(
+                in_events,
+                EventRegistrationEntity.registration_type
+                == RegistrationType.ORGANIZER,
+            )
+        ):
+            organizers[registration.event_id].append(registration.to_flat_model())
+
+        return [
+            entity.to_summarized_details_model(
+                entity.to_summarized_model(
+                    registration_count=entity.registration_count,
+                    is_attendee=(entity.id, RegistrationType.ATTENDEE)
+                    in subject_registrations,
+                    is_organizer=(entity.id, RegistrationType.ORGANIZER)
+                    in subject_registrations,
+                    organizers=organizers[entity.id],
+                )
+            )
+            for entity in entities
+        ]
+
+    def _with_permissions(
+        self, subject: User | None, events: list[EventDetails]
+    ) -> list[EventDetails]:
+        """
+        Record which events the subject may update
+
+        The permissions of the subject on every event's organization are checked at once.
+
+        Args:
+            subject: The User making the request, if signed in.
+            events: the events to record the subject's permissions on.
+
+        Returns:
+            list[EventDetails]: the events, with `can_update` set.
+        """
+        if subject is None or len(events) == 0:
+            return events
+        allowed = self._permission.check_many(
+            subject,
+            "organization.events.update",
+            [f"organization/{event.organization_id}" for event in events],
+        )
+        for event, may_update in zip(events, allowed):
+            event.can_update = event.is_organizer or may_update
+        return events
 
     def update(self, subject: User, event: Event) -> EventDetails:
         """
@@ -322,10 +668,21 @@ class EventService:
                             )
                             continue
 
+                    # Attendees promoted to organizer no longer take a seat
+                    if (
+                        event_registration_entity.registration_type
+                        == RegistrationType.ATTENDEE
+                    ):
+                        event_entity.registration_count = (
+                            EventEntity.registration_count - 1
+                        )
                     event_registration_entity.registration_type = (
                         RegistrationType.ORGANIZER
                     )
 
+        # Seats added, or released by attendees promoted to organizer, go to the waitlist
+        self._promote_waitlist(event_entity.id)
+
         # Save changes
         self._session.commit()
 
@@ -432,6 +789,9 @@ class EventService:
         event_registration_entities = (
             self._session.query(EventRegistrationEntity)
             .where(EventRegistrationEntity.event_id == event.id)
+            .where(
+                EventRegistrationEntity.registration_type != RegistrationType.WAITLIST
+            )
             .all()
         )
 
@@ -472,7 +832,11 @@ class EventService:
         return event_registration_entity.to_flat_model()
 
     def register(
-        self, subject: User, attendee: User, event: EventDetails
+        self,
+        subject: User,
+        attendee: User,
+        event: EventDetails,
+        waitlist: bool = False,
     ) -> PublicUser:
         """
         Register a user for an event.
@@ -481,13 +845,14 @@ class EventService:
             subject: User making the registration request
             attendee: The user being registered for the event
             event: The EventDetails being registered for
+            waitlist: Whether to join the waitlist of the event if it is full
 
         Returns:
             PublicUser
 
         Raises:
             UserPermissionException if subject does not have permission to register user
-            EventRegistrationException if the event is full
+            EventRegistrationException if the event is full and `waitlist` is not set
         """
         if subject.id != attendee.id and not event.is_organizer:
             self._permission.enforce(
@@ -496,15 +861,6 @@ class EventService:
                 f"organization/{event.organization.id}",
             )
 
-        # Get the registration status.
-        # NOTE: It is preferred to use the service function rather than the list of
-        # registrations passed in from `event` in the case that registrations are added
-        # between when `event` was fetched and this function runs.
-
-        # Raise exception if event is full.
-        if event.registration_count >= event.registration_limit:
-            raise EventRegistrationException(event.id)
-
         # Enable idemopotency in returning existing registration, if one exists.
         # Permission to manage / read registration is enforced in EventService#get_registration
         existing_registration = self.get_registration(subject, attendee, event)
@@ -513,11 +869,29 @@ class EventService:
                 existing_registration
             ).to_flat_model()
 
+        # Claim a seat, raising an exception if the event is full.
+        registration_type = RegistrationType.ATTENDEE
+        if not self._claim_seat(event.id):
+            if not waitlist:
+                self._session.rollback()
+                raise EventRegistrationException(event.id)
+            # Lock the event before trying again, so that a seat released since the
+            # first attempt is claimed rather than waited for. Seats released while the
+            # lock is held are released after the attendee joins the waitlist, and
+            # promote the waitlist themselves.
+            self._session.execute(
+                select(EventEntity.id)
+                .where(EventEntity.id == event.id)
+                .with_for_update()
+            )
+            if not self._claim_seat(event.id):
+                registration_type = RegistrationType.WAITLIST
+
         # Add new object to table and commit changes
         event_registration_entity = EventRegistrationEntity(
             user_id=attendee.id,
             event_id=event.id,
-            registration_type=RegistrationType.ATTENDEE,
+            registration_type=registration_type,
         )
         self._session.add(event_registration_entity)
         self._session.commit()
@@ -525,6 +899,166 @@ class EventService:
         # Return registration
         return event_registration_entity.to_flat_model()
 
+    def register_many(
+        self, subject: User, event: EventDetails, identifiers: Sequence[str]
+    ) -> BulkEventRegistrationResult:
+        """
+        Register many users for an event at once, e.g. every student of a class.
+
+        Users are resolved by a single query, and registered by a single multi-row
+        INSERT for as many of the event's free seats as there are, in the order they
+        are identified. Users on the event's waitlist are promoted into free seats in
+        the same order, and otherwise stay on the waitlist. The statements executed are
+        constant, however many users are registered.
+
+        Args:
+            subject: User making the registration request
+            event: The EventDetails being registered for
+            identifiers: onyens or PIDs of the users being registered
+
+        Returns:
+            BulkEventRegistrationResult
+
+        Raises:
+            UserPermissionException if subject does not have permission to register users
+        """
+        if not event.is_organizer:
+            self._permission.enforce(
+                subject,
+                "organization.events.manage_registrations",
+                f"organization/{event.organization.id}",
+            )
+
+        # Resolve users, identified by PID if numeric and by onyen otherwise
+        identifiers = list(
+            dict.fromkeys(identifier.strip() for identifier in identifiers)
+        )
+        pids = [int(identifier) for identifier in identifiers if identifier.isdigit()]
+        onyens = [identifier for identifier in identifiers if not identifier.isdigit()]
+        user_entities = self._session.scalars(
+            select(UserEntity).where(
+                or_(UserEntity.pid.in_(pids), UserEntity.onyen.in_(onyens))
+            )
+        ).all()
+        by_identifier = {
+            identifier: user_entity
+            for user_entity in user_entities
+            for identifier in (str(user_entity.pid), user_entity.onyen)
+        }
+        unmatched = [
+            identifier for identifier in identifiers if identifier not in by_identifier
+        ]
+        users = list(
+            {
+                by_identifier[identifier].id: by_identifier[identifier]
+                for identifier in identifiers
+                if identifier in by_identifier
+            }.values()
+        )
+
+        # Lock the event, so its free seats are not claimed by others meanwhile
+        registration_limit, registration_count = self._session.execute(
+            select(EventEntity.registration_limit, EventEntity.registration_count)
+            .where(EventEntity.id == event.id)
+            .with_for_update()
+        ).one()
+        registration_types = dict(
+            self._session.execute(
+                select(
+                    EventRegistrationEntity.user_id,
+                    EventRegistrationEntity.registration_type,
+                ).where(
+                    EventRegistrationEntity.event_id == event.id,
+                    EventRegistrationEntity.user_id.in_([user.id for user in users]),
+                )
+            ).all()
+        )
+        # Waitlisted users hold no seat, so they are admitted along with new users
+        registered_ids = {
+            user_id
+            for user_id, registration_type in registration_types.items()
+            if registration_type != RegistrationType.WAITLIST
+        }
+        new_users = [user for user in users if user.id not in registered_ids]
+        admitted = new_users[: max(registration_limit - registration_count, 0)]
+        waiting = [user for user in admitted if user.id in registration_types]
+        admitted_new = [user for user in admitted if user.id not in registration_types]
+
+        promoted: set[int] = set()
+        if len(waiting) > 0:
+            promoted = set(
+                self._session.scalars(
+                    update(EventRegistrationEntity)
+                    .where(
+                        EventRegistrationEntity.event_id == event.id,
+                        EventRegistrationEntity.user_id.in_(
+                            [user.id for user in waiting]
+                        ),
+                        EventRegistrationEntity.registration_type
+                        == RegistrationType.WAITLIST,
+                    )
+                    .values(registration_type=RegistrationType.ATTENDEE)
+                    .returning(EventRegistrationEntity.user_id)
+                )
+            )
+
+        inserted: set[int] = set()
+        if len(admitted_new) > 0:
+            inserted = set(
+                self._session.scalars(
+                    insert(EventRegistrationEntity)
+                    .values(
+                        [
+                            {
+                                "event_id": event.id,
+                                "user_id": user.id,
+                                "registration_type": RegistrationType.ATTENDEE,
+                            }
+                            for user in admitted_new
+                        ]
+                    )
+                    # Users registering themselves meanwhile are already registered
+                    .on_conflict_do_nothing()
+                    .returning(EventRegistrationEntity.user_id)
+                )
+            )
+        claimed = promoted | inserted
+        if len(claimed) > 0:
+            self._session.execute(
+                update(EventEntity)
+                .where(EventEntity.id == event.id)
+                .values(
+                    registration_count=EventEntity.registration_count + len(claimed)
+                )
+            )
+
+        # Users are converted before they are expired by the commit
+        admitted_ids = {user.id for user in admitted}
+        refused = new_users[len(admitted) :]
+        result = BulkEventRegistrationResult(
+            registered=[
+                user.to_public_model() for user in admitted if user.id in claimed
+            ],
+            already_registered=[
+                user.to_public_model()
+                for user in users
+                if user.id in admitted_ids - claimed or user.id in registered_ids
+            ],
+            waitlisted=[
+                user.to_public_model()
+                for user in refused
+                if user.id in registration_types
+            ],
+            not_registered=[
+                user.to_public_model()
+                for user in refused
+                if user.id not in registration_types
+            ],
+            unmatched=unmatched,
+        )
+        self._session.commit()
+        return result
+
     def unregister(self, subject: User, attendee: User, event: EventDetails) -> None:
         """
         Delete a user's event registration.
@@ -559,7 +1093,180 @@ class EventService:
                 (event.id, attendee.id),
             )
         )
+
+        # Release the attendee's seat to the waitlist, in the same transaction
+        if event_registration.registration_type == RegistrationType.ATTENDEE:
+            self._session.execute(
+                update(EventEntity)
+                .where(EventEntity.id == event.id)
+                .values(registration_count=EventEntity.registration_count - 1)
+            )
+            self._promote_waitlist(event.id)
+
+        self._session.commit()
+
+    def _claim_seat(self, event_id: int) -> bool:
+        """
+        Take a seat at the event for a new attendee, if any is free
+
+        The count is checked and incremented by a single UPDATE rather than against
+        event details, which may be stale by the time they are registered for. The row
+        stays locked until the transaction commits, so concurrent registrations for the
+        event are admitted one at a time and never overshoot its limit.
+
+        Args:
+            event_id: the id of the event to take a seat at.
+
+        Returns:
+            bool: whether a seat was taken.
+        """
+        seats_taken = self._session.scalar(
+            update(EventEntity)
+            .where(
+                EventEntity.id == event_id,
+                EventEntity.registration_count < EventEntity.registration_limit,
+            )
+            .values(registration_count=EventEntity.registration_count + 1)
+            .returning(EventEntity.registration_count)
+        )
+        return seats_taken is not None
+
+    def _promote_waitlist(self, event_id: int) -> list[int]:
+        """
+        Register the longest waiting users of the event's waitlist for its free seats
+
+        The event is locked until the transaction commits, so promotions and
+        registrations for the event do not race for its seats.
+
+        Args:
+            event_id: the id of the event whose waitlist is promoted.
+
+        Returns:
+            list[int]: ids of the users promoted, in the order they joined the waitlist.
+        """
+        registration_limit, registration_count = self._session.execute(
+            select(EventEntity.registration_limit, EventEntity.registration_count)
+            .where(EventEntity.id == event_id)
+            .with_for_update()
+        ).one()
+        if registration_count >= registration_limit:
+            return []
+
+        promoted = self._session.scalars(
+            select(EventRegistrationEntity.user_id)
+            .where(
+                EventRegistrationEntity.event_id == event_id,
+                EventRegistrationEntity.registration_type == RegistrationType.WAITLIST,
+            )
+            .order_by(
+                EventRegistrationEntity.registered_at, EventRegistrationEntity.user_id
+            )
+            .limit(registration_limit - registration_count)
+        ).all()
+        if len(promoted) > 0:
+            self._session.execute(
+                update(EventRegistrationEntity)
+                .where(
+                    EventRegistrationEntity.event_id == event_id,
+                    EventRegistrationEntity.user_id.in_(promoted),
+                )
+                .values(registration_type=RegistrationType.ATTENDEE)
+            )
+            self._session.execute(
+                update(EventEntity)
+                .where(EventEntity.id == event_id)
+                .values(
+                    registration_count=EventEntity.registration_count + len(promoted)
+                )
+            )
+        return list(promoted)
+
+    def get_waitlist_position(
+        self, subject: User, attendee: User, event: EventDetails
+    ) -> int | None:
+        """
+        Get the position of a user on the waitlist of an event.
+
+        Args:
+            subject: User requesting the position
+            attendee: User waiting for the event
+            event: EventDetails of the event being waited for
+
+        Returns:
+            int: the position of the attendee, counting from 1 for the next user to be
+                registered, or None if the attendee is not on the waitlist
+
+        Raises:
+            UserPermissionException if subject does not have permission
+        """
+        # Administrative Permission: organization.events.manage_registrations : organization/{id}
+        if subject.id != attendee.id:
+            self._permission.enforce(
+                subject,
+                "organization.events.manage_registrations",
+                f"organization/{event.organization.id}",
+            )
+
+        on_waitlist = and_(
+            EventRegistrationEntity.event_id == event.id,
+            EventRegistrationEntity.registration_type == RegistrationType.WAITLIST,
+        )
+        registered_at = self._session.scalar(
+            select(EventRegistrationEntity.registered_at).where(
+                on_waitlist, EventRegistrationEntity.user_id == attendee.id
+            )
+        )
+        if registered_at is None:
+            return None
+
+        ahead = self._session.scalar(
+            select(func.count()).where(
+                on_waitlist,
+                tuple_(
+                    EventRegistrationEntity.registered_at,
+                    EventRegistrationEntity.user_id,
+                )
+                < tuple_(registered_at, attendee.id),
+            )
+        )
+        return ahead + 1
+
+    def reconcile_registration_counts(self) -> list[int]:
+        """
+        Correct the `registration_count` of every event which has drifted from its attendees
+
+        Counts only drift when registrations are changed outside of this service, e.g. by
+        hand or by data scripts. Events which have drifted are locked before they are
+        recounted, so registrations made meanwhile are neither lost nor counted twice.
+
+        Returns:
+            list[int]: ids of the events whose counts were corrected.
+        """
+        attendee_count = (
+            select(func.count())
+            .where(
+                EventRegistrationEntity.event_id == EventEntity.id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
+            )
+            .correlate(EventEntity)
+            .scalar_subquery()
+        )
+        drifted = self._session.scalars(
+            select(EventEntity.id)
+            .where(EventEntity.registration_count != attendee_count)
+            .with_for_update()
+        ).all()
+        if len(drifted) > 0:
+            # Recounted by a statement of its own, which sees registrations committed
+            # before the locks were acquired
+            self._session.execute(
+                update(EventEntity)
+                .where(EventEntity.id.in_(drifted))
+                .values(registration_count=attendee_count),
+                execution_options={"synchronize_session": False},
+            )
         self._session.commit()
+        return list(drifted)
 
     def get_registrations_of_user(
         self, subject: User, user: User, time_range: TimeRange
@@ -591,6 +1298,9 @@ class EventService:
         registration_entities = (
             self._session.query(EventRegistrationEntity)
             .where(EventRegistrationEntity.user_id == user.id)
+            .where(
+                EventRegistrationEntity.registration_type != RegistrationType.WAITLIST
+            )
             .join(EventEntity, EventRegistrationEntity.event_id == EventEntity.id)
             .where(EventEntity.time >= time_range.start)
             .where(EventEntity.time < time_range.end)
@@ -693,3 +1403,85 @@ class EventService:
             length=length,
             params=pagination_params,
         )
+
+    def export_registered_users_of_event(
+        self, subject: User, event: EventDetails
+    ) -> Iterator[str]:
+        """
+        Export the users registered for an event as CSV, streamed in batches of rows.
+
+        Rows are read from a server-side cursor as the CSV is consumed, so exports of
+        large events are neither paginated nor held in memory. Since responses are
+        streamed after the request's dependencies are cleaned up, rows are read through
+        a session of their own, which is closed once every row has been read.
+
+        Args:
+            subject: The user performing the action.
+            event: The event whose registered users are exported.
+
+        Returns:
+            Iterator[str]: the CSV, starting with a header row.
+
+        Raises:
+            PermissionException: If the subject does not have the required permission.
+        """
+        # Permission is enforced before, rather than as, the CSV is streamed
+        if not event.is_organizer:
+            self._permission.enforce(
+                subject,
+                "organization.events.manage_registrations",
+                f"organization/{event.organization_id}",
+            )
+
+        statement = (
+            select(
+                UserEntity.pid,
+                UserEntity.onyen,
+                UserEntity.first_name,
+                UserEntity.last_name,
+                UserEntity.email,
+                UserEntity.pronouns,
+            )
+            .join(
+                EventRegistrationEntity,
+                EventRegistrationEntity.user_id == UserEntity.id,
+            )
+            .where(
+                EventRegistrationEntity.event_id == event.id,
+                EventRegistrationEntity.registration_type == RegistrationType.ATTENDEE,
+            )
+            .order_by(UserEntity.last_name, UserEntity.first_name, UserEntity.id)
+            .execution_options(yield_per=500)
+        )
+        header = ["pid", "onyen", "first_name", "last_name", "email", "pronouns"]
+        return self._stream_csv(
+            self._session.get_bind(clause=statement), header, statement
+        )
+
+    def _stream_csv(
+        self, engine: Engine, header: list[str], statement
+    ) -> Iterator[str]:
+        """Format the rows of a statement as CSV, one batch of rows at a time.
+
+        Rows are read through a connection and session opened when the first row is
+        read, rather than through the request's session, which is closed by then."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def flush() -> str:
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
+        connection = engine.connect()
+        session = Session(connection)
+        try:
+            writer.writerow(header)
+            yield flush()
+            for rows in session.execute(statement).partitions():
+                writer.writerows(rows)
+                yield flush()
+        finally:
+            session.close()
+            connection.close()
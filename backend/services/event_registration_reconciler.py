@@ -0,0 +1,53 @@
+"""
+The Event Registration Reconciler periodically corrects the registration counts of events
+which have drifted from their registrations.
+"""
+
+import logging
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from .event import EventService
+from .periodic_worker import PeriodicWorker
+from .permission import PermissionService
+from .user import UserService
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+
+class EventRegistrationReconciler(PeriodicWorker[list[int]]):
+    """Background worker periodically reconciling the registration counts of events."""
+
+    thread_name = "event-registration-reconciler"
+    failure_message = "Failed to reconcile event registration counts"
+
+    def __init__(
+        self, session_factory: Callable[[], Session], interval: float = 3600.0
+    ):
+        """Initializes the reconciler to recount registrations every `interval` seconds"""
+        super().__init__(session_factory, interval)
+
+    def run_once(self) -> list[int]:
+        """
+        Correct the registration counts which have drifted
+
+        Returns:
+            list[int]: ids of the events whose counts were corrected.
+        """
+        with self._session_factory() as session:
+            permission = PermissionService(session)
+            event_service = EventService(
+                session, permission, UserService(session, permission)
+            )
+            return event_service.reconcile_registration_counts()
+
+    def _completed(self, corrected: list[int]) -> None:
+        if len(corrected) > 0:
+            logger.warning(
+                "Corrected drifted registration counts of events %s", corrected
+            )
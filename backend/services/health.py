@@ -11,7 +11,9 @@ In this context health does not refer to correctness as much as running, connect
 
 from fastapi import Depends
 from sqlalchemy import text
-from ..database import Session, db_session
+from .. import database
+from ..database import InstrumentedQueuePool, Session, db_session
+from ..models.pool_statistics import PoolStatistics
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -29,3 +31,24 @@ class HealthService:
         result = self._session.execute(stmt)
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
+
+    def pool_statistics(self) -> list[PoolStatistics]:
+        """Report the utilization of each database connection pool of the application, such
+        that monitors can alert when requests wait on, or time out waiting for, connections.
+
+        The primary's pool is always reported, and the replica's if one is configured.
+        """
+        pools = {
+            "primary": database.engine.pool,
+            "replica": database.replica_engine and database.replica_engine.pool,
+        }
+        statistics = []
+        for label, pool in pools.items():
+            if pool is None:
+                continue
+            if not isinstance(pool, InstrumentedQueuePool):
+                raise TypeError(
+                    f"The {label} engine was not created by `create_engine`"
+                )
+            statistics.append(pool.statistics(label))
+        return statistics
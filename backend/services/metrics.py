@@ -0,0 +1,202 @@
+"""
+Request metrics record how long each route takes to respond, along with how many SQL
+statements it executes and how long they take, and report them in the Prometheus text
+exposition format.
+
+Statements are attributed to the request executing them by a `QueryTally` held in a
+context variable, which SQLAlchemy's cursor events of instrumented engines add to. Context
+variables are copied into the threads running sync handlers and dependencies, so the
+statements of every handler are attributed to its request.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Iterator
+
+from fastapi import Depends
+from sqlalchemy import Engine, event
+
+from ..models import User
+from .permission import PermissionService
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+# Upper bounds, in seconds, of the buckets of the request latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class QueryTally:
+    """Statements executed on behalf of a request, and the time spent executing them."""
+
+    statements: int = 0
+    seconds: float = 0.0
+
+
+_query_tally: ContextVar[QueryTally | None] = ContextVar("query_tally", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryTally]:
+    """Tally the statements executed by instrumented engines within the context."""
+    tally = QueryTally()
+    token = _query_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _query_tally.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    tally = _query_tally.get()
+    started = getattr(context, "_query_started", None)
+    if tally is not None and started is not None:
+        tally.statements += 1
+        tally.seconds += time.perf_counter() - started
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Tally the statements executed by the engine in the requests executing them."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@dataclass
+class _RouteMetrics:
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    seconds: float = 0.0
+    statements: int = 0
+    db_seconds: float = 0.0
+
+
+class RequestMetrics:
+    """Thread-safe registry of the latency and database use of requests, by route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], _RouteMetrics] = {}
+
+    def record(
+        self, method: str, route: str, seconds: float, queries: QueryTally
+    ) -> None:
+        """Record a request's latency and the statements it executed.
+
+        Args:
+            method: the HTTP method of the request.
+            route: the path template of the route which served the request.
+            seconds: how long the request took to be served.
+            queries: the statements executed while serving the request.
+        """
+        with self._lock:
+            metrics = self._routes.setdefault((method, route), _RouteMetrics())
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    metrics.buckets[index] += 1
+            metrics.count += 1
+            metrics.seconds += seconds
+            metrics.statements += queries.statements
+            metrics.db_seconds += queries.seconds
+
+    def reset(self) -> None:
+        """Forget every recorded request."""
+        with self._lock:
+            self._routes.clear()
+
+    def prometheus(self) -> str:
+        """Format the recorded metrics in the Prometheus text exposition format."""
+        with self._lock:
+            routes = sorted(
+                (key, replace(metrics, buckets=list(metrics.buckets)))
+                for key, metrics in self._routes.items()
+            )
+
+        lines = [
+            "# HELP csxl_request_duration_seconds Latency of requests, by route.",
+            "# TYPE csxl_request_duration_seconds histogram",
+        ]
+        for (method, route), metrics in routes:
+            labels = _labels(method=method, route=route)
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                bucket_labels = _labels(method=method, route=route, le=str(bound))
+                lines.append(
+                    f"csxl_request_duration_seconds_bucket{bucket_labels} {count}"
+                )
+            inf_labels = _labels(method=method, route=route, le="+Inf")
+            lines.append(
+                f"csxl_request_duration_seconds_bucket{inf_labels} {metrics.count}"
+            )
+            lines.append(f"csxl_request_duration_seconds_sum{labels} {metrics.seconds}")
+            lines.append(f"csxl_request_duration_seconds_count{labels} {metrics.count}")
+
+        lines += [
+            "# HELP csxl_request_db_statements_total SQL statements executed by requests, by route.",
+            "# TYPE csxl_request_db_statements_total counter",
+        ]
+        for (method, route), metrics in routes:
+            labels = _labels(method=method, route=route)
+            lines.append(
+                f"csxl_request_db_statements_total{labels} {metrics.statements}"
+            )
+
+        lines += [
+            "# HELP csxl_request_db_seconds_total Time requests spent executing SQL statements, by route.",
+            "# TYPE csxl_request_db_seconds_total counter",
+        ]
+        for (method, route), metrics in routes:
+            labels = _labels(method=method, route=route)
+            lines.append(f"csxl_request_db_seconds_total{labels} {metrics.db_seconds}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    """Format a Prometheus label set, escaping each value."""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_metrics = RequestMetrics()
+"""Metrics of the requests served by this process."""
+
+
+class MetricsService:
+    """Service reporting the metrics of the requests served by this process"""
+
+    def __init__(self, permission: PermissionService = Depends()):
+        """Initializes the `MetricsService` with the service it authorizes administrators with"""
+        self._permission = permission
+
+    def prometheus(self, subject: User) -> str:
+        """
+        Report the metrics of the requests served, in the Prometheus text format
+
+        Args:
+            subject: the User requesting the metrics.
+
+        Returns:
+            str: the metrics.
+
+        Raises:
+            UserPermissionException: If the subject may not read metrics.
+        """
+        self._permission.enforce(subject, "metrics.read", "metrics")
+        return request_metrics.prometheus()
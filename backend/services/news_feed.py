@@ -0,0 +1,193 @@
+"""
+The News Feed Service syndicates the newest published news posts as Atom and JSON Feed
+documents for feed readers and aggregators.
+
+Documents are written incrementally by generators and cached once written, so feed
+readers polling frequently are served prebuilt documents until posts are next modified.
+Documents are cached by the parameters selecting their posts, rather than by the URL they
+were requested from, whose other query parameters do not change the document. Links are
+built from the configured `HOST` rather than from the request, whose Host header is
+chosen by the client.
+"""
+
+import json
+from datetime import datetime
+from typing import Callable, Iterator
+from urllib.parse import urlencode
+from xml.sax.saxutils import escape, quoteattr
+
+from fastapi import Depends
+
+from ..env import getenv
+from ..models.news_post_details import NewsPostDetails
+from .news_post import NewsPostService, news_feed_cache
+from .organization import OrganizationService
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+FEED_TITLE = "CSXL News"
+
+HOST = getenv("HOST")
+SITE_URL = f"{'http' if HOST.startswith('localhost') else 'https'}://{HOST}/"
+"""URL of the site the posts are read on."""
+
+# Writes a feed document in chunks, given the feed's URL, site URL and posts
+FeedWriter = Callable[[str, str, list[NewsPostDetails]], Iterator[str]]
+
+
+class NewsFeedService:
+    """Service that syndicates published posts of the `NewsPost` table"""
+
+    def __init__(
+        self,
+        news_service: NewsPostService = Depends(),
+        organization_service: OrganizationService = Depends(),
+    ):
+        """Initializes the `NewsFeedService` with the services it retrieves posts with"""
+        self._news_service = news_service
+        self._organization_service = organization_service
+
+    def atom(self, feed_path: str, limit: int, organization_slug: str = "") -> str:
+        """
+        Get the Atom document of the newest published posts
+
+        Args:
+            feed_path: the path of the route the document is served from.
+            limit: the maximum number of posts in the document.
+            organization_slug: slug of the organization whose posts to syndicate, if any.
+
+        Returns:
+            str: the Atom document.
+
+        Raises:
+            ResourceNotFoundException: If no organization has the given slug.
+        """
+        return self._document(write_atom, feed_path, limit, organization_slug)
+
+    def json_feed(self, feed_path: str, limit: int, organization_slug: str = "") -> str:
+        """
+        Get the JSON Feed document of the newest published posts
+
+        Args:
+            feed_path: the path of the route the document is served from.
+            limit: the maximum number of posts in the document.
+            organization_slug: slug of the organization whose posts to syndicate, if any.
+
+        Returns:
+            str: the JSON Feed document.
+
+        Raises:
+            ResourceNotFoundException: If no organization has the given slug.
+        """
+        return self._document(write_json_feed, feed_path, limit, organization_slug)
+
+    def _document(
+        self,
+        writer: FeedWriter,
+        feed_path: str,
+        limit: int,
+        organization_slug: str,
+    ) -> str:
+        """Get a feed document from `news_feed_cache`, writing it on a miss.
+
+        The document's self link is built from the parameters it is cached by."""
+        query: dict[str, int | str] = {"limit": limit}
+        if organization_slug != "":
+            query["organization"] = organization_slug
+        feed_url = f"{SITE_URL.rstrip('/')}{feed_path}?{urlencode(query)}"
+
+        def write() -> str:
+            organization = (
+                self._organization_service.get_by_slug(organization_slug)
+                if organization_slug != ""
+                else None
+            )
+            posts = self._news_service.get_latest_published(limit, organization)
+            return "".join(writer(feed_url, SITE_URL, posts))
+
+        return news_feed_cache.get_or_load(
+            ("feed", writer.__name__, feed_path, limit, organization_slug), write
+        )
+
+
+def write_atom(
+    feed_url: str, site_url: str, posts: list[NewsPostDetails]
+) -> Iterator[str]:
+    """Write an Atom document of the posts, one element at a time."""
+    yield '<?xml version="1.0" encoding="utf-8"?>\n'
+    yield '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+    yield f"  <title>{escape(FEED_TITLE)}</title>\n"
+    yield f"  <id>{escape(feed_url)}</id>\n"
+    yield f'  <link rel="self" href={quoteattr(feed_url)}/>\n'
+    yield f'  <link rel="alternate" href={quoteattr(site_url)}/>\n'
+    yield f"  <updated>{_timestamp(_updated(posts))}</updated>\n"
+    for post in posts:
+        url = _post_url(site_url, post)
+        yield "  <entry>\n"
+        yield f"    <title>{escape(post.headline)}</title>\n"
+        yield f"    <id>{escape(url)}</id>\n"
+        yield f'    <link rel="alternate" href={quoteattr(url)}/>\n'
+        yield f"    <published>{_timestamp(post.time)}</published>\n"
+        yield f"    <updated>{_timestamp(post.modification_date)}</updated>\n"
+        yield f"    <author><name>{escape(_author_name(post))}</name></author>\n"
+        if post.synopsis:
+            yield f"    <summary>{escape(post.synopsis)}</summary>\n"
+        yield f'    <content type="text">{escape(post.main_story)}</content>\n'
+        yield "  </entry>\n"
+    yield "</feed>\n"
+
+
+def write_json_feed(
+    feed_url: str, site_url: str, posts: list[NewsPostDetails]
+) -> Iterator[str]:
+    """Write a JSON Feed 1.1 document of the posts, one item at a time."""
+    header = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": FEED_TITLE,
+        "home_page_url": site_url,
+        "feed_url": feed_url,
+    }
+    # The header is written without its closing brace so that items can follow it
+    yield json.dumps(header)[:-1]
+    yield ', "items": ['
+    for index, post in enumerate(posts):
+        url = _post_url(site_url, post)
+        item = {
+            "id": url,
+            "url": url,
+            "title": post.headline,
+            "content_text": post.main_story,
+            "date_published": _timestamp(post.time),
+            "date_modified": _timestamp(post.modification_date),
+            "authors": [{"name": _author_name(post)}],
+        }
+        if post.synopsis:
+            item["summary"] = post.synopsis
+        if post.image_url:
+            item["image"] = post.image_url
+        yield ("," if index > 0 else "") + json.dumps(item)
+    yield "]}"
+
+
+def _post_url(site_url: str, post: NewsPostDetails) -> str:
+    """URL of the page a post is read on."""
+    return f"{site_url.rstrip('/')}/news/{post.slug}"
+
+
+def _author_name(post: NewsPostDetails) -> str:
+    """Name of a post's author, or of its organization if the author is unknown."""
+    if post.author is not None:
+        return f"{post.author.first_name} {post.author.last_name}".strip()
+    return post.organization.name if post.organization is not None else FEED_TITLE
+
+
+def _updated(posts: list[NewsPostDetails]) -> datetime:
+    """Time the newest change to any of the posts was made."""
+    return max((post.modification_date for post in posts), default=datetime.now())
+
+
+def _timestamp(time: datetime) -> str:
+    """Format a timestamp as RFC 3339, interpreting naive timestamps as local time."""
+    return time.astimezone().isoformat(timespec="seconds")
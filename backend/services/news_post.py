@@ -2,31 +2,64 @@
 The News Post Service allows the API to manipulate news_posts data in the database.
 """
 
+import hashlib
+import re
 from datetime import datetime, timedelta
 from fastapi import Depends
-from sqlalchemy import and_, exists, func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, and_, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, to_tsquery
+from sqlalchemy.orm import Session, defer, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+from typing import Any, Callable
 from sqlalchemy.exc import IntegrityError
 
-from backend.entities.organization_entity import OrganizationEntity
-from backend.entities.user_entity import UserEntity
 from backend.models.organization_details import OrganizationDetails
-from backend.models.pagination import EventPaginationParams, Paginated
+from backend.models.pagination import (
+    EventPaginationParams,
+    Paginated,
+    PaginationCursor,
+)
 from backend.models.user_details import UserDetails
 
 from ..database import db_session
 
 from ..models.news_post import NewsPost
 from ..models.news_post_details import NewsPostDetails
+from ..models.news_post_summary import NewsPostSummary
+from ..models.news_post_state import NewsPostState
+from ..models.cache_statistics import CacheStatistics
+from ..models.cache_validator import CacheValidator
 from ..entities.news_post_entity import NewsPostEntity
+from ..entities.news_post_slug_entity import NewsPostSlugEntity
+from ..entities.organization_entity import OrganizationEntity
+from ..entities.user_entity import UserEntity
 from ..models import User
 
+from .cache import TTLCache, cache_validator
 from .permission import PermissionService
 from .exceptions import ResourceNotFoundException, UserPermissionException
 
 
+# Loader strategy applied to the relationships embedded in `NewsPostDetails`
+LoaderStrategy = Callable[..., LoaderOption]
+
+# The public feed is identical for every anonymous visitor, so its pages are cached.
+# Writes to posts, and to the organizations and users embedded in their details, clear it.
+news_feed_cache: TTLCache[Any] = TTLCache(maxsize=256, ttl=60)
+
+
+def _violates(error: IntegrityError, constraint: str) -> bool:
+    """Whether an integrity error was raised by the named constraint."""
+    diag = getattr(error.orig, "diag", None)
+    return diag is not None and diag.constraint_name == constraint
+
+
 class NewsPostService:
 
+    # Relationships read by `NewsPostEntity.to_details_model`. Left lazy, listing N
+    # posts would issue 1 + 2N queries, so queries producing details load them eagerly.
+    details_relationships = (NewsPostEntity.author, NewsPostEntity.organization)
+
     def __init__(
         self,
         session: Session = Depends(db_session),
@@ -36,19 +69,54 @@ class NewsPostService:
         self._session = session
         self._permission = permission
 
+    def _details_options(
+        self, strategy: LoaderStrategy = joinedload
+    ) -> list[LoaderOption]:
+        """Loader options eagerly loading every relationship embedded in post details.
+
+        Both relationships are many-to-one, so by default they are joined into the
+        query of the posts themselves. Queries returning many posts that share few
+        authors and organizations may prefer `selectinload`, which loads each distinct
+        author and organization once in a separate query.
+
+        Args:
+            strategy: the SQLAlchemy loader strategy to apply to each relationship.
+
+        Returns:
+            list[LoaderOption]: options to apply to a query of `NewsPostEntity`.
+        """
+        return [strategy(relationship) for relationship in self.details_relationships]
+
+    def _select_details(self, strategy: LoaderStrategy = joinedload):
+        """Select posts along with the relationships embedded in their details."""
+        return select(NewsPostEntity).options(*self._details_options(strategy))
+
+    def _select_summaries(self, strategy: LoaderStrategy = joinedload):
+        """Select posts for conversion to summaries, leaving their main stories unread."""
+        return self._select_details(strategy).options(
+            defer(NewsPostEntity.main_story, raiseload=True)
+        )
+
 
     def all(self, subject: User) -> list[NewsPostDetails]:
 
         self._permission.enforce(subject, "news_post.get", f"news_post")
 
-        # Select all entries in `NewsPost` table
-        query = select(NewsPostEntity)
+        # Select all entries in `NewsPost` table, loading each distinct author and
+        # organization once since the list is unbounded
+        query = self._select_details(selectinload)
         entities = self._session.scalars(query).all()
 
         return [entity.to_details_model() for entity in entities]
 
     def create(self, subject: User, news_post: NewsPost) -> NewsPostDetails:
 
+        # Scheduled posts are published without review, so scheduling requires permission
+        if news_post.publish_at is not None:
+            self._permission.enforce(
+                subject, "news_post.update", f"news_post/{news_post.slug}"
+            )
+
         # Checks if the news_post already exists in the table
         if news_post.id:
             # Set id to None so database can handle setting the id
@@ -57,28 +125,24 @@ class NewsPostService:
         news_post.time = datetime.now()
         news_post.modification_date = datetime.now()
 
-        # Otherwise, create new object
-        news_post_entity = NewsPostEntity.from_model(news_post)
-
-        # Attempt to add new object to table
-        try:
-            self._session.add(news_post_entity)
-            self._session.commit()
-        except IntegrityError:
-            self._session.rollback()
-            # If slug is not unique, retrieve the highest ID and append to slug
-            latest_post = (
-                self._session.query(NewsPostEntity)
-                .order_by(NewsPostEntity.id.desc())
-                .first()
-        )
-            if latest_post:
-                new_slug = f"{news_post.slug}-{latest_post.id + 1}"
-                news_post.slug = new_slug
-                news_post_entity.slug = new_slug
-                self._session.add(news_post_entity)
-                self._session.commit()
+        # Reserve a unique slug, suffixing the requested slug when other posts requested it
+        while True:
+            news_post_entity = NewsPostEntity.from_model(news_post)
+            news_post_entity.slug = NewsPostSlugEntity.allocate(
+                self._session, news_post.slug
+            )
+            try:
+                # A post may have been edited to take the reserved slug, in which case
+                # only its insert is rolled back and the next suffix is reserved
+                with self._session.begin_nested():
+                    self._session.add(news_post_entity)
+                break
+            except IntegrityError as error:
+                if not _violates(error, "news_post_slug_key"):
+                    raise
+        self._session.commit()
 
+        news_feed_cache.clear()
 
         # Return added object
         return news_post_entity.to_details_model()
@@ -88,6 +152,7 @@ class NewsPostService:
         # Query the news_post with matching slug
         news_post = (
             self._session.query(NewsPostEntity)
+            .options(*self._details_options())
             .filter(NewsPostEntity.slug == slug)
             .one_or_none()
         )
@@ -105,7 +170,7 @@ class NewsPostService:
 
         # news_post_entity = self._session.get(NewsPostEntity, news_post.id)
 
-        if(not(news_post.author_id == subject.id and (news_post.state == 'draft' or news_post.state == 'incoming'))):
+        if(not(news_post.author_id == subject.id and (news_post.state == NewsPostState.DRAFT or news_post.state == NewsPostState.INCOMING))):
             self._permission.enforce(
             subject, "news_post.update", f"news_post/{news_post.slug}")
         
@@ -117,6 +182,12 @@ class NewsPostService:
             raise ResourceNotFoundException(
                 f"No news post found with matching ID: {news_post.id}"
             )
+
+        # Scheduled posts are published without review, so scheduling requires permission
+        if news_post.publish_at is not None and news_post.publish_at != obj.publish_at:
+            self._permission.enforce(
+                subject, "news_post.update", f"news_post/{news_post.slug}"
+            )
         
         news_post.modification_date = datetime.now()
 
@@ -132,9 +203,11 @@ class NewsPostService:
         obj.time = news_post.time
         obj.modification_date = news_post.modification_date
         obj.synopsis = news_post.synopsis
+        obj.publish_at = news_post.publish_at
 
         # Save changes
         self._session.commit()
+        news_feed_cache.clear()
 
         # Return updated object
         return obj.to_details_model()
@@ -160,62 +233,153 @@ class NewsPostService:
         self._session.delete(obj)
         # Save changes
         self._session.commit()
+        news_feed_cache.clear()
+
+    def publish_due_posts(self, now: datetime | None = None) -> list[int]:
+        """
+        Publish every scheduled post whose publication time has passed
+
+        Due drafts and incoming posts are published by a single UPDATE, so schedulers
+        running concurrently, e.g. one per worker process, publish each post once.
+
+        Args:
+            now: the current time, defaulting to the time of the call.
+
+        Returns:
+            list[int]: ids of the posts published.
+        """
+        now = datetime.now() if now is None else now
+        statement = (
+            update(NewsPostEntity)
+            .where(
+                NewsPostEntity.publish_at <= now,
+                NewsPostEntity.state.in_(
+                    [NewsPostState.DRAFT, NewsPostState.INCOMING]
+                ),
+            )
+            # Posts are dated by the time they were scheduled to go live
+            .values(
+                state=NewsPostState.PUBLISHED,
+                time=NewsPostEntity.publish_at,
+                modification_date=now,
+                publish_at=None,
+            )
+            .returning(NewsPostEntity.id)
+        )
+        published = self._session.scalars(
+            statement, execution_options={"synchronize_session": False}
+        ).all()
+        self._session.commit()
+
+        if len(published) > 0:
+            news_feed_cache.clear()
+        return list(published)
 
     def get_paginated_posts(
         self,
         pagination_params: EventPaginationParams,
         subject: User | None = None,
-    ) -> Paginated[NewsPostDetails]:
+        summary: bool = False,
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+        """Retrieve a page of published posts.
 
-        statement = select(NewsPostEntity).where(NewsPostEntity.state.ilike("published"))
-        length_statement = select(func.count()).select_from(NewsPostEntity).where(NewsPostEntity.state.ilike("published"))
-        if pagination_params.range_start != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
-            criteria = and_(
-                NewsPostEntity.time
-                >= datetime.strptime(range_start, "%d/%m/%Y, %H:%M:%S"),
-                NewsPostEntity.time
-                <= datetime.strptime(range_end, "%d/%m/%Y, %H:%M:%S"),
-            )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
+        Pages of the public feed, requested without a subject, are served from
+        `news_feed_cache` when possible, along with their version.
 
+        Args:
+            pagination_params: parameters selecting the page of posts.
+            subject: the user requesting the page, if signed in.
+            summary: whether to list `NewsPostSummary`s rather than details.
+
+        Returns:
+            Paginated: the page of posts.
+
+        Raises:
+            ValueError: If the pagination cursor is invalid.
+        """
+        if subject is not None:
+            page = self._get_paginated_posts(pagination_params, summary)
+            self._with_permissions(subject, page.items)
+            return page
+
+        _, page = self._get_public_page(pagination_params, summary)
+        # Equivalent parameters share a cached page, which echoes the parameters given
+        return page.model_copy(update={"params": pagination_params})
+
+    def _get_public_page(
+        self, pagination_params: EventPaginationParams, summary: bool
+    ) -> tuple[CacheValidator, Paginated[NewsPostDetails] | Paginated[NewsPostSummary]]:
+        """Get a page of the public feed and the version of its listing, cached together
+        in `news_feed_cache`.
+
+        The version is computed before the page, so a page is never older than the
+        version it is served with."""
+        return news_feed_cache.get_or_load(
+            ("paginate", summary, *self._feed_cache_key(pagination_params)),
+            lambda: (
+                self._get_published_validator(pagination_params),
+                self._get_paginated_posts(pagination_params, summary),
+            ),
+        )
+
+    def _feed_cache_key(self, pagination_params: EventPaginationParams) -> tuple:
+        """Normalize pagination parameters into a key of the pages they select."""
+        params = pagination_params.model_dump()
+        # Searches ignore case and punctuation between words
+        params["filter"] = " ".join(re.findall(r"\w+", params["filter"].lower()))
+        # Posts are ordered by time descending for any non-empty `ascending`
+        params["ascending"] = params["ascending"] != ""
+        return tuple(sorted(params.items()))
+
+    def _get_paginated_posts(
+        self, pagination_params: EventPaginationParams, summary: bool
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+
+        # Summaries omit each post's main story, so it is not read from the database
+        if summary:
+            statement = self._select_summaries()
+            to_model = NewsPostEntity.to_summary_model
+            paginated = Paginated[NewsPostSummary]
+        else:
+            statement = self._select_details()
+            to_model = NewsPostEntity.to_details_model
+            paginated = Paginated[NewsPostDetails]
+
+        search_query = None
         if pagination_params.filter != "":
-            query = pagination_params.filter
-
-            criteria = or_(
-                NewsPostEntity.headline.ilike(f"%{query}%"),
-                NewsPostEntity.synopsis.ilike(f"%{query}%"),
-                NewsPostEntity.main_story.ilike(f"%{query}%"),
-                exists().where(
-                    OrganizationEntity.id == NewsPostEntity.organization_id,
-                    OrganizationEntity.name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    OrganizationEntity.id == NewsPostEntity.organization_id,
-                    OrganizationEntity.slug.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    UserEntity.id == NewsPostEntity.author_id,
-                    UserEntity.first_name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    UserEntity.id == NewsPostEntity.author_id,
-                    UserEntity.last_name.ilike(f"%{query}%"),
-                ),
-                exists().where(
-                    UserEntity.id == NewsPostEntity.author_id,
-                    (UserEntity.first_name + ' ' + UserEntity.last_name).ilike(f"%{query}%"),
-                ),
+            search_query = self._search_query(pagination_params.filter)
+
+        criteria = self._published_criteria(pagination_params, search_query)
+        statement = statement.where(*criteria)
+        length_statement = (
+            select(func.count()).select_from(NewsPostEntity).where(*criteria)
+        )
+
+        # Counting every matching post is skipped for clients that opt out of totals
+        length = (
+            self._session.execute(length_statement).scalar()
+            if pagination_params.include_total
+            else None
+        )
+
+        if pagination_params.after != "" or pagination_params.before != "":
+            return self._paginate_by_cursor(
+                statement, length, pagination_params, to_model, paginated
             )
-            statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
 
         offset = pagination_params.page * pagination_params.page_size
         limit = pagination_params.page_size
 
-        if pagination_params.order_by != "":
+        if pagination_params.order_by == "rank":
+            # Most relevant posts first when searching, otherwise newest posts first
+            if search_query is not None:
+                statement = statement.order_by(
+                    func.ts_rank(NewsPostEntity.search_vector, search_query).desc()
+                )
+            statement = statement.order_by(
+                NewsPostEntity.time.desc(), NewsPostEntity.id.desc()
+            )
+        elif pagination_params.order_by != "":
             statement = (
                 statement.order_by(getattr(NewsPostEntity, pagination_params.order_by))
                 # Changed so posts descend now
@@ -225,17 +389,245 @@ class NewsPostService:
                 )
             )
 
+        # Posts ordered by time descend, so ties are broken by id to let the last post
+        # of the page serve as the cursor of the next page
+        newest_first = (
+            pagination_params.order_by == "time" and pagination_params.ascending != ""
+        )
+        if newest_first:
+            statement = statement.order_by(NewsPostEntity.id.desc())
+
         statement = statement.offset(offset).limit(limit)
 
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        entities = self._session.execute(statement).scalars().all()
+
+        next_cursor = None
+        if newest_first and len(entities) == limit:
+            next_cursor = self._cursor_of(entities[-1])
+
+        return paginated(
+            items=[to_model(entity) for entity in entities],
+            length=length,
+            params=pagination_params,
+            next_cursor=next_cursor,
+        )
+
+    def _published_criteria(
+        self,
+        pagination_params: EventPaginationParams | None = None,
+        search_query: ColumnElement | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """Criteria selecting the published posts listed by the given parameters.
+
+        Args:
+            pagination_params: parameters filtering the posts, if any.
+            search_query: the `tsquery` posts must match, if searching.
+
+        Returns:
+            list[ColumnElement[bool]]: criteria to apply to a query of `NewsPostEntity`.
+        """
+        criteria = [NewsPostEntity.state == NewsPostState.PUBLISHED]
+        if pagination_params is not None and pagination_params.range_start != "":
+            range_start = pagination_params.range_start
+            range_end = pagination_params.range_end
+            criteria.append(
+                and_(
+                    NewsPostEntity.time
+                    >= datetime.strptime(range_start, "%d/%m/%Y, %H:%M:%S"),
+                    NewsPostEntity.time
+                    <= datetime.strptime(range_end, "%d/%m/%Y, %H:%M:%S"),
+                )
+            )
+        if search_query is not None:
+            criteria.append(NewsPostEntity.search_vector.bool_op("@@")(search_query))
+        return criteria
+
+    def get_published_validator(
+        self,
+        pagination_params: EventPaginationParams | None = None,
+        subject: User | None = None,
+        summary: bool = False,
+    ) -> CacheValidator:
+        """Compute the version of the published posts, or of those listed by the given
+        parameters, with which clients revalidate their copy of the feed.
+
+        Every page of the listing shares the version of the whole listing, which also
+        digests the authors and organizations embedded in posts' details. The version of
+        the public feed is cached in `news_feed_cache` in the same entry as the posts it
+        versions, so the two are always served together.
+
+        Listings requested by a subject are not cached. They mark which posts the
+        subject can update, so their version also digests the subject and the version of
+        permissions. Since changes to permissions are not dated, such versions have no
+        `last_modified` date.
+
+        Args:
+            pagination_params: parameters filtering the posts, if any.
+            subject: the user requesting the listing, if signed in.
+            summary: whether the listing lists `NewsPostSummary`s rather than details.
+
+        Returns:
+            CacheValidator: the version of the listed posts.
+        """
+        if subject is None:
+            if pagination_params is None:
+                validator, _ = self._get_public_posts(summary)
+            else:
+                validator, _ = self._get_public_page(pagination_params, summary)
+            return validator
+        validator = self._get_published_validator(pagination_params)
+        version = f"{validator.digest}:{subject.id}:{self._permission.get_version()}"
+        return CacheValidator(digest=hashlib.sha1(version.encode()).hexdigest())
+
+    def _get_published_validator(
+        self, pagination_params: EventPaginationParams | None = None
+    ) -> CacheValidator:
+        """Compute the version of the listed posts, bypassing `news_feed_cache`."""
+        search_query = None
+        if pagination_params is not None and pagination_params.filter != "":
+            search_query = self._search_query(pagination_params.filter)
+        criteria = self._published_criteria(pagination_params, search_query)
+        return cache_validator(
+            self._session,
+            NewsPostEntity.id,
+            NewsPostEntity.modification_date,
+            *criteria,
+            dependencies=self._embedded_digests(criteria),
+        )
+
+    def get_post_validator(self, slug: str) -> CacheValidator:
+        """Compute the version of the post with a matching slug, including its author
+        and organization.
+
+        Args:
+            slug: a valid str representing a unique post slug
+
+        Returns:
+            CacheValidator: the version of the post.
+        """
+        criteria = [NewsPostEntity.slug == slug]
+        return cache_validator(
+            self._session,
+            NewsPostEntity.id,
+            NewsPostEntity.modification_date,
+            *criteria,
+            dependencies=self._embedded_digests(criteria),
+        )
+
+    def _embedded_digests(
+        self, criteria: list[ColumnElement[bool]]
+    ) -> list[ColumnElement]:
+        """Digest the authors and organizations embedded in the details of the posts
+        matching `criteria`, whose changes do not touch the posts' modification dates.
+
+        Args:
+            criteria: filters selecting the posts.
+
+        Returns:
+            list[ColumnElement]: scalar subqueries for `cache_validator`'s dependencies.
+        """
+        digests = []
+        for entity, foreign_key in (
+            (UserEntity, NewsPostEntity.author_id),
+            (OrganizationEntity, NewsPostEntity.organization_id),
+        ):
+            rows = func.string_agg(
+                func.concat_ws(":", *entity.__table__.columns),
+                aggregate_order_by(literal(","), entity.id),
+            )
+            digests.append(
+                select(func.md5(rows))
+                .where(entity.id.in_(select(foreign_key).where(*criteria)))
+                .scalar_subquery()
+            )
+        return digests
+
+    def _paginate_by_cursor(
+        self,
+        statement,
+        length: int | None,
+        pagination_params: EventPaginationParams,
+        to_model: Callable[[NewsPostEntity], NewsPostDetails | NewsPostSummary],
+        paginated: type[Paginated],
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+        """Retrieve a page of posts, newest first, by keyset on `(time, id)`.
+
+        Unlike offset pagination, the cost of retrieving a page does not grow with how
+        deep into the feed the page is, since the `(state, time, id)` index seeks directly
+        to the cursor's position. Without a cursor, the newest page is retrieved.
 
-        return Paginated(
-            items=[entity.to_details_model() for entity in entities],
+        Args:
+            statement: the select statement of posts, with filters applied.
+            length: the total number of matching posts, if counted.
+            pagination_params: parameters holding an `after` or `before` cursor, if any.
+            to_model: converts each post entity to the model returned.
+            paginated: the `Paginated` model parametrized by the model returned.
+
+        Returns:
+            Paginated: the page of posts and cursors to its neighbors.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        position = tuple_(NewsPostEntity.time, NewsPostEntity.id)
+        limit = pagination_params.page_size
+
+        if pagination_params.before == "":
+            if pagination_params.after != "":
+                cursor = PaginationCursor.decode(pagination_params.after)
+                statement = statement.where(position < (cursor.time, cursor.id))
+            statement = statement.order_by(
+                NewsPostEntity.time.desc(), NewsPostEntity.id.desc()
+            )
+            # One extra post is fetched to determine whether a next page exists
+            entities = self._session.scalars(statement.limit(limit + 1)).all()
+            has_next = len(entities) > limit
+            has_previous = pagination_params.after != ""
+            entities = entities[:limit]
+        else:
+            cursor = PaginationCursor.decode(pagination_params.before)
+            statement = statement.where(position > (cursor.time, cursor.id)).order_by(
+                NewsPostEntity.time, NewsPostEntity.id
+            )
+            entities = self._session.scalars(statement.limit(limit + 1)).all()
+            has_next, has_previous = True, len(entities) > limit
+            entities = list(reversed(entities[:limit]))
+
+        return paginated(
+            items=[to_model(entity) for entity in entities],
             length=length,
             params=pagination_params,
+            next_cursor=(
+                self._cursor_of(entities[-1]) if entities and has_next else None
+            ),
+            previous_cursor=(
+                self._cursor_of(entities[0]) if entities and has_previous else None
+            ),
         )
 
+    def _search_query(self, filter: str) -> ColumnElement:
+        """Convert the text of the feed's search box into a full-text search query.
+
+        Every word of the filter must match, and the last word matches as a prefix
+        since it is likely still being typed.
+
+        Args:
+            filter: the text being searched for.
+
+        Returns:
+            ColumnElement: a `tsquery` expression matching posts' search vectors.
+        """
+        words = re.findall(r"\w+", filter)
+        if len(words) == 0:
+            # Nothing searchable was entered, so no posts match
+            return to_tsquery("english", "")
+        terms = " & ".join(words[:-1] + [f"{words[-1]}:*"])
+        return to_tsquery("english", terms)
+
+    def _cursor_of(self, entity: NewsPostEntity) -> str:
+        """Encode the position of a post in the feed as a pagination cursor."""
+        return PaginationCursor(time=entity.time, id=entity.id).encode()
+
 
     def get_incoming(self, subject: User) -> list[NewsPostDetails]:
 
@@ -243,10 +635,12 @@ class NewsPostService:
         self._permission.enforce(subject, "news_post.incoming", f"news_post")
 
         # Select all entries in `NewsPost` table that represent incoming posts
-        query = select(NewsPostEntity).where(NewsPostEntity.state.ilike("incoming"))
+        query = self._select_details().where(NewsPostEntity.state == NewsPostState.INCOMING)
         entities = self._session.scalars(query).all()
 
-        return [entity.to_details_model() for entity in entities]
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
 
     def get_drafts(self, subject: User) -> list[NewsPostDetails]:
 
@@ -254,17 +648,83 @@ class NewsPostService:
         self._permission.enforce(subject, "news_post.drafts", f"news_post")
 
         # Select all entries in `NewsPost` table that represent incoming posts
-        query = select(NewsPostEntity).where(NewsPostEntity.state.ilike("draft"))
+        query = self._select_details().where(NewsPostEntity.state == NewsPostState.DRAFT)
         entities = self._session.scalars(query).all()
 
-        return [entity.to_details_model() for entity in entities]
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
     
-    def get_published(self) -> list[NewsPostDetails]:
+    def get_published(
+        self, summary: bool = False
+    ) -> list[NewsPostDetails] | list[NewsPostSummary]:
+
+        _, posts = self._get_public_posts(summary)
+        return list(posts)
+
+    def _get_public_posts(
+        self, summary: bool
+    ) -> tuple[CacheValidator, list[NewsPostDetails] | list[NewsPostSummary]]:
+        """Get the published posts and their version, cached together in `news_feed_cache`
+        since they are the same for every visitor."""
+        return news_feed_cache.get_or_load(
+            ("published", summary),
+            lambda: (self._get_published_validator(), self._get_published(summary)),
+        )
 
-        # Select all entries in `NewsPost` table that represent incoming posts
-        query = select(NewsPostEntity).where(NewsPostEntity.state.ilike("published"))
+    def get_latest_published(
+        self, limit: int, organization: OrganizationDetails | None = None
+    ) -> list[NewsPostDetails]:
+        """
+        Get the newest published posts, optionally only those of an organization
+
+        Args:
+            limit: the maximum number of posts to retrieve.
+            organization: the organization whose posts to retrieve, if any.
+
+        Returns:
+            list[NewsPostDetails]: the newest published posts, newest first.
+        """
+        query = self._select_details().where(*self._published_criteria())
+        if organization is not None:
+            query = query.where(NewsPostEntity.organization_id == organization.id)
+        query = query.order_by(
+            NewsPostEntity.time.desc(), NewsPostEntity.id.desc()
+        ).limit(limit)
+        entities = self._session.scalars(query).all()
+
+        return [entity.to_details_model() for entity in entities]
+
+    def get_feed_cache_statistics(self, subject: User) -> CacheStatistics:
+        """Report hits and misses of the public feed's cache.
+
+        Args:
+            subject: a valid User model representing the currently logged in User
+
+        Returns:
+            CacheStatistics: the statistics of `news_feed_cache`.
+
+        Raises:
+            UserPermissionException: If the subject may not view the statistics.
+        """
+        self._permission.enforce(subject, "news_post.cache", "news_post")
+        return news_feed_cache.statistics()
+
+    def _get_published(
+        self, summary: bool
+    ) -> list[NewsPostDetails] | list[NewsPostSummary]:
+
+        # Select all entries in `NewsPost` table that represent published posts, loading
+        # each distinct author and organization once since the list is unbounded
+        if summary:
+            query = self._select_summaries(selectinload)
+        else:
+            query = self._select_details(selectinload)
+        query = query.where(*self._published_criteria())
         entities = self._session.scalars(query).all()
 
+        if summary:
+            return [entity.to_summary_model() for entity in entities]
         return [entity.to_details_model() for entity in entities]
     
     def get_archived(self, subject: User) -> list[NewsPostDetails]:
@@ -273,10 +733,12 @@ class NewsPostService:
         self._permission.enforce(subject, "news_post.archived", f"news_post")
 
         # Select all entries in `NewsPost` table that represent incoming posts
-        query = select(NewsPostEntity).where(NewsPostEntity.state.ilike("archived"))
+        query = self._select_details().where(NewsPostEntity.state == NewsPostState.ARCHIVED)
         entities = self._session.scalars(query).all()
 
-        return [entity.to_details_model() for entity in entities]
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
     
     def get_posts_by_organization(
         self, organization: OrganizationDetails, subject: User | None = None
@@ -291,16 +753,20 @@ class NewsPostService:
         Returns:
             list[NewsPostDetails]: a list of valid NewsPostDetail models
         """
-        # Query the posts with matching organization id
+        # Query the posts with matching organization id, newest first
         entities = (
             self._session.query(NewsPostEntity)
+            .options(*self._details_options())
             .filter(NewsPostEntity.organization_id == organization.id)
-            .where(NewsPostEntity.state.ilike("published"))
+            .where(NewsPostEntity.state == NewsPostState.PUBLISHED)
+            .order_by(NewsPostEntity.time.desc(), NewsPostEntity.id.desc())
             .all()
         )
 
         # Convert entities to models and return
-        return [entity.to_details_model() for entity in entities]
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
     
     def get_posts_by_user(
         self, author: User, subject: User | None = None
@@ -325,16 +791,182 @@ class NewsPostService:
                 f"user/{author.id}",
             )
 
-        # Query the posts with matching author id
+        # Query the posts with matching author id, newest first
         entities = (
             self._session.query(NewsPostEntity)
+            .options(*self._details_options())
             .filter(NewsPostEntity.author_id == author.id)
-            .where(NewsPostEntity.state.ilike("published"))
+            .where(NewsPostEntity.state == NewsPostState.PUBLISHED)
+            .order_by(NewsPostEntity.time.desc(), NewsPostEntity.id.desc())
             .all()
         )
 
         # Convert entities to models and return
-        return [entity.to_details_model() for entity in entities]
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
+
+    def get_paginated_posts_by_organization(
+        self,
+        organization: OrganizationDetails,
+        pagination_params: EventPaginationParams,
+        summary: bool = False,
+        subject: User | None = None,
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+        """
+        Get a page of the published posts by an organization, newest first
+
+        Pages are retrieved by the `after` and `before` cursors of neighboring pages,
+        and the total is the organization's cached post count.
+
+        Args:
+            organization: the organization whose posts to retrieve.
+            pagination_params: parameters selecting the page of posts.
+            summary: whether to list `NewsPostSummary`s rather than details.
+            subject: The User making the request.
+
+        Returns:
+            Paginated: the page of posts and cursors to its neighbors.
+
+        Raises:
+            ValueError: If the pagination cursor is invalid.
+        """
+        length = (
+            self.count_posts_by_organization(organization)
+            if pagination_params.include_total
+            else None
+        )
+        page = self._paginate_posts_where(
+            pagination_params,
+            summary,
+            length,
+            NewsPostEntity.organization_id == organization.id,
+        )
+        self._with_permissions(subject, page.items)
+        return page
+
+    def get_paginated_posts_by_user(
+        self,
+        author: User,
+        subject: User,
+        pagination_params: EventPaginationParams,
+        summary: bool = False,
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+        """
+        Get a page of the published posts by a user, newest first
+
+        Pages are retrieved by the `after` and `before` cursors of neighboring pages.
+
+        Args:
+            author: the user whose posts to retrieve.
+            subject: The User making the request.
+            pagination_params: parameters selecting the page of posts.
+            summary: whether to list `NewsPostSummary`s rather than details.
+
+        Returns:
+            Paginated: the page of posts and cursors to its neighbors.
+
+        Raises:
+            UserPermissionException: If the subject may not view the user's posts.
+            ValueError: If the pagination cursor is invalid.
+        """
+        if subject.id != author.id:
+            self._permission.enforce(subject, "user.posts", f"user/{author.id}")
+
+        by_author = NewsPostEntity.author_id == author.id
+        length = (
+            self._session.scalar(
+                select(func.count())
+                .select_from(NewsPostEntity)
+                .where(by_author, *self._published_criteria())
+            )
+            if pagination_params.include_total
+            else None
+        )
+        page = self._paginate_posts_where(pagination_params, summary, length, by_author)
+        self._with_permissions(subject, page.items)
+        return page
+
+    def count_posts_by_organization(self, organization: OrganizationDetails) -> int:
+        """
+        Count the published posts by an organization
+
+        Counts are shown on every visit to an organization's profile, so they are
+        cached in `news_feed_cache` until posts are next written.
+
+        Args:
+            organization: the organization whose posts to count.
+
+        Returns:
+            int: the number of published posts by the organization.
+        """
+
+        def count() -> int:
+            statement = (
+                select(func.count())
+                .select_from(NewsPostEntity)
+                .where(
+                    NewsPostEntity.organization_id == organization.id,
+                    *self._published_criteria(),
+                )
+            )
+            return self._session.scalar(statement)
+
+        return news_feed_cache.get_or_load(
+            ("organization_count", organization.id), count
+        )
+
+    def _with_permissions(
+        self,
+        subject: User | None,
+        posts: list[NewsPostDetails] | list[NewsPostSummary],
+    ) -> list[NewsPostDetails] | list[NewsPostSummary]:
+        """
+        Record which posts the subject may update
+
+        Authors may update their own drafts and incoming posts, while updating any
+        other post requires permission, which is checked for every post at once.
+
+        Args:
+            subject: The User making the request, if signed in.
+            posts: the posts to record the subject's permissions on.
+
+        Returns:
+            list: the posts, with `can_update` set.
+        """
+        if subject is None or len(posts) == 0:
+            return posts
+        allowed = self._permission.check_many(
+            subject, "news_post.update", [f"news_post/{post.slug}" for post in posts]
+        )
+        for post, may_update in zip(posts, allowed):
+            post.can_update = may_update or (
+                post.author_id == subject.id
+                and post.state in (NewsPostState.DRAFT, NewsPostState.INCOMING)
+            )
+        return posts
+
+    def _paginate_posts_where(
+        self,
+        pagination_params: EventPaginationParams,
+        summary: bool,
+        length: int | None,
+        *criteria: ColumnElement[bool],
+    ) -> Paginated[NewsPostDetails] | Paginated[NewsPostSummary]:
+        """Retrieve a page of the published posts matching `criteria` by keyset."""
+        if summary:
+            statement = self._select_summaries()
+            to_model = NewsPostEntity.to_summary_model
+            paginated = Paginated[NewsPostSummary]
+        else:
+            statement = self._select_details()
+            to_model = NewsPostEntity.to_details_model
+            paginated = Paginated[NewsPostDetails]
+
+        statement = statement.where(*criteria, *self._published_criteria())
+        return self._paginate_by_cursor(
+            statement, length, pagination_params, to_model, paginated
+        )
     
     def get_drafts_by_user(
         self, author: User, subject: User | None = None
@@ -362,11 +994,13 @@ class NewsPostService:
         # Query the posts with matching author id
         entities = (
             self._session.query(NewsPostEntity)
+            .options(*self._details_options())
             .filter(NewsPostEntity.author_id == author.id)
-            .where(NewsPostEntity.state.ilike("draft"))
+            .where(NewsPostEntity.state == NewsPostState.DRAFT)
             .all()
         )
 
         # Convert entities to models and return
-        return [entity.to_details_model() for entity in entities]
-    
\ No newline at end of file
+        return self._with_permissions(
+            subject, [entity.to_details_model() for entity in entities]
+        )
@@ -0,0 +1,45 @@
+"""
+The News Post Scheduler publishes scheduled news posts in the background once their
+publication time arrives.
+"""
+
+import logging
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from .news_post import NewsPostService
+from .periodic_worker import PeriodicWorker
+from .permission import PermissionService
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+
+class NewsPostScheduler(PeriodicWorker[list[int]]):
+    """Background worker periodically publishing every scheduled post which is due."""
+
+    thread_name = "news-post-scheduler"
+    failure_message = "Failed to publish scheduled news posts"
+
+    def __init__(self, session_factory: Callable[[], Session], interval: float = 60.0):
+        """Initializes the scheduler to check for due posts every `interval` seconds"""
+        super().__init__(session_factory, interval)
+
+    def run_once(self) -> list[int]:
+        """
+        Publish the posts which are due
+
+        Returns:
+            list[int]: ids of the posts published.
+        """
+        with self._session_factory() as session:
+            news_service = NewsPostService(session, PermissionService(session))
+            return news_service.publish_due_posts()
+
+    def _completed(self, published: list[int]) -> None:
+        if len(published) > 0:
+            logger.info("Published scheduled news posts %s", published)
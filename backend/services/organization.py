@@ -10,8 +10,10 @@ from ..database import db_session
 from ..models.organization import Organization
 from ..models.organization_details import OrganizationDetails
 from ..entities.organization_entity import OrganizationEntity
+from ..entities.news_post_entity import NewsPostEntity
 from ..models import User
 from .permission import PermissionService
+from .news_post import news_feed_cache
 
 from .exceptions import ResourceNotFoundException
 
@@ -143,6 +145,9 @@ class OrganizationService:
                 f"No organization found with matching ID: {organization.id}"
             )
 
+        # Posts embed the organization's name and slug in their search documents
+        renamed = obj.name != organization.name or obj.slug != organization.slug
+
         # Update organization object
         obj.name = organization.name
         obj.shorthand = organization.shorthand
@@ -158,8 +163,16 @@ class OrganizationService:
         obj.heel_life = organization.heel_life
         obj.public = organization.public
 
+        if renamed:
+            self._session.flush()
+            NewsPostEntity.refresh_search_vectors(
+                self._session, NewsPostEntity.organization_id == obj.id
+            )
+
         # Save changes
         self._session.commit()
+        # Posts in the public feed embed their organization's details
+        news_feed_cache.clear()
 
         # Return updated object
         return obj.to_model()
@@ -196,3 +209,4 @@ class OrganizationService:
         self._session.delete(obj)
         # Save changes
         self._session.commit()
+        news_feed_cache.clear()
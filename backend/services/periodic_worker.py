@@ -0,0 +1,71 @@
+"""
+Periodic workers run a unit of background work on a daemon thread every interval, for as
+long as the application is served, with sessions of their own.
+"""
+
+import logging
+import threading
+from typing import Callable, Generic, TypeVar
+
+from sqlalchemy.orm import Session
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PeriodicWorker(Generic[T]):
+    """Background worker calling `run_once` every `interval` seconds until stopped.
+
+    Subclasses implement `run_once`, name their thread with `thread_name`, and may report
+    the results of each run by overriding `_completed`."""
+
+    thread_name = "periodic-worker"
+
+    # Logged, with the exception, when a run fails
+    failure_message = "Periodic worker failed"
+
+    def __init__(self, session_factory: Callable[[], Session], interval: float):
+        """Initializes the worker to run every `interval` seconds"""
+        self._session_factory = session_factory
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> T:
+        """Run the worker's unit of work once."""
+        raise NotImplementedError()
+
+    def start(self) -> None:
+        """Start running on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=self.thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop running, waiting for a run in progress to finish."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def _completed(self, result: T) -> None:
+        """Report the result of a run."""
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._completed(self.run_once())
+            except Exception:
+                # A failed run, e.g. while the database restarts, is retried next interval
+                logger.exception(self.failure_message)
+            self._stopped.wait(self._interval)
@@ -8,22 +8,43 @@ exposed via the API.
 import re
 from fastapi import Depends
 from functools import lru_cache
-from sqlalchemy import select
+from typing import Iterable, Sequence
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
-from ..entities import UserEntity, PermissionEntity, RoleEntity
+from ..entities import (
+    UserEntity,
+    PermissionEntity,
+    PermissionVersionEntity,
+    RoleEntity,
+    user_role_table,
+)
 from ..services.exceptions import UserPermissionException
+from .cache import TTLCache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Permissions of each subject, keyed by the version of permissions they were loaded at
+# and the subject's id. Changes to permissions increment the version, so processes
+# stop reading the entries of earlier versions, which age out of the cache.
+permission_cache: TTLCache[tuple[Permission, ...]] = TTLCache(maxsize=1024, ttl=300)
+
 
 class PermissionService:
-    """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system."""
+    """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system.
+
+    FastAPI injects a single PermissionService into every service of a request, so the
+    version of permissions is read once per request, and the permissions of each subject
+    at that version are read from `permission_cache` by every check.
+    """
 
     _session: Session
+    _version: int | None
+    _permissions: dict[int | None, tuple[Permission, ...]]
+    _permission_sets: dict[int | None, "CompiledPermissionSet"]
 
     def __init__(self, session: Session = Depends(db_session)):
         """Initialize a new PermissionService instance.
@@ -31,6 +52,9 @@ class PermissionService:
         Args:
             session (Session): The SQLAlchemy session to use for database operations."""
         self._session = session
+        self._version = None
+        self._permissions = {}
+        self._permission_sets = {}
 
     def get_permissions(self, subject: User) -> list[Permission]:
         """Get the permissions for a user.
@@ -40,10 +64,27 @@ class PermissionService:
 
         Returns:
             list[Permission]: The permissions for the user."""
-        user_permissions = self._get_user_permissions(subject)
-        roles_permissions = self._get_user_roles_permissions(subject)
-        permissions = user_permissions + roles_permissions
-        return [permission.to_model() for permission in permissions]
+        return list(self._get_permissions(subject))
+
+    def get_version(self) -> int:
+        """Get the version of permissions, which changes whenever the permissions or roles
+        of any user change. The version is read once per request.
+
+        Returns:
+            int: The current version of permissions."""
+        if self._version is None:
+            self._version = PermissionVersionEntity.current(self._session)
+        return self._version
+
+    def invalidate(self) -> None:
+        """Invalidate the permissions cached for every subject by every process.
+
+        Must be called by the transaction changing which permissions or roles users have,
+        before it is committed, so the change and the new version commit together."""
+        PermissionVersionEntity.increment(self._session)
+        self._version = None
+        self._permissions.clear()
+        self._permission_sets.clear()
 
     def grant(
         self, grantor: User, grantee: User | Role | RoleDetails, permission: Permission
@@ -82,6 +123,7 @@ class PermissionService:
             raise ValueError("grantee must be User or Role")
 
         self._session.add(permission_entity)
+        self.invalidate()
         self._session.commit()
         return True
 
@@ -109,6 +151,7 @@ class PermissionService:
         self.enforce(revoker, permission_entity.action, permission_entity.resource)
 
         self._session.delete(permission_entity)
+        self.invalidate()
         self._session.commit()
         return True
 
@@ -138,96 +181,182 @@ class PermissionService:
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
+        return self._get_permission_set(subject).allows(action, resource)
 
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
+    def check_many(
+        self, subject: User, action: str, resources: Sequence[str]
+    ) -> list[bool]:
+        """Check which of many resources a user has permission to carry out an action on.
 
-    def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
-        """Get the permissions for a user.
+        The subject's permissions allowing the action are combined once, and every
+        resource is matched against them in a single pass.
 
         Args:
-            subject (User): The user to get permissions for.
+            subject (User): The user to check permissions for.
+            action (str): The action in question.
+            resources (Sequence[str]): The resources in question.
 
         Returns:
-            list[PermissionEntity]: The permissions for the user."""
-        user_query = select(PermissionEntity).where(
-            PermissionEntity.user_id == subject.id
-        )
-        user_perms = [p for p in self._session.execute(user_query).scalars()]
-        return user_perms
+            list[bool]: Whether the user has permission to carry out the action on each resource, in order.
+        """
+        return self._get_permission_set(subject).allows_many(action, resources)
+
+    def _get_permissions(self, subject: User) -> tuple[Permission, ...]:
+        """Get the permissions granted to a user and to the user's roles.
 
-    def _get_user_roles_permissions(self, subject: User) -> list[PermissionEntity]:
-        """Get the permissions for a user's roles.
+        Both are loaded by a single query when not cached at the current version of
+        permissions, which is read once per request.
 
         Args:
             subject (User): The user to get permissions for.
 
         Returns:
-            list[PermissionEntity]: The permissions for the user's roles."""
-        user_entity = self._session.get(UserEntity, subject.id)
-        if user_entity == None:
-            return []
-        role_ids = [role.id for role in user_entity.roles]
-        if len(role_ids) == 0:
-            return []
-        role_query = select(PermissionEntity).where(
-            PermissionEntity.role_id.in_(role_ids)
+            tuple[Permission, ...]: The user's own permissions followed by the user's roles' permissions.
+        """
+        permissions = self._permissions.get(subject.id)
+        if permissions is None:
+            permissions = permission_cache.get_or_load(
+                (self.get_version(), subject.id),
+                lambda: self._load_permissions(subject),
+            )
+            self._permissions[subject.id] = permissions
+        return permissions
+
+    def _load_permissions(self, subject: User) -> tuple[Permission, ...]:
+        """Load the permissions granted to a user and to the user's roles in one query."""
+        role_ids = select(user_role_table.c.role_id).where(
+            user_role_table.c.user_id == subject.id
+        )
+        query = (
+            select(PermissionEntity)
+            .where(
+                or_(
+                    PermissionEntity.user_id == subject.id,
+                    PermissionEntity.role_id.in_(role_ids),
+                )
+            )
+            .order_by(PermissionEntity.user_id.is_(None), PermissionEntity.id)
+        )
+        return tuple(
+            permission.to_model() for permission in self._session.scalars(query)
         )
-        return [p for p in self._session.execute(role_query).scalars()]
 
-    def _has_permission(
-        self, permissions: list[PermissionEntity], action: str, resource: str
-    ) -> bool:
-        """Check if a user has permission to carry out an action on a resource in a list of permissions.
+    def _get_permission_set(self, subject: User) -> "CompiledPermissionSet":
+        """Get the compiled set of the permissions granted to a user and the user's roles."""
+        permission_set = self._permission_sets.get(subject.id)
+        if permission_set is None:
+            permission_set = compile_permissions(self._get_permissions(subject))
+            self._permission_sets[subject.id] = permission_set
+        return permission_set
+
+
+class CompiledPermissionSet:
+    """A set of permissions compiled for checks which do not scan each permission.
+
+    Permissions' action and resource patterns are globs, in which `*` matches any
+    text. The first check of an action combines the resource patterns of every
+    permission whose action pattern matches it into a single regular expression, so
+    later checks of the action are a dictionary lookup and a single match.
+
+    Sets are immutable and shared by every subject holding the same permissions, see
+    `compile_permissions`."""
+
+    def __init__(self, permissions: Iterable[tuple[str, str]]):
+        """Initialize a set of `(action, resource)` permission patterns.
+
+        Args:
+            permissions (Iterable[tuple[str, str]]): The action and resource pattern of each permission.
+        """
+        self._permissions = tuple(permissions)
+        self._resources_by_action: dict[str, re.Pattern | None] = {}
+
+    def allows(self, action: str, resource: str) -> bool:
+        """Check if any permission of the set allows carrying out an action on a resource.
 
         Args:
-            permissions (list[PermissionEntity]): The permissions to check.
             action (str): The action in question.
             resource (str): The resource in question.
 
         Returns:
-            bool: True if the user has permission to carry out the action on the resource, False otherwise.
-        """
-        for permission in permissions:
-            if self._check_permission(permission, action, resource):
-                return True
-        return False
+            bool: True if the action is allowed on the resource, False otherwise."""
+        return self.allows_many(action, [resource])[0]
 
-    def _check_permission(
-        self, permission: PermissionEntity, action: str, resource: str
-    ) -> bool:
-        """Check if a user has permission to carry out an action on a resource.
+    def allows_many(self, action: str, resources: Sequence[str]) -> list[bool]:
+        """Check which of many resources the set allows carrying out an action on.
 
         Args:
-            permission (PermissionEntity): The permission to check.
             action (str): The action in question.
-            resource (str): The resource in question.
+            resources (Sequence[str]): The resources in question.
 
         Returns:
-            bool: True if the user has permission to carry out the action on the resource, False otherwise.
-        """
-        action_re = self._expand_pattern(permission.action)
-        if action_re.fullmatch(action) is not None:
-            resource_re = self._expand_pattern(permission.resource)
-            return resource_re.fullmatch(resource) is not None
+            list[bool]: Whether the action is allowed on each resource, in order."""
+        if action in self._resources_by_action:
+            pattern = self._resources_by_action[action]
         else:
-            return False
+            # Sets are shared between threads, which at worst compile an action twice
+            pattern = self._compile_resources(action)
+            self._resources_by_action[action] = pattern
+        if pattern is None:
+            return [False] * len(resources)
+        return [pattern.fullmatch(resource) is not None for resource in resources]
+
+    def _compile_resources(self, action: str) -> re.Pattern | None:
+        """Combine the resource patterns of the permissions allowing an action, if any."""
+        resources = [
+            resource
+            for action_pattern, resource in self._permissions
+            if _expand_pattern(action_pattern).fullmatch(action) is not None
+        ]
+        if len(resources) == 0:
+            return None
+        if "*" in resources:
+            # A catch-all resource subsumes every other resource
+            return _expand_pattern("*")
+        alternatives = "|".join(
+            f"(?:{_glob_to_regex(resource)})" for resource in dict.fromkeys(resources)
+        )
+        return re.compile(alternatives)
 
-    @lru_cache()
-    def _expand_pattern(self, pattern: str) -> re.Pattern:
-        """Expand a permission pattern into a regular expression.
 
-        This function is memoized to avoid recompiling the same regular expression multiple times.
+def compile_permissions(permissions: Iterable[Permission]) -> CompiledPermissionSet:
+    """Compile permissions into a `CompiledPermissionSet`.
 
-        Args:
-            pattern (str): The pattern to expand.
+    Compiled sets are cached process-wide by the patterns they hold, so subjects sharing
+    the same grants, such as members of the same roles, share a compiled set.
 
-        Returns:
-            re.Pattern: The compiled regular expression."""
-        search = pattern.replace("*", ".*")
-        return re.compile(f"^{search}$")
+    Args:
+        permissions (Iterable[Permission]): The permissions to compile.
+
+    Returns:
+        CompiledPermissionSet: The compiled permissions."""
+    fingerprint = tuple(
+        sorted({(permission.action, permission.resource) for permission in permissions})
+    )
+    return _compile_permission_set(fingerprint)
+
+
+@lru_cache(maxsize=1024)
+def _compile_permission_set(
+    fingerprint: tuple[tuple[str, str], ...]
+) -> CompiledPermissionSet:
+    """Compile the sorted, distinct `(action, resource)` patterns of a permission set."""
+    return CompiledPermissionSet(fingerprint)
+
+
+@lru_cache(maxsize=1024)
+def _expand_pattern(pattern: str) -> re.Pattern:
+    """Expand a permission pattern into a regular expression.
+
+    This function is memoized to avoid recompiling the same regular expression multiple times.
+
+    Args:
+        pattern (str): The pattern to expand.
+
+    Returns:
+        re.Pattern: The compiled regular expression."""
+    return re.compile(f"^{_glob_to_regex(pattern)}$")
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a permission pattern into the source of a regular expression."""
+    return pattern.replace("*", ".*")
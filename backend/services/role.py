@@ -119,6 +119,7 @@ class RoleService:
         user = self._session.get(UserEntity, member.id)
         if user:
             role.users.append(user)
+            self._permission.invalidate()
             self._session.commit()
         return self.details(subject, id)
 
@@ -151,5 +152,6 @@ class RoleService:
         role = self._session.get(RoleEntity, id)
         user = self._session.get(UserEntity, userId)
         role.users.remove(user)
+        self._permission.invalidate()
         self._session.commit()
         return True
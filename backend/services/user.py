@@ -8,14 +8,22 @@ from sqlalchemy import select, or_, func, cast, String
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, UserDetails, Paginated, PaginationParams
-from ..entities import UserEntity
+from ..entities import UserEntity, NewsPostEntity
 from .exceptions import ResourceNotFoundException
 from .permission import PermissionService
+from .news_post import news_feed_cache
+from .cache import TTLCache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+# Every authenticated request resolves its user by PID, so users are briefly cached.
+# Writes through this process evict the user, while other processes may serve a user's
+# previous profile until it expires. Unknown PIDs are not cached, so users registered
+# through any process are found at once.
+registered_user_cache: TTLCache[User] = TTLCache(maxsize=1024, ttl=30)
+
 
 class UserService:
     _session: Session
@@ -50,6 +58,34 @@ class UserService:
             user_details = UserDetails(**user_fields)
             return user_details
 
+    def get_by_pid(self, pid: int) -> User | None:
+        """Get a User, without their permissions, by PID.
+
+        Users are served from `registered_user_cache` when possible. Permissions are
+        left to be loaded by `PermissionService` if the request checks any.
+
+        Args:
+            pid: The PID of the user.
+
+        Returns:
+            User | None: The user or None if not found.
+        """
+
+        def load() -> User:
+            query = select(UserEntity).where(UserEntity.pid == pid)
+            user_entity: UserEntity | None = self._session.scalar(query)
+            if user_entity is None:
+                # Raised rather than returned, so that the miss is not cached
+                raise ResourceNotFoundException(f"User with PID {pid} not found")
+            return user_entity.to_model()
+
+        try:
+            user = registered_user_cache.get_or_load(pid, load)
+        except ResourceNotFoundException:
+            return None
+        # Callers may modify the user, which must not modify the cached user
+        return user.model_copy()
+
     def get_by_id(self, id: int) -> User:
         """Get a User by their id.
 
@@ -180,6 +216,21 @@ class UserService:
         if subject != user:
             self._permission.enforce(subject, "user.update", f"user/{user.id}")
         entity = self._session.get(UserEntity, user.id)
+        # Posts embed their author's name in their search documents and feeds
+        renamed = (entity.first_name, entity.last_name) != (
+            user.first_name,
+            user.last_name,
+        )
         entity.update(user)
+        if renamed:
+            self._session.flush()
+            NewsPostEntity.refresh_search_vectors(
+                self._session, NewsPostEntity.author_id == entity.id
+            )
         self._session.commit()
+        # The public feed shows its authors' names, while their other details are
+        # refreshed once cached pages expire
+        if renamed:
+            news_feed_cache.clear()
+        registered_user_cache.discard(entity.pid)
         return entity.to_model()
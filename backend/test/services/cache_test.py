@@ -0,0 +1,85 @@
+"""Tests for the TTLCache class."""
+
+# Tested Dependencies
+from ...services.cache import TTLCache
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class FakeClock:
+    """Clock advanced manually by tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_or_load_caches_value():
+    cache = TTLCache(maxsize=2, ttl=10)
+    assert cache.get_or_load("key", lambda: 1) == 1
+    assert cache.get_or_load("key", lambda: 2) == 1
+    statistics = cache.statistics()
+    assert statistics.hits == 1
+    assert statistics.misses == 1
+    assert statistics.size == 1
+
+
+def test_get_or_load_expires_value():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.get_or_load("key", lambda: 1)
+    clock.now = 10
+    assert cache.get_or_load("key", lambda: 2) == 2
+    assert cache.statistics().misses == 2
+
+
+def test_get_or_load_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.get_or_load("a", lambda: 1)
+    cache.get_or_load("b", lambda: 2)
+    cache.get_or_load("a", lambda: 3)
+    cache.get_or_load("c", lambda: 4)
+    assert cache.get_or_load("a", lambda: 5) == 1
+    assert cache.get_or_load("b", lambda: 6) == 6
+
+
+def test_clear_invalidates_values():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.get_or_load("key", lambda: 1)
+    cache.clear()
+    assert cache.get_or_load("key", lambda: 2) == 2
+
+
+def test_discard_invalidates_value():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.get_or_load("key", lambda: 1)
+    cache.get_or_load("other", lambda: 2)
+    cache.discard("key")
+    assert cache.get_or_load("key", lambda: 3) == 3
+    assert cache.get_or_load("other", lambda: 4) == 2
+
+
+def test_value_loaded_during_clear_not_cached():
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    def load() -> int:
+        # A write clears the cache while the value is being read
+        cache.clear()
+        return 1
+
+    assert cache.get_or_load("key", load) == 1
+    assert cache.get_or_load("key", lambda: 2) == 2
+
+
+def test_reset_statistics():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.get_or_load("key", lambda: 1)
+    cache.reset()
+    statistics = cache.statistics()
+    assert statistics.hits == 0
+    assert statistics.misses == 0
+    assert statistics.size == 0
@@ -1,14 +1,21 @@
 """Shared pytest fixtures for database dependent tests."""
 
 import pytest
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
-from sqlalchemy import create_engine, text, Engine
+from sqlalchemy import create_engine, event, text, Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from ... import database
 from ...database import _engine_str
 from ...env import getenv
 from ... import entities
+from ...services.news_post import news_feed_cache
+from ...services.permission import permission_cache
+from ...services.user import registered_user_cache
 
 POSTGRES_DATABASE = f'{getenv("POSTGRES_DATABASE")}_test'
 POSTGRES_USER = getenv("POSTGRES_USER")
@@ -44,15 +51,62 @@ def reset_database():
 @pytest.fixture(scope="session")
 def test_engine() -> Engine:
     reset_database()
-    return create_engine(_engine_str(POSTGRES_DATABASE))
+    return database.create_engine(POSTGRES_DATABASE, echo=False)
 
 
 @pytest.fixture(scope="function")
 def session(test_engine: Engine):
     entities.EntityBase.metadata.drop_all(test_engine)
     entities.EntityBase.metadata.create_all(test_engine)
+    # Cached values were loaded from the previous test's database
+    news_feed_cache.reset()
+    permission_cache.reset()
+    registered_user_cache.reset()
     session = Session(test_engine)
     try:
         yield session
     finally:
         session.close()
+
+
+@contextmanager
+def count_statements(session: Session) -> Iterator[list[str]]:
+    """Collect the SQL statements executed through the session's engine."""
+    statements: list[str] = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def query_budget(session: Session) -> Callable[[int], Iterator[list[str]]]:
+    """Fail the test when the service call within a `with query_budget(n):` block
+    executes more than `n` SQL statements.
+
+    Budgets catch N+1 queries introduced by lazily loaded relationships, which would
+    otherwise go unnoticed until listings grow. The failure lists the statement the call
+    repeated most, which is usually the relationship loaded once per row."""
+
+    @contextmanager
+    def budget(statements: int) -> Iterator[list[str]]:
+        with count_statements(session) as executed:
+            yield executed
+        if len(executed) > statements:
+            repeated, times = Counter(executed).most_common(1)[0]
+            pytest.fail(
+                f"Executed {len(executed)} SQL statements, over the budget of "
+                f"{statements}. The statement executed most ({times} times) was:\n"
+                f"{repeated}",
+                pytrace=False,
+            )
+
+    return budget
@@ -44,11 +44,13 @@ __license__ = "MIT"
 
 def test_get_current_reservations_for_user_as_user(
     reservation_svc: ReservationService,
+    query_budget,
 ):
     """Get reservations for each user _as the user themself_."""
-    reservations = reservation_svc.get_current_reservations_for_user(
-        user_data.user, user_data.user
-    )
+    with query_budget(3):
+        reservations = reservation_svc.get_current_reservations_for_user(
+            user_data.user, user_data.user
+        )
     assert len(reservations) == 3
     assert reservations[0].id == reservation_data.reservation_1.id
 
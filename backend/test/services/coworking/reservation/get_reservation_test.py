@@ -39,11 +39,13 @@ __license__ = "MIT"
 
 def test_get_reservation(
     reservation_svc: ReservationService,
+    query_budget,
 ):
     """Get an existing reservation as a user party to the reservation."""
-    reservation: Reservation = reservation_svc.get_reservation(
-        user_data.user, reservation_data.reservation_1.id
-    )
+    with query_budget(4):
+        reservation: Reservation = reservation_svc.get_reservation(
+            user_data.user, reservation_data.reservation_1.id
+        )
     assert reservation.id == reservation_data.reservation_1.id
     assert reservation.start == reservation_data.reservation_1.start
     assert user_data.user.id in [u.id for u in reservation.users]
@@ -35,8 +35,11 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def test_list_all_active_and_upcoming_for_xl(reservation_svc: ReservationService):
-    all = reservation_svc.list_all_active_and_upcoming_for_xl(user_data.ambassador)
+def test_list_all_active_and_upcoming_for_xl(
+    reservation_svc: ReservationService, query_budget
+):
+    with query_budget(4):
+        all = reservation_svc.list_all_active_and_upcoming_for_xl(user_data.ambassador)
     assert len(all) == len(reservation_data.active_reservations) + len(
         reservation_data.confirmed_reservations
     )
@@ -83,15 +83,17 @@ def test_seat_availability_truncate_start(
 
 def test_seat_availability_while_completely_open(
     reservation_svc: ReservationService,
+    query_budget,
 ):
     """All reservable seats should be available."""
     tomorrow = TimeRange(
         start=operating_hours_data.future.start,
         end=operating_hours_data.future.start + ONE_HOUR,
     )
-    available_seats = reservation_svc.seat_availability(
-        seat_data.reservable_seats, tomorrow
-    )
+    with query_budget(2):
+        available_seats = reservation_svc.seat_availability(
+            seat_data.reservable_seats, tomorrow
+        )
     assert len(available_seats) == len(seat_data.reservable_seats)
 
 
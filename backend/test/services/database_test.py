@@ -0,0 +1,179 @@
+"""Tests for the database engine factory and its instrumented connection pool."""
+
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import Request, Response
+from sqlalchemy import Engine, select, text
+from sqlalchemy.exc import OperationalError, TimeoutError
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ...database import (
+    InstrumentedQueuePool,
+    ReadYourWrites,
+    RoutingSession,
+    create_engine,
+    reads_from_replica,
+)
+from ...entities import EntityBase, RoleEntity
+
+from .conftest import POSTGRES_DATABASE
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+POSTGRES_REPLICA_DATABASE = f"{POSTGRES_DATABASE}_replica"
+
+
+def test_create_engine_options():
+    """Test that options override the engine's configuration."""
+    engine = create_engine(POSTGRES_DATABASE, pool_size=3, max_overflow=1, echo=False)
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    statistics = engine.pool.statistics("primary")
+    assert statistics.size == 3
+    assert statistics.max_overflow == 1
+    assert engine.echo is False
+    engine.dispose()
+
+
+def engine_like(test_engine: Engine, **options) -> Engine:
+    """Create an engine of the test database, which `test_engine` has (re)created."""
+    url = test_engine.url.render_as_string(hide_password=False)
+    return create_engine(url=url, echo=False, **options)
+
+
+def test_statement_timeout(test_engine: Engine, monkeypatch: pytest.MonkeyPatch):
+    """Test that statements running longer than the statement timeout are cancelled."""
+    monkeypatch.setenv("POSTGRES_STATEMENT_TIMEOUT", "100")
+    engine = engine_like(test_engine)
+    with engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT pg_sleep(1)"))
+    engine.dispose()
+
+
+def test_pool_saturation_times_out(test_engine: Engine):
+    """Test that a checkout times out once every connection is checked out."""
+    engine = engine_like(test_engine, pool_size=1, max_overflow=0, pool_timeout=0.2)
+    with engine.connect():
+        with pytest.raises(TimeoutError):
+            engine.connect()
+    statistics = engine.pool.statistics("primary")
+    assert statistics.checkouts == 1
+    assert statistics.timeouts == 1
+    assert statistics.wait_seconds_max >= 0.2
+    engine.dispose()
+
+
+def test_pool_saturation_queues_requests(test_engine: Engine):
+    """Test that a burst of requests larger than the pool waits for connections, and
+    every request completes within the pool timeout."""
+    pool_size, requests = 2, 16
+    engine = engine_like(
+        test_engine, pool_size=pool_size, max_overflow=0, pool_timeout=10
+    )
+    barrier = threading.Barrier(requests)
+    peak = 0
+    peak_lock = threading.Lock()
+
+    def request(_: int) -> None:
+        nonlocal peak
+        barrier.wait()
+        with engine.connect() as connection:
+            with peak_lock:
+                peak = max(peak, engine.pool.checkedout())
+            connection.execute(text("SELECT pg_sleep(0.05)"))
+
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        list(executor.map(request, range(requests)))
+
+    statistics = engine.pool.statistics("primary")
+    assert peak == pool_size
+    assert statistics.checkouts == requests
+    assert statistics.timeouts == 0
+    # Requests queued behind at least one round of the pool's connections
+    assert statistics.wait_seconds_max >= 0.05
+    assert statistics.wait_seconds_max < 10
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def replica_engine(test_engine: Engine):
+    """Engine of a second database standing in for a replica of the test database."""
+    with test_engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.execute(text(f"DROP DATABASE IF EXISTS {POSTGRES_REPLICA_DATABASE}"))
+        connection.execute(text(f"CREATE DATABASE {POSTGRES_REPLICA_DATABASE}"))
+    engine = create_engine(POSTGRES_REPLICA_DATABASE, echo=False)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def replica(session: Session, replica_engine: Engine):
+    """Replica holding a role which the primary does not."""
+    EntityBase.metadata.drop_all(replica_engine)
+    EntityBase.metadata.create_all(replica_engine)
+    with Session(replica_engine) as replica_session:
+        replica_session.add(RoleEntity(name="replica"))
+        replica_session.commit()
+    session.add(RoleEntity(name="primary"))
+    session.commit()
+    return replica_engine
+
+
+def role_names(session: Session) -> list[str]:
+    return list(session.scalars(select(RoleEntity.name)))
+
+
+def test_routing_session_reads_from_replica(test_engine: Engine, replica: Engine):
+    """Test that read-only sessions read from the replica, and others from the primary."""
+    with RoutingSession(test_engine, replica=replica, read_only=True) as session:
+        assert role_names(session) == ["replica"]
+    with RoutingSession(test_engine, replica=replica, read_only=False) as session:
+        assert role_names(session) == ["primary"]
+    with RoutingSession(test_engine, replica=None, read_only=True) as session:
+        assert role_names(session) == ["primary"]
+
+
+def test_routing_session_writes_to_primary(test_engine: Engine, replica: Engine):
+    """Test that a read-only session's writes are routed to the primary."""
+    with RoutingSession(test_engine, replica=replica, read_only=True) as session:
+        session.add(RoleEntity(name="written"))
+        session.commit()
+    with Session(test_engine) as session:
+        assert sorted(role_names(session)) == ["primary", "written"]
+    with Session(replica) as session:
+        assert role_names(session) == ["replica"]
+
+
+def request(method: str, cookie: str | None = None) -> Request:
+    headers = [] if cookie is None else [(b"cookie", cookie.encode())]
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+def test_read_your_writes_cookie():
+    """Test that writing clients are marked by a cookie lasting the window."""
+    read_your_writes = ReadYourWrites(window=9.5)
+    response = Response()
+    read_your_writes.wrote(response)
+    cookie = response.headers["set-cookie"]
+    assert cookie.startswith(f"{ReadYourWrites.COOKIE}=1;")
+    assert "Max-Age=10" in cookie
+    assert read_your_writes.is_sticky(request("GET", f"{ReadYourWrites.COOKIE}=1"))
+    assert not read_your_writes.is_sticky(request("GET"))
+
+
+def test_reads_from_replica():
+    """Test that GET requests read from the replica until their client writes."""
+    read_your_writes = ReadYourWrites(window=10)
+    response = Response()
+    assert reads_from_replica(request("GET"), response, read_your_writes)
+    assert "set-cookie" not in response.headers
+    assert not reads_from_replica(request("POST"), response, read_your_writes)
+    assert "set-cookie" in response.headers
+    assert not reads_from_replica(
+        request("GET", f"{ReadYourWrites.COOKIE}=1"), Response(), read_your_writes
+    )
@@ -2,7 +2,13 @@
 
 # PyTest
 import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator
 from unittest.mock import create_autospec
+from sqlalchemy import insert, text, update, event as sqlalchemy_event
+from sqlalchemy.orm import Session
 from backend.models.pagination import PaginationParams
 
 from backend.services.exceptions import (
@@ -17,8 +23,11 @@ from ....models.coworking.time_range import TimeRange
 from ..coworking.time import *
 
 # Tested Dependencies
-from ....models import Event, EventDetails, EventPaginationParams
-from ....services import EventService
+from ....models import Event, EventDetails, EventPaginationParams, User
+from ....services import EventService, PermissionService, UserService
+from ....services.event_registration_reconciler import EventRegistrationReconciler
+from ....entities import EventEntity, EventRegistrationEntity, UserEntity
+from ....models.registration_type import RegistrationType
 
 # Injected Service Fixtures
 from ..fixtures import (
@@ -28,6 +37,7 @@ from ..fixtures import (
 )
 
 # Explicitly import Data Fixture to load entities in database
+from ..conftest import count_statements
 from ..core_data import setup_insert_data_fixture
 
 # Data Models for Fake Data Inserted in Setup
@@ -45,15 +55,17 @@ from .event_test_data import (
     event_three,
 )
 from ..user_data import root, ambassador, user
+from ..organization.organization_test_data import cads, cssg
 
 from .event_demo_data import date_maker
 
 # Test Functions
 
 
-def test_get_all(event_svc_integration: EventService):
+def test_get_all(event_svc_integration: EventService, query_budget):
     """Test that all events can be retrieved."""
-    fetched_events = event_svc_integration.all(ambassador)
+    with query_budget(6):
+        fetched_events = event_svc_integration.all(ambassador)
 
     assert fetched_events is not None
     assert len(fetched_events) == len(events)
@@ -64,18 +76,20 @@ def test_get_all(event_svc_integration: EventService):
     assert fetched_events[2].is_attendee == True
 
 
-def test_get_all_unauthenticated(event_svc_integration: EventService):
+def test_get_all_unauthenticated(event_svc_integration: EventService, query_budget):
     """Test that all events can be retrieved."""
-    fetched_events = event_svc_integration.all()
+    with query_budget(3):
+        fetched_events = event_svc_integration.all()
 
     assert fetched_events is not None
     assert len(fetched_events) == len(events)
     assert isinstance(fetched_events[0], EventDetails)
 
 
-def test_get_by_id(event_svc_integration: EventService):
+def test_get_by_id(event_svc_integration: EventService, query_budget):
     """Test that events can be retrieved based on their ID."""
-    fetched_event = event_svc_integration.get_by_id(1, ambassador)
+    with query_budget(6):
+        fetched_event = event_svc_integration.get_by_id(1, ambassador)
     assert fetched_event is not None
     assert isinstance(fetched_event, Event)
     assert fetched_event.id == event_one.id
@@ -90,7 +104,7 @@ def test_get_by_id_unauthenticated(event_svc_integration: EventService):
     assert fetched_event.id == event_one.id
 
 
-def test_list(event_svc_integration: EventService):
+def test_list(event_svc_integration: EventService, query_budget):
     """Test that a paginated list of events can be produced."""
     pagination_params = EventPaginationParams(
         order_by="id",
@@ -101,9 +115,10 @@ def test_list(event_svc_integration: EventService):
             "%d/%m/%Y, %H:%M:%S"
         ),
     )
-    fetched_events = event_svc_integration.get_paginated_events(
-        pagination_params, ambassador
-    )
+    with query_budget(7):
+        fetched_events = event_svc_integration.get_paginated_events(
+            pagination_params, ambassador
+        )
     assert len(fetched_events.items) == 1
 
 
@@ -131,6 +146,81 @@ def test_list_unauthenticated(event_svc_integration: EventService):
     assert len(fetched_events.items) == 1
 
 
+def test_list_reads_bounded_by_page(
+    event_svc_integration: EventService, session: Session
+):
+    """Test that listing a page of events executes the same statements, and reads rows
+    bounded by the page, regardless of how many users attend the events."""
+    attendees = [
+        UserEntity(
+            pid=100000000 + index,
+            onyen=f"attendee{index}",
+            email=f"attendee{index}@unc.edu",
+            first_name="Attendee",
+            last_name=str(index),
+            pronouns="",
+        )
+        for index in range(50)
+    ]
+    crowded_events = [
+        EventEntity(
+            name=f"Crowded Event {index}",
+            time=date_maker(days_in_future=3, hour=10, minutes=index),
+            location="Sitterson Hall",
+            description="An event attended by every attendee",
+            public=True,
+            registration_limit=100,
+            registration_count=len(attendees),
+            organization_id=event_one.organization_id,
+        )
+        for index in range(20)
+    ]
+    session.add_all(attendees + crowded_events)
+    session.flush()
+    session.add_all(
+        EventRegistrationEntity(
+            event_id=event.id,
+            user_id=attendee.id,
+            registration_type=RegistrationType.ATTENDEE,
+        )
+        for event in crowded_events
+        for attendee in attendees
+    )
+    session.commit()
+
+    def read(page_size: int) -> tuple[int, int]:
+        rows = 0
+
+        def after_cursor_execute(conn, cursor, statement, *args):
+            nonlocal rows
+            rows += max(cursor.rowcount, 0)
+
+        engine = session.get_bind()
+        sqlalchemy_event.listen(engine, "after_cursor_execute", after_cursor_execute)
+        try:
+            with count_statements(session) as statements:
+                page = event_svc_integration.get_paginated_events(
+                    EventPaginationParams(
+                        order_by="time", filter="Crowded", page_size=page_size
+                    ),
+                    ambassador,
+                )
+        finally:
+            sqlalchemy_event.remove(
+                engine, "after_cursor_execute", after_cursor_execute
+            )
+        assert all(event.registration_count == 50 for event in page.items)
+        return len(statements), rows
+
+    # The subject's permissions are loaded, and cached, by the first page read
+    read(5)
+    small_statements, _ = read(5)
+    large_statements, large_rows = read(20)
+    assert small_statements == large_statements
+    # The events, their organization and the subject's registrations
+    assert large_rows < 5 * 20
+
+
 def test_get_events_in_time_range(event_svc_integration: EventService):
     """Test that a list of events can be produced for a valid time range."""
     range = TimeRange(
@@ -179,12 +269,14 @@ def test_create_event_as_user(event_svc_integration: EventService):
 def test_get_events_by_organization(
     event_svc_integration: EventService,
     organization_svc_integration: OrganizationService,
+    query_budget,
 ):
     """Test that list of events can be retrieved based on specified organization."""
     organization = organization_svc_integration.get_by_slug("cssg")
-    fetched_events = event_svc_integration.get_events_by_organization(
-        organization, ambassador
-    )
+    with query_budget(6):
+        fetched_events = event_svc_integration.get_events_by_organization(
+            organization, ambassador
+        )
     assert fetched_events is not None
     assert len(fetched_events) == 3
     assert fetched_events[0].is_attendee == True
@@ -208,6 +300,24 @@ def test_get_events_by_organization_organizer(
     assert fetched_events[2].is_organizer == False
 
 
+def test_get_events_by_organization_can_update(
+    event_svc_integration: EventService,
+    organization_svc_integration: OrganizationService,
+):
+    """Test that listed events record whether the subject may update them."""
+    organization = organization_svc_integration.get_by_slug("cssg")
+    organizer_events = event_svc_integration.get_events_by_organization(
+        organization, user
+    )
+    assert [event.can_update for event in organizer_events] == [
+        event.is_organizer for event in organizer_events
+    ]
+    root_events = event_svc_integration.get_events_by_organization(organization, root)
+    assert all(event.can_update for event in root_events)
+    anonymous_events = event_svc_integration.get_events_by_organization(organization)
+    assert not any(event.can_update for event in anonymous_events)
+
+
 def test_get_events_by_organization_unauthenticated(
     event_svc_integration: EventService,
     organization_svc_integration: OrganizationService,
@@ -530,6 +640,355 @@ def test_register_to_full_event(
         event_svc_integration.register(user, user, event_details)
 
 
+def test_register_counts_registrations(event_svc_integration: EventService):
+    """Test that registering and unregistering maintain the event's registration count."""
+    event_details = event_svc_integration.get_by_id(event_one.id, root)  # type: ignore
+    assert event_details.registration_count == 1
+    event_svc_integration.register(root, root, event_details)
+    event_svc_integration.register(root, root, event_details)
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 2
+    event_svc_integration.unregister(ambassador, ambassador, event_details)
+    event_svc_integration.unregister(ambassador, ambassador, event_details)
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 1
+
+
+def test_register_to_full_event_from_stale_details(
+    event_svc_integration: EventService,
+):
+    """Tests that capacity is enforced against the database rather than the event
+    details passed in, which may have been read before the event filled up."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    event_details.registration_count = 0
+
+    with pytest.raises(EventRegistrationException):
+        event_svc_integration.register(user, user, event_details)
+    assert event_svc_integration.get_registration(user, user, event_details) is None
+
+
+def test_register_concurrently_respects_limit(
+    event_svc_integration: EventService, session: Session
+):
+    """Tests that parallel registrations for an event never overshoot its limit."""
+    attendees = [
+        UserEntity(
+            pid=100000000 + index,
+            onyen=f"attendee{index}",
+            email=f"attendee{index}@unc.edu",
+            first_name="Attendee",
+            last_name=str(index),
+            pronouns="",
+        )
+        for index in range(20)
+    ]
+    popular_event = EventEntity(
+        name="Popular Event",
+        time=date_maker(days_in_future=3, hour=10, minutes=0),
+        location="Sitterson Hall",
+        description="An event everybody wants to attend",
+        public=True,
+        registration_limit=5,
+        organization_id=event_one.organization_id,
+    )
+    session.add_all(attendees + [popular_event])
+    session.commit()
+    attendee_models = [attendee.to_model() for attendee in attendees]
+    # Every registration is checked against details read before any registration
+    event_details = event_svc_integration.get_by_id(popular_event.id)
+
+    start = threading.Barrier(len(attendee_models))
+
+    def register(attendee: User) -> bool:
+        with Session(session.get_bind()) as thread_session:
+            event_service = EventService(
+                thread_session, PermissionService(thread_session)
+            )
+            start.wait()
+            try:
+                event_service.register(attendee, attendee, event_details)
+                return True
+            except EventRegistrationException:
+                return False
+
+    with ThreadPoolExecutor(max_workers=len(attendee_models)) as executor:
+        registered = list(executor.map(register, attendee_models))
+
+    assert registered.count(True) == 5
+    session.expire_all()
+    assert event_svc_integration.get_by_id(popular_event.id).registration_count == 5
+    assert (
+        session.query(EventRegistrationEntity)
+        .where(EventRegistrationEntity.event_id == popular_event.id)
+        .count()
+        == 5
+    )
+
+
+def test_promoting_attendee_to_organizer_frees_seat(
+    event_svc_integration: EventService,
+):
+    """Tests that attendees promoted to organizers no longer count as registered."""
+    event_svc_integration.update(root, updated_event_one_organizers)
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 0
+
+
+def test_reconcile_registration_counts(
+    event_svc_integration: EventService, session: Session
+):
+    """Tests that drifted registration counts are corrected, and only those."""
+    session.execute(
+        update(EventEntity)
+        .where(EventEntity.id.in_([event_one.id, event_two.id]))
+        .values(registration_count=7)
+    )
+    session.commit()
+
+    assert sorted(event_svc_integration.reconcile_registration_counts()) == [
+        event_one.id,
+        event_two.id,
+    ]
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 1
+    assert event_svc_integration.get_by_id(event_two.id).registration_count == 0
+    assert event_svc_integration.reconcile_registration_counts() == []
+
+
+def test_reconciler_run_once(session: Session):
+    """Test that the reconciler corrects counts with sessions of its own."""
+    session.execute(
+        update(EventEntity)
+        .where(EventEntity.id == event_three.id)
+        .values(registration_count=0)
+    )
+    session.commit()
+
+    reconciler = EventRegistrationReconciler(lambda: Session(session.get_bind()))
+    assert reconciler.run_once() == [event_three.id]
+    assert reconciler.run_once() == []
+
+
+def test_register_to_full_event_joins_waitlist(event_svc_integration: EventService):
+    """Tests that users registering for a full event join its waitlist in order."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    event_svc_integration.register(root, root, event_details, waitlist=True)
+    # Joining the waitlist is idempotent
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+
+    registration = event_svc_integration.get_registration(user, user, event_details)
+    assert registration is not None
+    assert registration.registration_type == RegistrationType.WAITLIST
+    assert event_svc_integration.get_waitlist_position(user, user, event_details) == 1
+    assert event_svc_integration.get_waitlist_position(root, root, event_details) == 2
+    assert event_svc_integration.get_by_id(event_three.id).registration_count == 1
+
+
+def test_register_with_waitlist_takes_free_seat(event_svc_integration: EventService):
+    """Tests that users asking to join the waitlist of an event with seats register."""
+    event_details = event_svc_integration.get_by_id(event_one.id)  # type: ignore
+    event_svc_integration.register(root, root, event_details, waitlist=True)
+    registration = event_svc_integration.get_registration(root, root, event_details)
+    assert registration is not None
+    assert registration.registration_type == RegistrationType.ATTENDEE
+    assert (
+        event_svc_integration.get_waitlist_position(root, root, event_details) is None
+    )
+
+
+def test_unregister_promotes_waitlist(event_svc_integration: EventService):
+    """Tests that a released seat goes to the user who joined the waitlist first."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    event_svc_integration.register(root, root, event_details, waitlist=True)
+
+    event_svc_integration.unregister(ambassador, ambassador, event_details)
+
+    registration = event_svc_integration.get_registration(user, user, event_details)
+    assert registration is not None
+    assert registration.registration_type == RegistrationType.ATTENDEE
+    assert event_svc_integration.get_waitlist_position(root, root, event_details) == 1
+    assert event_svc_integration.get_by_id(event_three.id).registration_count == 1
+
+
+def test_unregister_from_waitlist(event_svc_integration: EventService):
+    """Tests that users leaving the waitlist release no seat and move the others up."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    event_svc_integration.register(root, root, event_details, waitlist=True)
+
+    event_svc_integration.unregister(user, user, event_details)
+
+    assert event_svc_integration.get_registration(user, user, event_details) is None
+    assert event_svc_integration.get_waitlist_position(root, root, event_details) == 1
+    assert event_svc_integration.get_by_id(event_three.id).registration_count == 1
+
+
+def test_raising_limit_promotes_waitlist(event_svc_integration: EventService):
+    """Tests that seats added to an event go to its waitlist."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    event_svc_integration.update(
+        root, event_three.model_copy(update={"registration_limit": 2})
+    )
+    assert (
+        event_svc_integration.get_waitlist_position(user, user, event_details) is None
+    )
+    assert event_svc_integration.get_by_id(event_three.id).registration_count == 2
+
+
+def test_waitlist_excluded_from_registrations(event_svc_integration: EventService):
+    """Tests that users waiting for an event are not listed as registered for it."""
+    event_details = event_svc_integration.get_by_id(event_three.id, root)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    assert user.id not in [
+        registration.id
+        for registration in event_svc_integration.get_registrations_of_event(
+            root, event_details
+        )
+    ]
+    time_range = TimeRange(
+        start=event_three.time - ONE_DAY, end=event_three.time + ONE_DAY
+    )
+    assert event_svc_integration.get_registrations_of_user(user, user, time_range) == []
+
+
+def test_get_waitlist_position_enforces_permission(
+    event_svc_integration: EventService,
+):
+    """Tests that users may not read the waitlist positions of others."""
+    event_details = event_svc_integration.get_by_id(event_three.id)  # type: ignore
+    with pytest.raises(UserPermissionException):
+        event_svc_integration.get_waitlist_position(user, root, event_details)
+
+
+def test_register_many(event_svc_integration: EventService):
+    """Tests registering users for an event at once by their onyens and PIDs."""
+    event_details = event_svc_integration.get_by_id(event_one.id, root)  # type: ignore
+    result = event_svc_integration.register_many(
+        root,
+        event_details,
+        [str(root.pid), "xlstan", "user", "nobody", "root"],
+    )
+    assert [registered.id for registered in result.registered] == [root.id]
+    assert sorted(registered.id for registered in result.already_registered) == [
+        ambassador.id,
+        user.id,
+    ]
+    assert result.not_registered == []
+    assert result.unmatched == ["nobody"]
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 2
+
+
+def test_register_many_respects_limit(
+    event_svc_integration: EventService, session: Session, query_budget
+):
+    """Tests that users are registered for as many seats as are free, in order, by
+    the same statements however many are registered."""
+    students = [
+        UserEntity(
+            pid=100000000 + index,
+            onyen=f"student{index}",
+            email=f"student{index}@unc.edu",
+            first_name="Student",
+            last_name=str(index),
+            pronouns="",
+        )
+        for index in range(20)
+    ]
+    session.add_all(students)
+    session.commit()
+    onyens = [student.onyen for student in students]
+    event_details = event_svc_integration.get_by_id(event_three.id, root)  # type: ignore
+    event_svc_integration.update(
+        root, event_three.model_copy(update={"registration_limit": 6})
+    )
+
+    with query_budget(5):
+        result = event_svc_integration.register_many(root, event_details, onyens)
+
+    assert [registered.last_name for registered in result.registered] == [
+        str(index) for index in range(5)
+    ]
+    assert len(result.not_registered) == 15
+    assert event_svc_integration.get_by_id(event_three.id).registration_count == 6
+
+
+def test_register_many_promotes_waitlisted_users(
+    event_svc_integration: EventService, session: Session
+):
+    """Tests that users waiting for an event with free seats are registered."""
+    session.add(
+        EventRegistrationEntity(
+            event_id=event_one.id,
+            user_id=root.id,
+            registration_type=RegistrationType.WAITLIST,
+        )
+    )
+    session.commit()
+    event_details = event_svc_integration.get_by_id(event_one.id, root)  # type: ignore
+    result = event_svc_integration.register_many(root, event_details, ["root"])
+    assert [registered.id for registered in result.registered] == [root.id]
+    assert result.already_registered == []
+    registration = event_svc_integration.get_registration(root, root, event_details)
+    assert registration is not None
+    assert registration.registration_type == RegistrationType.ATTENDEE
+    assert event_svc_integration.get_by_id(event_one.id).registration_count == 2
+
+
+def test_register_many_keeps_waitlisted_users_of_full_event(
+    event_svc_integration: EventService,
+):
+    """Tests that users waiting for a full event are reported as waitlisted."""
+    event_details = event_svc_integration.get_by_id(event_three.id, root)  # type: ignore
+    event_svc_integration.register(user, user, event_details, waitlist=True)
+    result = event_svc_integration.register_many(root, event_details, ["user", "root"])
+    assert result.registered == []
+    assert result.already_registered == []
+    assert [waitlisted.id for waitlisted in result.waitlisted] == [user.id]
+    assert [refused.id for refused in result.not_registered] == [root.id]
+    assert event_svc_integration.get_waitlist_position(user, user, event_details) == 1
+
+
+def test_register_many_enforces_permission(event_svc_integration: EventService):
+    """Tests that only organizers and administrators register users at once."""
+    event_details = event_svc_integration.get_by_id(event_one.id, ambassador)  # type: ignore
+    with pytest.raises(UserPermissionException):
+        event_svc_integration.register_many(ambassador, event_details, ["root"])
+
+
+def test_export_registered_users_of_event(event_svc_integration: EventService):
+    """Tests exporting the users registered for an event as CSV."""
+    event_details = event_svc_integration.get_by_id(event_one.id, root)  # type: ignore
+    event_svc_integration.register(root, root, event_details)
+    exported = "".join(
+        event_svc_integration.export_registered_users_of_event(root, event_details)
+    )
+    assert exported.splitlines() == [
+        "pid,onyen,first_name,last_name,email,pronouns",
+        "888888888,xlstan,Amy,Ambassador,amam@unc.edu,They / Them / Theirs",
+        "999999999,root,Rhonda,Root,root@unc.edu,She / Her / Hers",
+    ]
+
+
+def test_export_registered_users_of_event_keeps_session_open(
+    event_svc_integration: EventService, session: Session
+):
+    """Tests that the export reads rows through its own session, not the request's."""
+    event_details = event_svc_integration.get_by_id(event_one.id, root)  # type: ignore
+    entity = session.get(EventEntity, event_one.id)
+    "".join(event_svc_integration.export_registered_users_of_event(root, event_details))
+    assert entity in session
+
+
+def test_export_registered_users_of_event_enforces_permission(
+    event_svc_integration: EventService,
+):
+    """Tests that permission is enforced before the export is read."""
+    event_details = event_svc_integration.get_by_id(event_one.id, ambassador)  # type: ignore
+    with pytest.raises(UserPermissionException):
+        event_svc_integration.export_registered_users_of_event(
+            ambassador, event_details
+        )
+
+
 def test_get_registered_users_of_event(event_svc_integration: EventService):
     """Tests querying for registered users of events as a paginated list"""
     pagination_params = PaginationParams(
@@ -618,3 +1077,193 @@ def test_get_registered_users_of_event_without_permissions(
         "organization.events.manage_registrations",
         f"organization/{event_one.organization_id}",
     )
+
+
+def test_get_event_validator_unchanged(event_svc_integration: EventService):
+    """Test that the version of an unchanged event is stable."""
+    validator = event_svc_integration.get_event_validator(event_one.id)
+    assert event_svc_integration.get_event_validator(event_one.id) == validator
+    assert validator.last_modified is not None
+
+
+def test_get_event_validator_after_update(event_svc_integration: EventService):
+    """Test that updating an event changes its version."""
+    validator = event_svc_integration.get_event_validator(event_one.id)
+    event_svc_integration.update(root, updated_event_one)
+    assert event_svc_integration.get_event_validator(event_one.id) != validator
+
+
+def test_get_event_validator_after_registration(event_svc_integration: EventService):
+    """Test that registering for an event changes its version."""
+    validator = event_svc_integration.get_event_validator(event_one.id)
+    event_details = event_svc_integration.get_by_id(event_one.id, root)
+    event_svc_integration.register(root, root, event_details)
+    assert event_svc_integration.get_event_validator(event_one.id) != validator
+
+
+def test_get_event_validator_after_organization_rename(
+    event_svc_integration: EventService,
+    organization_svc_integration: OrganizationService,
+):
+    """Test that renaming the organization hosting an event changes its version."""
+    validator = event_svc_integration.get_event_validator(event_one.id)
+    organization_svc_integration.update(
+        root, cssg.model_copy(update={"name": "Renamed"})
+    )
+    assert event_svc_integration.get_event_validator(event_one.id) != validator
+
+
+def test_get_event_validator_after_organizer_rename(
+    event_svc_integration: EventService, user_svc_integration: UserService
+):
+    """Test that renaming an organizer of an event changes its version."""
+    validator = event_svc_integration.get_event_validator(event_one.id)
+    user_svc_integration.update(root, user.model_copy(update={"first_name": "Renamed"}))
+    assert event_svc_integration.get_event_validator(event_one.id) != validator
+
+
+def test_get_paginated_events_validator_after_delete(
+    event_svc_integration: EventService,
+):
+    """Test that deleting a listed event changes the version of the listing."""
+    pagination_params = EventPaginationParams(order_by="time")
+    validator = event_svc_integration.get_paginated_events_validator(pagination_params)
+    event_svc_integration.delete(root, event_two.id)
+    assert (
+        event_svc_integration.get_paginated_events_validator(pagination_params)
+        != validator
+    )
+
+
+def test_list_by_cursor(event_svc_integration: EventService):
+    """Test that pages of events are walked forward and back by their cursors."""
+    soonest = sorted(events, key=lambda event: (event.time, event.id))
+    first = event_svc_integration.get_paginated_events(
+        EventPaginationParams(order_by="time", page_size=2)
+    )
+    assert [event.id for event in first.items] == [event.id for event in soonest[:2]]
+    assert first.next_cursor is not None and first.previous_cursor is None
+
+    second = event_svc_integration.get_paginated_events(
+        EventPaginationParams(order_by="time", page_size=2, after=first.next_cursor)
+    )
+    assert [event.id for event in second.items] == [event.id for event in soonest[2:]]
+    assert second.next_cursor is None and second.previous_cursor is not None
+
+    back = event_svc_integration.get_paginated_events(
+        EventPaginationParams(
+            order_by="time", page_size=2, before=second.previous_cursor
+        )
+    )
+    assert [event.id for event in back.items] == [event.id for event in first.items]
+    assert back.previous_cursor is None
+
+
+def test_list_without_total(event_svc_integration: EventService, query_budget):
+    """Test that events are listed without counting them when totals are opted out of."""
+    with query_budget(5):
+        page = event_svc_integration.get_paginated_events(
+            EventPaginationParams(order_by="time", include_total=False)
+        )
+    assert page.length is None
+    assert len(page.items) == len(events)
+
+
+def test_list_by_invalid_cursor(event_svc_integration: EventService):
+    with pytest.raises(ValueError):
+        event_svc_integration.get_paginated_events(
+            EventPaginationParams(order_by="time", after="not a cursor")
+        )
+
+
+@contextmanager
+def explain_event_queries(session: Session) -> Iterator[list[str]]:
+    """Collect the query plans of the statements selecting events within the context."""
+    queries: list[tuple[str, dict]] = []
+    plans: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        if statement.startswith("SELECT event."):
+            queries.append((statement, parameters))
+
+    engine = session.get_bind()
+    sqlalchemy_event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield plans
+    finally:
+        sqlalchemy_event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    for statement, parameters in queries:
+        plan = session.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in plan))
+
+
+@pytest.fixture()
+def many_events(session: Session):
+    """Insert an event every hour for 2000 hours, and refresh the planner's statistics."""
+    start = event_one.time - 1000 * ONE_HOUR
+    session.execute(
+        insert(EventEntity),
+        [
+            {
+                "name": f"Office Hours {index}",
+                "time": start + index * ONE_HOUR,
+                "location": "Sitterson Hall",
+                "description": "Drop in with questions",
+                "public": True,
+                "registration_limit": 10,
+                "organization_id": cads.id,
+            }
+            for index in range(2000)
+        ],
+    )
+    session.commit()
+    session.execute(text("ANALYZE event"))
+    session.commit()
+
+
+def test_list_in_time_range_uses_index(
+    event_svc_integration: EventService, session: Session, many_events
+):
+    """Test that events are filtered to a time range by seeking the time index."""
+    with explain_event_queries(session) as plans:
+        event_svc_integration.get_paginated_events(
+            EventPaginationParams(
+                order_by="time",
+                range_start=(event_one.time - ONE_DAY).strftime("%d/%m/%Y, %H:%M:%S"),
+                range_end=(event_one.time + ONE_DAY).strftime("%d/%m/%Y, %H:%M:%S"),
+            )
+        )
+    assert len(plans) == 1
+    assert "event__time_idx" in plans[0]
+
+
+def test_list_by_cursor_uses_index(
+    event_svc_integration: EventService, session: Session, many_events
+):
+    """Test that pages deep into the listing are retrieved by seeking the time index."""
+    page = event_svc_integration.get_paginated_events(
+        EventPaginationParams(order_by="time", page=150, include_total=False)
+    )
+    with explain_event_queries(session) as plans:
+        event_svc_integration.get_paginated_events(
+            EventPaginationParams(
+                order_by="time", after=page.next_cursor, include_total=False
+            )
+        )
+    assert len(plans) == 1
+    assert "Index Scan using event__time_idx" in plans[0]
+    assert "Sort" not in plans[0]
+
+
+def test_get_events_by_organization_uses_index(
+    event_svc_integration: EventService,
+    organization_svc_integration: OrganizationService,
+    session: Session,
+    many_events,
+):
+    """Test that an organization's events are found by seeking the organization index."""
+    organization = organization_svc_integration.get_by_slug("cssg")
+    with explain_event_queries(session) as plans:
+        event_svc_integration.get_events_by_organization(organization)
+    assert len(plans) == 1
+    assert "event__organization_time_idx" in plans[0]
@@ -1,6 +1,7 @@
 """Contains mock data for the live demo of the evnts feature."""
 
 import pytest
+from collections import Counter
 from sqlalchemy.orm import Session
 
 from ....models.public_user import PublicUser
@@ -226,10 +227,18 @@ def insert_fake_data(session: Session):
 
     global events
 
+    # Count attendees, as registering them through `EventService` would
+    registration_counts = Counter(
+        registration.event_id
+        for registration in registrations
+        if registration.registration_type == RegistrationType.ATTENDEE
+    )
+
     # Create entities for test event data
     entities = []
     for event in events:
         event_entity = EventEntity.from_model(event)
+        event_entity.registration_count = registration_counts[event.id]
         session.add(event_entity)
         entities.append(event_entity)
 
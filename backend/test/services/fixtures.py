@@ -11,6 +11,7 @@ from ...services import (
     EventService,
     RoomService,
     NewsPostService,
+    NewsFeedService,
 )
 
 __authors__ = ["Kris Jordan", "Ajay Gandecha"]
@@ -58,6 +59,16 @@ def newspost_svc_integration(session: Session):
     return NewsPostService(session, PermissionService(session))
 
 
+@pytest.fixture()
+def news_feed_svc_integration(session: Session):
+    """This fixture is used to test the NewsFeedService class with real NewsPost and Organization services."""
+    permission = PermissionService(session)
+    return NewsFeedService(
+        NewsPostService(session, permission),
+        OrganizationService(session, permission),
+    )
+
+
 @pytest.fixture()
 def event_svc_integration(session: Session, user_svc_integration: UserService):
     """This fixture is used to test the EventService class with a real PermissionService."""
@@ -1,10 +1,13 @@
 """Tests for the HealthService class."""
 
 # Tested Dependencies
+from ... import database
 from ...services.health import HealthService
 
 # Library Requirements
+import pytest
 from datetime import datetime, timezone
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session
 
 __authors__ = ["Kris Jordan"]
@@ -17,3 +20,24 @@ def test_health_check(session: Session):
     now = str(datetime.now(tz=timezone.utc))[:16]
     result = health_service.check()
     assert f"OK @ {now}" in health_service.check()
+
+
+def test_pool_statistics(
+    session: Session, test_engine: Engine, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(database, "engine", test_engine)
+    health_service = HealthService(session)
+    health_service.check()
+    statistics = health_service.pool_statistics()
+    assert [pool.pool for pool in statistics] == ["primary"]
+    assert statistics[0].checked_out >= 1
+    assert statistics[0].checkouts >= 1
+
+
+def test_pool_statistics_of_replica(
+    session: Session, test_engine: Engine, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(database, "replica_engine", test_engine)
+    health_service = HealthService(session)
+    statistics = health_service.pool_statistics()
+    assert [pool.pool for pool in statistics] == ["primary", "replica"]
@@ -0,0 +1,110 @@
+"""Tests for request metrics and the middleware recording them."""
+
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session
+
+# Tested Dependencies
+from ...api.request_metrics import RequestMetricsMiddleware
+from ...services.exceptions import UserPermissionException
+from ...services.metrics import (
+    MetricsService,
+    QueryTally,
+    RequestMetrics,
+    instrument_engine,
+    track_queries,
+)
+from ...services.permission import PermissionService
+
+# Explicitly import Data Fixture to load entities in database
+from .core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, user
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_track_queries(session: Session, test_engine: Engine):
+    """Test that statements are tallied within the context only."""
+    instrument_engine(test_engine)
+    with track_queries() as queries:
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+    session.execute(text("SELECT 3"))
+    assert queries.statements == 2
+    assert queries.seconds > 0
+
+
+def test_prometheus():
+    """Test that requests are reported as a histogram and counters per route."""
+    metrics = RequestMetrics()
+    metrics.record("GET", "/api/news", 0.02, QueryTally(statements=3, seconds=0.01))
+    metrics.record("GET", "/api/news", 0.2, QueryTally(statements=1, seconds=0.05))
+    lines = metrics.prometheus().splitlines()
+    route = 'method="GET",route="/api/news"'
+    assert "# TYPE csxl_request_duration_seconds histogram" in lines
+    assert f'csxl_request_duration_seconds_bucket{{{route},le="0.01"}} 0' in lines
+    assert f'csxl_request_duration_seconds_bucket{{{route},le="0.025"}} 1' in lines
+    assert f'csxl_request_duration_seconds_bucket{{{route},le="0.25"}} 2' in lines
+    assert f'csxl_request_duration_seconds_bucket{{{route},le="+Inf"}} 2' in lines
+    assert f"csxl_request_duration_seconds_count{{{route}}} 2" in lines
+    assert f"csxl_request_db_statements_total{{{route}}} 4" in lines
+
+
+def test_prometheus_escapes_labels():
+    metrics = RequestMetrics()
+    metrics.record("GET", '/api/"quoted"', 0.01, QueryTally())
+    assert 'route="/api/\\"quoted\\""' in metrics.prometheus()
+
+
+def test_metrics_service_as_root(session: Session):
+    metrics_service = MetricsService(PermissionService(session))
+    assert "csxl_request_duration_seconds" in metrics_service.prometheus(root)
+
+
+def test_metrics_service_enforces_permission(session: Session):
+    metrics_service = MetricsService(PermissionService(session))
+    with pytest.raises(UserPermissionException):
+        metrics_service.prometheus(user)
+
+
+def test_middleware_records_route(
+    session: Session, test_engine: Engine, caplog: pytest.LogCaptureFixture
+):
+    """Test that the middleware attributes the statements of sync handlers to their
+    route, and logs requests over budget."""
+    instrument_engine(test_engine)
+    metrics = RequestMetrics()
+    app = FastAPI()
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        statement_budget=1,
+        latency_budget=10,
+        metrics=metrics,
+    )
+
+    @app.get("/items/{id}")
+    def get_item(id: int, statements: int = 1) -> int:
+        for _ in range(statements):
+            session.execute(text("SELECT 1"))
+        return id
+
+    client = TestClient(app)
+    with caplog.at_level(logging.WARNING):
+        assert client.get("/items/1").status_code == 200
+        assert caplog.records == []
+        assert client.get("/items/2?statements=2").status_code == 200
+        assert "after 2 statements" in caplog.records[0].getMessage()
+    assert client.get("/missing").status_code == 404
+
+    report = metrics.prometheus()
+    route = 'method="GET",route="/items/{id}"'
+    assert f"csxl_request_duration_seconds_count{{{route}}} 2" in report
+    assert f"csxl_request_db_statements_total{{{route}}} 3" in report
+    assert 'route="<unmatched>"' in report
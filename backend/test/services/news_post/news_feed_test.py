@@ -0,0 +1,101 @@
+"""Tests for the NewsFeedService class."""
+
+# PyTest
+import json
+import pytest
+from xml.dom.minidom import parseString
+from sqlalchemy.orm import Session
+
+from backend.services.exceptions import ResourceNotFoundException
+
+# Tested Dependencies
+from ....services import NewsFeedService, NewsPostService
+from ....services.news_feed import SITE_URL
+
+# Injected Service Fixtures
+from ..fixtures import news_feed_svc_integration, newspost_svc_integration
+
+# Explicitly import Data Fixture to load entities in database
+from ..core_data import setup_insert_data_fixture
+
+# Data Models for Fake Data Inserted in Setup
+from ..organization.organization_test_data import appteam, cads
+from ..user_data import root
+from ..conftest import count_statements
+from .news_post_test_data import jaysonsPost, published_embrey_post
+
+FEED_PATH = "/api/news/feed"
+
+
+def test_atom(news_feed_svc_integration: NewsFeedService):
+    """Test that published posts are syndicated as an Atom feed."""
+    document = parseString(news_feed_svc_integration.atom(FEED_PATH, 20))
+    entries = document.getElementsByTagName("entry")
+    assert len(entries) == 1
+    title = entries[0].getElementsByTagName("title")[0].firstChild.data
+    assert title == jaysonsPost.headline
+    url = entries[0].getElementsByTagName("id")[0].firstChild.data
+    assert url == f"{SITE_URL}news/{jaysonsPost.slug}"
+
+
+def test_json_feed(news_feed_svc_integration: NewsFeedService):
+    """Test that published posts are syndicated as a JSON Feed."""
+    document = json.loads(news_feed_svc_integration.json_feed(FEED_PATH, 20))
+    assert document["version"] == "https://jsonfeed.org/version/1.1"
+    assert document["feed_url"] == f"{SITE_URL}api/news/feed?limit=20"
+    assert len(document["items"]) == 1
+    assert document["items"][0]["title"] == jaysonsPost.headline
+    assert document["items"][0]["content_text"] == jaysonsPost.main_story
+
+
+def test_json_feed_newest_first(
+    news_feed_svc_integration: NewsFeedService,
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that feeds list the newest posts, up to the limit."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    document = json.loads(news_feed_svc_integration.json_feed(FEED_PATH, 1))
+    assert len(document["items"]) == 1
+    assert document["items"][0]["title"] == jaysonsPost.headline
+
+
+def test_json_feed_organization(
+    news_feed_svc_integration: NewsFeedService,
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that feeds can syndicate only the posts of an organization."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    document = json.loads(
+        news_feed_svc_integration.json_feed(FEED_PATH, 20, appteam.slug)
+    )
+    assert [item["title"] for item in document["items"]] == [
+        jaysonsPost.headline,
+        published_embrey_post.headline,
+    ]
+    document = json.loads(news_feed_svc_integration.json_feed(FEED_PATH, 20, cads.slug))
+    assert document["items"] == []
+
+
+def test_json_feed_unknown_organization(news_feed_svc_integration: NewsFeedService):
+    """Test that syndicating the posts of an unknown organization raises an exception."""
+    with pytest.raises(ResourceNotFoundException):
+        news_feed_svc_integration.json_feed(FEED_PATH, 20, "unknown")
+
+
+def test_feed_cached(news_feed_svc_integration: NewsFeedService, session: Session):
+    """Test that feed documents are not rewritten until posts are modified."""
+    document = news_feed_svc_integration.atom(FEED_PATH, 20)
+    with count_statements(session) as statements:
+        assert news_feed_svc_integration.atom(FEED_PATH, 20) == document
+    assert len(statements) == 0
+
+
+def test_feed_regenerated_after_update(
+    news_feed_svc_integration: NewsFeedService,
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that feed documents are rewritten once posts are modified."""
+    news_feed_svc_integration.json_feed(FEED_PATH, 20)
+    newspost_svc_integration.update(root, published_embrey_post)
+    document = json.loads(news_feed_svc_integration.json_feed(FEED_PATH, 20))
+    assert len(document["items"]) == 2
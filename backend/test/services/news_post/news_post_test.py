@@ -2,7 +2,11 @@
 
 # PyTest
 import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import create_autospec
+from sqlalchemy.orm import Session
 
 from backend.api.coworking import ambassador
 from backend.models.pagination import EventPaginationParams
@@ -13,10 +17,22 @@ from backend.services.exceptions import (
 from backend.test.services.news_post.news_post_demo_data import date_maker
 from ..organization.organization_test_data import appteam
 
-from ....models import NewsPost
-from ....services import NewsPostService
+from ....models import NewsPost, NewsPostState, NewsPostSummary, Permission
+from ....services import (
+    NewsPostService,
+    OrganizationService,
+    PermissionService,
+    UserService,
+)
+from ....services.news_post import news_feed_cache
+from ....services.news_post_scheduler import NewsPostScheduler
 
-from ..fixtures import newspost_svc_integration
+from ..fixtures import (
+    newspost_svc_integration,
+    organization_svc_integration,
+    user_svc_integration,
+)
+from ..conftest import count_statements
 from ..core_data import setup_insert_data_fixture
 
 from .news_post_test_data import (
@@ -30,14 +46,16 @@ from .news_post_test_data import (
     invalid_post,
     published_embrey_post,
     draft_ishmael_post,
-    duplicate_treysPost
+    duplicate_treysPost,
+    insert_many_published_posts,
 )
 from ..user_data import root, user, ambassador
 
 
-def test_get_all(newspost_svc_integration: NewsPostService):
+def test_get_all(newspost_svc_integration: NewsPostService, query_budget):
     """Test that all posts can be retrieved by an admin."""
-    fetched_posts = newspost_svc_integration.all(root)
+    with query_budget(5):
+        fetched_posts = newspost_svc_integration.all(root)
     assert fetched_posts is not None
     assert len(fetched_posts) == len(posts)
     assert isinstance(fetched_posts[0], NewsPost)
@@ -47,36 +65,41 @@ def test_get_all(newspost_svc_integration: NewsPostService):
     assert fetched_posts[3].headline == "Ishmael's News Post"
 
 
-def test_get_published(newspost_svc_integration: NewsPostService):
+def test_get_published(newspost_svc_integration: NewsPostService, query_budget):
     """Test that published posts can be retrieved."""
-    fetched_posts = newspost_svc_integration.get_published()
+    # The posts are loaded by 3 statements, and their version by 1
+    with query_budget(4):
+        fetched_posts = newspost_svc_integration.get_published()
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
     assert fetched_posts[0].id == jaysonsPost.id
 
 
-def test_get_incoming_as_root(newspost_svc_integration: NewsPostService):
+def test_get_incoming_as_root(newspost_svc_integration: NewsPostService, query_budget):
     """Test that incoming posts can be retrieved."""
-    fetched_posts = newspost_svc_integration.get_incoming(root)
+    with query_budget(3):
+        fetched_posts = newspost_svc_integration.get_incoming(root)
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
     assert fetched_posts[0].id == ishmaelsPost.id
 
 
-def test_get_archived_as_root(newspost_svc_integration: NewsPostService):
+def test_get_archived_as_root(newspost_svc_integration: NewsPostService, query_budget):
     """Test that archived posts can be retrieved."""
-    fetched_posts = newspost_svc_integration.get_archived(root)
+    with query_budget(3):
+        fetched_posts = newspost_svc_integration.get_archived(root)
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
     assert fetched_posts[0].id == embreysPost.id
 
 
-def test_get_drafts_as_root(newspost_svc_integration: NewsPostService):
+def test_get_drafts_as_root(newspost_svc_integration: NewsPostService, query_budget):
     """Test that drafts can be retrieved."""
-    fetched_posts = newspost_svc_integration.get_drafts(root)
+    with query_budget(3):
+        fetched_posts = newspost_svc_integration.get_drafts(root)
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
@@ -101,9 +124,10 @@ def test_get_drafts_as_user(newspost_svc_integration: NewsPostService):
         newspost_svc_integration.get_drafts(user)
 
 
-def test_get_by_slug(newspost_svc_integration: NewsPostService):
+def test_get_by_slug(newspost_svc_integration: NewsPostService, query_budget):
     """Test that newspost can be retrieved based on their slug."""
-    fetched_post = newspost_svc_integration.get_by_slug(jaysonsPost.slug)
+    with query_budget(1):
+        fetched_post = newspost_svc_integration.get_by_slug(jaysonsPost.slug)
     assert fetched_post is not None
     assert isinstance(fetched_post, NewsPost)
     assert fetched_post.slug == jaysonsPost.slug
@@ -126,14 +150,54 @@ def test_create_post_as_user(newspost_svc_integration: NewsPostService):
     assert created_post.id is not None
     assert created_post.headline == "Created News Post"
     assert created_post.state == "incoming"
-    
+
 
 def test_create_post_same_slug(newspost_svc_integration: NewsPostService):
     """Test that a post created with a duplicate slug will change the new slug."""
     created_post = newspost_svc_integration.create(root, duplicate_treysPost)
     assert created_post is not None
     assert created_post.id is not None
-    assert created_post.slug != treysPost.slug
+    assert created_post.slug == f"{treysPost.slug}-2"
+
+
+def test_create_post_slug_taken_by_edited_post(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that a suffixed slug taken by an edited post is skipped."""
+    newspost_svc_integration.update(
+        root, treysPost.model_copy(update={"slug": f"{jaysonsPost.slug}-2"})
+    )
+    created_post = newspost_svc_integration.create(
+        root, duplicate_treysPost.model_copy(update={"slug": jaysonsPost.slug})
+    )
+    assert created_post.slug == f"{jaysonsPost.slug}-3"
+
+
+def test_create_post_same_slug_concurrently(session: Session):
+    """Test that posts created concurrently with the same slug are each given a unique
+    slug, without any creation failing or waiting long on the others."""
+    creators = 16
+    barrier = threading.Barrier(creators)
+
+    def create(index: int) -> tuple[str, float]:
+        with Session(session.get_bind()) as own_session:
+            news_service = NewsPostService(own_session, PermissionService(own_session))
+            barrier.wait()
+            start = time.monotonic()
+            created_post = news_service.create(
+                root,
+                duplicate_treysPost.model_copy(update={"slug": "concurrent-post"}),
+            )
+            return created_post.slug, time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=creators) as executor:
+        results = list(executor.map(create, range(creators)))
+
+    slugs = [slug for slug, _ in results]
+    assert sorted(slugs) == sorted(
+        ["concurrent-post"] + [f"concurrent-post-{n}" for n in range(2, creators + 1)]
+    )
+    assert max(latency for _, latency in results) < 5
 
 
 def test_update_post_as_root(
@@ -143,8 +207,8 @@ def test_update_post_as_root(
     Note: Test data's synopsis field is updated
     """
     newspost_svc_integration.update(root, to_update)
-    assert newspost_svc_integration.get_by_slug('slug4').organization_id == 3
-    assert newspost_svc_integration.get_by_slug('slug4').state == "published"
+    assert newspost_svc_integration.get_by_slug("slug4").organization_id == 3
+    assert newspost_svc_integration.get_by_slug("slug4").state == "published"
 
 
 def test_update_published_post_as_user(newspost_svc_integration: NewsPostService):
@@ -193,9 +257,12 @@ def test_delete_on_invalid_event(newspost_svc_integration: NewsPostService):
         newspost_svc_integration.delete(root, invalid_post.slug)
 
 
-def test_get_posts_by_organization(newspost_svc_integration: NewsPostService):
+def test_get_posts_by_organization(
+    newspost_svc_integration: NewsPostService, query_budget
+):
     """Test that published posts by an organization can be retrieved."""
-    fetched_posts = newspost_svc_integration.get_posts_by_organization(appteam)
+    with query_budget(1):
+        fetched_posts = newspost_svc_integration.get_posts_by_organization(appteam)
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
@@ -212,10 +279,13 @@ def test_get_posts_by_same_user(newspost_svc_integration: NewsPostService):
     assert fetched_posts[0].id == embreysPost.id
 
 
-def test_get_posts_by_user_as_root(newspost_svc_integration: NewsPostService):
+def test_get_posts_by_user_as_root(
+    newspost_svc_integration: NewsPostService, query_budget
+):
     """Test that published posts by a user can be retrieved by the root."""
     newspost_svc_integration.update(root, published_embrey_post)
-    fetched_posts = newspost_svc_integration.get_posts_by_user(user, root)
+    with query_budget(1):
+        fetched_posts = newspost_svc_integration.get_posts_by_user(user, root)
     assert fetched_posts is not None
     assert len(fetched_posts) == 1
     assert isinstance(fetched_posts[0], NewsPost)
@@ -237,6 +307,89 @@ def test_get_posts_by_wrong_user(newspost_svc_integration: NewsPostService):
     )
 
 
+def test_list_posts_by_organization(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that an organization's posts can be paginated, newest first, by cursor."""
+    insert_many_published_posts(session, 9)
+    first_page = newspost_svc_integration.get_paginated_posts_by_organization(
+        appteam, EventPaginationParams(page_size=3)
+    )
+    second_page = newspost_svc_integration.get_paginated_posts_by_organization(
+        appteam, EventPaginationParams(page_size=3, after=first_page.next_cursor)
+    )
+    posts = first_page.items + second_page.items
+    assert first_page.length == 4
+    assert first_page.previous_cursor is None
+    assert len(first_page.items) == 3
+    assert len(second_page.items) == 1
+    assert second_page.next_cursor is None
+    assert all(post.organization_id == appteam.id for post in posts)
+    assert len({post.id for post in posts}) == 4
+    assert [post.time for post in posts] == sorted(
+        (post.time for post in posts), reverse=True
+    )
+
+
+def test_list_posts_by_organization_summaries(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that an organization's posts can be paginated as summaries."""
+    fetched_posts = newspost_svc_integration.get_paginated_posts_by_organization(
+        appteam, EventPaginationParams(include_total=False), summary=True
+    )
+    assert fetched_posts.length is None
+    assert [post.id for post in fetched_posts.items] == [jaysonsPost.id]
+    assert isinstance(fetched_posts.items[0], NewsPostSummary)
+
+
+def test_list_posts_by_user(newspost_svc_integration: NewsPostService):
+    """Test that a user's published posts can be paginated by the same user."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    fetched_posts = newspost_svc_integration.get_paginated_posts_by_user(
+        user, user, EventPaginationParams(page_size=1)
+    )
+    assert fetched_posts.length == 1
+    assert [post.id for post in fetched_posts.items] == [embreysPost.id]
+    assert fetched_posts.next_cursor is None
+
+
+def test_list_posts_by_wrong_user(newspost_svc_integration: NewsPostService):
+    """Test that the service enforces permissions when paginating another user's posts."""
+    with pytest.raises(UserPermissionException):
+        newspost_svc_integration.get_paginated_posts_by_user(
+            root, user, EventPaginationParams()
+        )
+
+
+def test_count_posts_by_organization_cached(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that an organization's post count is cached until posts are written."""
+    assert newspost_svc_integration.count_posts_by_organization(appteam) == 1
+    with count_statements(session) as statements:
+        assert newspost_svc_integration.count_posts_by_organization(appteam) == 1
+    assert len(statements) == 0
+
+    newspost_svc_integration.update(root, published_embrey_post)
+    assert newspost_svc_integration.count_posts_by_organization(appteam) == 2
+
+
+def test_list_posts_can_update(newspost_svc_integration: NewsPostService):
+    """Test that listed posts record whether the subject may update them."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    assert [
+        post.can_update
+        for post in newspost_svc_integration.get_posts_by_user(user, user)
+    ] == [False]
+    assert [
+        post.can_update
+        for post in newspost_svc_integration.get_posts_by_user(user, root)
+    ] == [True]
+    own_drafts = newspost_svc_integration.get_drafts_by_user(root, root)
+    assert all(post.can_update for post in own_drafts)
+
+
 def test_get_drafts_by_same_user(newspost_svc_integration: NewsPostService):
     """Test that drafts by a user can be retrieved by the same user."""
     newspost_svc_integration.update(root, draft_ishmael_post)
@@ -290,7 +443,7 @@ def test_list(newspost_svc_integration: NewsPostService):
     assert len(fetched_posts.items) == 2
 
 
-def test_list_unauthenticated(newspost_svc_integration: NewsPostService):
+def test_list_unauthenticated(newspost_svc_integration: NewsPostService, query_budget):
     """Test that a paginated list of published posts can be produced by an unauthenticated user."""
     newspost_svc_integration.update(root, published_embrey_post)
     pagination_params = EventPaginationParams(
@@ -302,7 +455,9 @@ def test_list_unauthenticated(newspost_svc_integration: NewsPostService):
             "%d/%m/%Y, %H:%M:%S"
         ),
     )
-    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    # The page is loaded by 2 statements, and the version of its listing by 1
+    with query_budget(3):
+        fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
     assert len(fetched_posts.items) == 2
 
 
@@ -315,3 +470,536 @@ def test_list_filter(newspost_svc_integration: NewsPostService):
         pagination_params, ambassador
     )
     assert len(fetched_events.items) == 2
+
+
+def test_list_filter_prefix(newspost_svc_integration: NewsPostService):
+    """Test that the last word of a filter matches posts as a prefix."""
+    pagination_params = EventPaginationParams(filter="Jays")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == jaysonsPost.id
+
+
+def test_list_filter_organization(newspost_svc_integration: NewsPostService):
+    """Test that posts can be searched by the name of their organization."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    pagination_params = EventPaginationParams(filter="App Team Carolina")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 2
+
+
+def test_list_filter_author(newspost_svc_integration: NewsPostService):
+    """Test that posts can be searched by the name of their author."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    pagination_params = EventPaginationParams(
+        filter=f"{user.first_name} {user.last_name}"
+    )
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == embreysPost.id
+
+
+def test_list_filter_no_words(newspost_svc_integration: NewsPostService):
+    """Test that a filter without any searchable words matches no posts."""
+    pagination_params = EventPaginationParams(filter="!!!")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 0
+    assert fetched_posts.length == 0
+
+
+def test_list_filter_rank(newspost_svc_integration: NewsPostService):
+    """Test that posts matching a filter can be ordered by relevance."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    pagination_params = EventPaginationParams(filter="Embrey", order_by="rank")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == embreysPost.id
+
+
+def test_list_filter_after_organization_rename(
+    newspost_svc_integration: NewsPostService,
+    organization_svc_integration: OrganizationService,
+):
+    """Test that renaming an organization refreshes the search documents of its posts."""
+    organization_svc_integration.update(
+        root, appteam.model_copy(update={"name": "Carolina Builders"})
+    )
+    pagination_params = EventPaginationParams(filter="Builders")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == jaysonsPost.id
+
+
+def test_list_filter_after_author_rename(
+    newspost_svc_integration: NewsPostService, user_svc_integration: UserService
+):
+    """Test that renaming a user refreshes the search documents of their posts."""
+    user_svc_integration.update(root, root.model_copy(update={"last_name": "Ruth"}))
+    pagination_params = EventPaginationParams(filter="Ruth")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == jaysonsPost.id
+
+
+def test_list_next_cursor(newspost_svc_integration: NewsPostService):
+    """Test that a page of posts ordered by time provides a cursor to the next page."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    pagination_params = EventPaginationParams(order_by="time", page_size=1)
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.items[0].id == jaysonsPost.id
+    assert fetched_posts.next_cursor is not None
+
+
+def test_list_after_cursor(newspost_svc_integration: NewsPostService):
+    """Test that posts can be paginated, newest first, by the `after` cursor."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    first_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(order_by="time", page_size=1)
+    )
+    second_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(page_size=1, after=first_page.next_cursor)
+    )
+    assert len(second_page.items) == 1
+    assert second_page.items[0].id == embreysPost.id
+    assert second_page.next_cursor is None
+    assert second_page.previous_cursor is not None
+
+
+def test_list_before_cursor(newspost_svc_integration: NewsPostService):
+    """Test that posts can be paginated back toward the newest post by the `before` cursor."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    first_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(order_by="time", page_size=1)
+    )
+    second_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(page_size=1, after=first_page.next_cursor)
+    )
+    previous_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(page_size=1, before=second_page.previous_cursor)
+    )
+    assert len(previous_page.items) == 1
+    assert previous_page.items[0].id == jaysonsPost.id
+    assert previous_page.previous_cursor is None
+    assert previous_page.next_cursor is not None
+
+
+def test_list_without_total(newspost_svc_integration: NewsPostService):
+    """Test that counting posts is skipped when the total is not requested."""
+    pagination_params = EventPaginationParams(order_by="time", include_total=False)
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert fetched_posts.length is None
+
+
+def test_list_invalid_cursor(newspost_svc_integration: NewsPostService):
+    """Test that an invalid cursor raises a ValueError."""
+    with pytest.raises(ValueError):
+        newspost_svc_integration.get_paginated_posts(
+            EventPaginationParams(after="not-a-cursor")
+        )
+
+
+def test_list_query_count(newspost_svc_integration: NewsPostService, session: Session):
+    """Test that listing a page of posts does not lazily load each post's author and organization."""
+    insert_many_published_posts(session, 500)
+    pagination_params = EventPaginationParams(order_by="time", page_size=500)
+    with count_statements(session) as statements:
+        fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 500
+    # One statement versions the listing, one counts the posts and another retrieves
+    # the page
+    assert len(statements) == 3
+
+
+def test_get_published_query_count(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that listing published posts does not lazily load each post's author and organization."""
+    insert_many_published_posts(session, 100)
+    with count_statements(session) as statements:
+        fetched_posts = newspost_svc_integration.get_published()
+    assert len(fetched_posts) == 101
+    # The version of the posts, the posts, their authors and their organizations are
+    # each loaded by one statement
+    assert len(statements) == 4
+
+
+def test_get_published_summary(newspost_svc_integration: NewsPostService):
+    """Test that summaries of published posts can be retrieved without their main stories."""
+    fetched_posts = newspost_svc_integration.get_published(summary=True)
+    assert len(fetched_posts) == 1
+    assert isinstance(fetched_posts[0], NewsPostSummary)
+    assert fetched_posts[0].id == jaysonsPost.id
+    assert fetched_posts[0].author.id == jaysonsPost.author_id
+    assert not hasattr(fetched_posts[0], "main_story")
+
+
+def test_list_summary(newspost_svc_integration: NewsPostService, session: Session):
+    """Test that a paginated list of post summaries does not read posts' main stories."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    pagination_params = EventPaginationParams(order_by="time")
+    with count_statements(session) as statements:
+        fetched_posts = newspost_svc_integration.get_paginated_posts(
+            pagination_params, summary=True
+        )
+    assert len(fetched_posts.items) == 2
+    assert all(isinstance(post, NewsPostSummary) for post in fetched_posts.items)
+    assert all("main_story" not in statement for statement in statements)
+
+
+def test_list_summary_after_cursor(newspost_svc_integration: NewsPostService):
+    """Test that post summaries can be paginated by cursor."""
+    newspost_svc_integration.update(root, published_embrey_post)
+    first_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(order_by="time", page_size=1), summary=True
+    )
+    second_page = newspost_svc_integration.get_paginated_posts(
+        EventPaginationParams(page_size=1, after=first_page.next_cursor), summary=True
+    )
+    assert isinstance(second_page.items[0], NewsPostSummary)
+    assert second_page.items[0].id == embreysPost.id
+
+
+def test_list_unauthenticated_cached(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that pages of the public feed are served from the cache once loaded."""
+    pagination_params = EventPaginationParams(order_by="time")
+    newspost_svc_integration.get_paginated_posts(pagination_params)
+    with count_statements(session) as statements:
+        fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 1
+    assert len(statements) == 0
+    statistics = news_feed_cache.statistics()
+    assert statistics.hits == 1
+    assert statistics.misses == 1
+
+
+def test_list_unauthenticated_cache_normalizes_params(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that equivalent searches share a cached page which echoes the given parameters."""
+    newspost_svc_integration.get_paginated_posts(EventPaginationParams(filter="jayson"))
+    pagination_params = EventPaginationParams(filter="  Jayson!")
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert news_feed_cache.statistics().hits == 1
+    assert fetched_posts.params == pagination_params
+
+
+def test_list_authenticated_not_cached(newspost_svc_integration: NewsPostService):
+    """Test that pages requested by signed in users bypass the public feed's cache."""
+    pagination_params = EventPaginationParams(order_by="time")
+    newspost_svc_integration.get_paginated_posts(pagination_params, ambassador)
+    newspost_svc_integration.get_paginated_posts(pagination_params, ambassador)
+    statistics = news_feed_cache.statistics()
+    assert statistics.hits == 0
+    assert statistics.misses == 0
+
+
+def test_get_published_cached(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that published posts are served from the cache once loaded."""
+    newspost_svc_integration.get_published()
+    with count_statements(session) as statements:
+        fetched_posts = newspost_svc_integration.get_published()
+    assert len(fetched_posts) == 1
+    assert len(statements) == 0
+
+
+def test_create_invalidates_cache(newspost_svc_integration: NewsPostService):
+    """Test that creating a post clears the public feed's cache."""
+    newspost_svc_integration.get_published()
+    newspost_svc_integration.create(
+        root, to_add.model_copy(update={"state": "published"})
+    )
+    assert len(newspost_svc_integration.get_published()) == 2
+
+
+def test_update_invalidates_cache(newspost_svc_integration: NewsPostService):
+    """Test that updating a post clears the public feed's cache."""
+    pagination_params = EventPaginationParams(order_by="time")
+    newspost_svc_integration.get_paginated_posts(pagination_params)
+    newspost_svc_integration.update(root, published_embrey_post)
+    fetched_posts = newspost_svc_integration.get_paginated_posts(pagination_params)
+    assert len(fetched_posts.items) == 2
+
+
+def test_delete_invalidates_cache(newspost_svc_integration: NewsPostService):
+    """Test that deleting a post clears the public feed's cache."""
+    newspost_svc_integration.get_published()
+    newspost_svc_integration.delete(root, jaysonsPost.slug)
+    assert len(newspost_svc_integration.get_published()) == 0
+
+
+def test_organization_update_invalidates_cache(
+    newspost_svc_integration: NewsPostService,
+    organization_svc_integration: OrganizationService,
+):
+    """Test that updating an organization clears the cached posts embedding its details."""
+    newspost_svc_integration.get_published()
+    organization_svc_integration.update(
+        root, appteam.model_copy(update={"name": "Carolina Builders"})
+    )
+    fetched_posts = newspost_svc_integration.get_published()
+    assert fetched_posts[0].organization.name == "Carolina Builders"
+
+
+def test_user_update_invalidates_cache(
+    newspost_svc_integration: NewsPostService, user_svc_integration: UserService
+):
+    """Test that updating a user clears the cached posts embedding their details."""
+    newspost_svc_integration.get_published()
+    user_svc_integration.update(root, root.model_copy(update={"last_name": "Ruth"}))
+    fetched_posts = newspost_svc_integration.get_published()
+    assert fetched_posts[0].author.last_name == "Ruth"
+
+
+def test_get_feed_cache_statistics(newspost_svc_integration: NewsPostService):
+    """Test that admins can view the public feed cache's statistics."""
+    newspost_svc_integration.get_published()
+    statistics = newspost_svc_integration.get_feed_cache_statistics(root)
+    assert statistics.misses == 1
+    assert statistics.size == 1
+
+
+def test_get_feed_cache_statistics_enforces_permission(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that users without permission cannot view the feed cache's statistics."""
+    with pytest.raises(UserPermissionException):
+        newspost_svc_integration.get_feed_cache_statistics(ambassador)
+
+
+def test_get_published_validator_unchanged(newspost_svc_integration: NewsPostService):
+    """Test that the version of unchanged published posts is stable."""
+    validator = newspost_svc_integration.get_published_validator()
+    assert newspost_svc_integration.get_published_validator() == validator
+    assert validator.last_modified is not None
+    assert validator.etag == f'W/"{validator.digest}"'
+
+
+def test_get_published_validator_after_update(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that publishing a post changes the version of the published posts."""
+    validator = newspost_svc_integration.get_published_validator()
+    newspost_svc_integration.update(root, published_embrey_post)
+    assert newspost_svc_integration.get_published_validator() != validator
+
+
+def test_get_published_validator_after_delete(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that deleting a post changes the version of the published posts."""
+    validator = newspost_svc_integration.get_published_validator()
+    newspost_svc_integration.delete(root, jaysonsPost.slug)
+    validator_after_delete = newspost_svc_integration.get_published_validator()
+    assert validator_after_delete != validator
+    assert validator_after_delete.last_modified is None
+
+
+def test_get_published_validator_filtered(newspost_svc_integration: NewsPostService):
+    """Test that listings of different posts have different versions."""
+    validator = newspost_svc_integration.get_published_validator(
+        EventPaginationParams(filter="Jayson")
+    )
+    assert validator != newspost_svc_integration.get_published_validator(
+        EventPaginationParams(filter="Embrey")
+    )
+
+
+def test_get_published_validator_cached(
+    newspost_svc_integration: NewsPostService, query_budget
+):
+    """Test that the version of a listing is cached alongside its pages."""
+    pagination_params = EventPaginationParams(filter="Jayson")
+    validator = newspost_svc_integration.get_published_validator(pagination_params)
+    with query_budget(0):
+        assert (
+            newspost_svc_integration.get_published_validator(
+                EventPaginationParams(filter="jayson!")
+            )
+            == validator
+        )
+
+
+def test_get_published_validator_cached_with_page(
+    newspost_svc_integration: NewsPostService, query_budget
+):
+    """Test that pages of the public feed are cached in the same entry as their version,
+    so a page is never served with a version newer than itself."""
+    pagination_params = EventPaginationParams(page_size=1)
+    newspost_svc_integration.get_published_validator(pagination_params)
+    with query_budget(0):
+        newspost_svc_integration.get_paginated_posts(pagination_params)
+    newspost_svc_integration.get_published()
+    with query_budget(0):
+        newspost_svc_integration.get_published_validator()
+
+
+def test_get_published_validator_after_author_rename(
+    newspost_svc_integration: NewsPostService, user_svc_integration: UserService
+):
+    """Test that renaming the author of a published post changes the version of the
+    published posts, which embed their authors' details."""
+    validator = newspost_svc_integration.get_published_validator()
+    user_svc_integration.update(root, root.model_copy(update={"first_name": "Renamed"}))
+    assert newspost_svc_integration.get_published_validator() != validator
+
+
+def test_get_published_validator_after_organization_rename(
+    newspost_svc_integration: NewsPostService,
+    organization_svc_integration: OrganizationService,
+):
+    """Test that renaming the organization of a published post changes the version of
+    the published posts, which embed their organizations' details."""
+    validator = newspost_svc_integration.get_published_validator()
+    organization_svc_integration.update(
+        root, appteam.model_copy(update={"name": "Renamed"})
+    )
+    assert newspost_svc_integration.get_published_validator() != validator
+
+
+def test_get_published_validator_per_subject(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that listings requested by different subjects, which mark different posts as
+    updatable, have different versions."""
+    pagination_params = EventPaginationParams()
+    validator = newspost_svc_integration.get_published_validator(
+        pagination_params, root
+    )
+    assert (
+        newspost_svc_integration.get_published_validator(pagination_params, root)
+        == validator
+    )
+    assert validator.last_modified is None
+    assert validator != newspost_svc_integration.get_published_validator(
+        pagination_params, user
+    )
+    assert validator != newspost_svc_integration.get_published_validator(
+        pagination_params
+    )
+
+
+def test_get_published_validator_after_grant(
+    session: Session, newspost_svc_integration: NewsPostService
+):
+    """Test that changing permissions changes the version of a subject's listing."""
+    pagination_params = EventPaginationParams()
+    validator = newspost_svc_integration.get_published_validator(
+        pagination_params, user
+    )
+    PermissionService(session).grant(
+        root, user, Permission(action="news_post.update", resource="news_post/*")
+    )
+    news_service = NewsPostService(session, PermissionService(session))
+    assert news_service.get_published_validator(pagination_params, user) != validator
+
+
+def test_get_post_validator_after_update(newspost_svc_integration: NewsPostService):
+    """Test that updating a post changes its version."""
+    validator = newspost_svc_integration.get_post_validator(embreysPost.slug)
+    newspost_svc_integration.update(root, published_embrey_post)
+    assert newspost_svc_integration.get_post_validator(embreysPost.slug) != validator
+
+
+def test_state_case_insensitive():
+    """Test that post states are parsed regardless of case."""
+    post = NewsPost(**{**jaysonsPost.model_dump(), "state": " Published"})
+    assert post.state == NewsPostState.PUBLISHED
+
+
+def test_list_filters_state_by_equality(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that listing posts filters their state by equality, which the state index backs."""
+    with count_statements(session) as statements:
+        newspost_svc_integration.get_published()
+    assert "news_post.state = " in statements[0]
+    assert "ILIKE" not in statements[0]
+
+
+def test_publish_due_posts(newspost_svc_integration: NewsPostService, session: Session):
+    """Test that due scheduled drafts are published by a single statement."""
+    publish_at = date_maker(days_in_future=-1, hour=9, minutes=0)
+    newspost_svc_integration.update(
+        root, treysPost.model_copy(update={"publish_at": publish_at})
+    )
+    with count_statements(session) as statements:
+        published = newspost_svc_integration.publish_due_posts()
+    assert published == [treysPost.id]
+    assert len(statements) == 1
+    post = newspost_svc_integration.get_by_slug(treysPost.slug)
+    assert post.state == NewsPostState.PUBLISHED
+    assert post.time == publish_at
+    assert post.publish_at is None
+
+
+def test_publish_due_posts_not_due(newspost_svc_integration: NewsPostService):
+    """Test that posts scheduled in the future are not published yet."""
+    publish_at = date_maker(days_in_future=1, hour=9, minutes=0)
+    newspost_svc_integration.update(
+        root, treysPost.model_copy(update={"publish_at": publish_at})
+    )
+    assert newspost_svc_integration.publish_due_posts() == []
+    post = newspost_svc_integration.get_by_slug(treysPost.slug)
+    assert post.state == NewsPostState.DRAFT
+    assert post.publish_at == publish_at
+
+
+def test_publish_due_posts_invalidates_cache(newspost_svc_integration: NewsPostService):
+    """Test that publishing scheduled posts clears the public feed's cache."""
+    newspost_svc_integration.update(
+        root,
+        treysPost.model_copy(
+            update={"publish_at": date_maker(days_in_future=-1, hour=9, minutes=0)}
+        ),
+    )
+    newspost_svc_integration.get_published()
+    newspost_svc_integration.publish_due_posts()
+    assert len(newspost_svc_integration.get_published()) == 2
+
+
+def test_schedule_enforces_permission(newspost_svc_integration: NewsPostService):
+    """Test that authors cannot schedule their own posts to bypass review."""
+    newspost_svc_integration._permission = create_autospec(
+        newspost_svc_integration._permission
+    )
+    scheduled_post = ishmaelsPost.model_copy(
+        update={"publish_at": date_maker(days_in_future=1, hour=9, minutes=0)}
+    )
+    newspost_svc_integration.update(ambassador, scheduled_post)
+    newspost_svc_integration._permission.enforce.assert_called_with(
+        ambassador, "news_post.update", f"news_post/{ishmaelsPost.slug}"
+    )
+
+
+def test_create_scheduled_enforces_permission(
+    newspost_svc_integration: NewsPostService,
+):
+    """Test that creating a scheduled post requires permission to publish it."""
+    with pytest.raises(UserPermissionException):
+        newspost_svc_integration.create(
+            user,
+            to_add.model_copy(
+                update={"publish_at": date_maker(days_in_future=1, hour=9, minutes=0)}
+            ),
+        )
+
+
+def test_scheduler_run_once(
+    newspost_svc_integration: NewsPostService, session: Session
+):
+    """Test that the scheduler publishes due posts with sessions of its own."""
+    newspost_svc_integration.update(
+        root,
+        treysPost.model_copy(
+            update={"publish_at": date_maker(days_in_future=-1, hour=9, minutes=0)}
+        ),
+    )
+    scheduler = NewsPostScheduler(lambda: Session(session.get_bind()))
+    assert scheduler.run_once() == [treysPost.id]
+    assert scheduler.run_once() == []
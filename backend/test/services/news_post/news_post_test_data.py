@@ -2,6 +2,7 @@ import pytest
 from sqlalchemy.orm import Session
 from ....models.news_post import NewsPost
 from ....entities.news_post_entity import NewsPostEntity
+from ....entities.user_entity import UserEntity
 
 from .news_post_demo_data import date_maker
 from ..user_data import root, ambassador, user
@@ -171,6 +172,36 @@ def insert_fake_data(session: Session):
     session.commit()
 
 
+def insert_many_published_posts(session: Session, count: int):
+    """Insert `count` published posts, each written by a distinct new author.
+
+    Distinct authors ensure lazily loading each post's author could not be served
+    from the session's identity map."""
+    for i in range(count):
+        author = UserEntity(
+            pid=100000000 + i,
+            onyen=f"author{i}",
+            email=f"author{i}@unc.edu",
+            first_name="Author",
+            last_name=str(i),
+        )
+        session.add(author)
+        session.add(
+            NewsPostEntity(
+                headline=f"Bulk News Post {i}",
+                main_story="Bulk main story",
+                author=author,
+                organization_id=[appteam.id, cssg.id, cads.id][i % 3],
+                state="published",
+                slug=f"bulk-{i}",
+                time=date_maker(days_in_future=-1, hour=0, minutes=i % 60),
+                modification_date=date_maker(days_in_future=-1, hour=0, minutes=0),
+                synopsis="Bulk synopsis",
+            )
+        )
+    session.commit()
+
+
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
     insert_fake_data(session)
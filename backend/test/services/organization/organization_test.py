@@ -38,9 +38,10 @@ __license__ = "MIT"
 # Test `OrganizationService.all()`
 
 
-def test_get_all(organization_svc_integration: OrganizationService):
+def test_get_all(organization_svc_integration: OrganizationService, query_budget):
     """Test that all organizations can be retrieved."""
-    fetched_organizations = organization_svc_integration.all()
+    with query_budget(1):
+        fetched_organizations = organization_svc_integration.all()
     assert fetched_organizations is not None
     assert len(fetched_organizations) == len(organizations)
     assert isinstance(fetched_organizations[0], Organization)
@@ -49,9 +50,10 @@ def test_get_all(organization_svc_integration: OrganizationService):
 # Test `OrganizationService.get_by_id()`
 
 
-def test_get_by_slug(organization_svc_integration: OrganizationService):
+def test_get_by_slug(organization_svc_integration: OrganizationService, query_budget):
     """Test that organizations can be retrieved based on their ID."""
-    fetched_organization = organization_svc_integration.get_by_slug(cads.slug)
+    with query_budget(3):
+        fetched_organization = organization_svc_integration.get_by_slug(cads.slug)
     assert fetched_organization is not None
     assert isinstance(fetched_organization, Organization)
     assert fetched_organization.slug == cads.slug
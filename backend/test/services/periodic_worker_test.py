@@ -0,0 +1,51 @@
+"""Tests for the PeriodicWorker class."""
+
+import threading
+
+# Tested Dependencies
+from ...services.periodic_worker import PeriodicWorker
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+class CountingWorker(PeriodicWorker[int]):
+    """Worker counting its runs, failing the first."""
+
+    def __init__(self):
+        super().__init__(lambda: None, interval=0.01)
+        self.runs = 0
+        self.completed: list[int] = []
+        self.ran_twice = threading.Event()
+
+    def run_once(self) -> int:
+        self.runs += 1
+        if self.runs == 1:
+            raise RuntimeError("first run fails")
+        self.ran_twice.set()
+        return self.runs
+
+    def _completed(self, result: int) -> None:
+        self.completed.append(result)
+
+
+def test_runs_until_stopped():
+    """Test that workers keep running after a failed run, and stop when stopped."""
+    worker = CountingWorker()
+    worker.start()
+    assert worker.ran_twice.wait(5)
+    worker.stop()
+    runs = worker.runs
+    assert worker.completed == list(range(2, runs + 1))
+    assert worker._thread is None
+
+
+def test_start_twice_runs_one_thread():
+    """Test that starting a started worker does not start another thread."""
+    worker = CountingWorker()
+    worker.start()
+    thread = worker._thread
+    worker.start()
+    assert worker._thread is thread
+    worker.stop()
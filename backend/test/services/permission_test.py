@@ -1,10 +1,12 @@
 """Tests for the PermissionService class."""
 
 import pytest
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models import Permission, User
 from ...services import PermissionService
+from ...services.permission import compile_permissions
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -14,6 +16,7 @@ from .fixtures import permission_svc
 from .role_data import ambassador_role
 from .user_data import root, ambassador, user
 from .permission_data import ambassador_permission
+from .conftest import count_statements
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -82,48 +85,141 @@ def test_root_resource_access(permission_svc: PermissionService):
     assert permission_svc.check(root, "user.delete", "user/1")
 
 
-def test_check_catch_all_permission(permission_svc: PermissionService):
+def test_check_catch_all_permission():
     """Tests that you can create a user with all permissions"""
     p = Permission(action="*", resource="*")
-    assert permission_svc._check_permission(p, "permission.grant", "*")
-    assert permission_svc._check_permission(p, "permission.grant", "checkin")
-    assert permission_svc._check_permission(p, "permission.revoke", "checkin.*")
-    assert permission_svc._check_permission(p, "checkin.delete", "checkin/1")
+    permissions = compile_permissions([p])
+    assert permissions.allows("permission.grant", "*")
+    assert permissions.allows("permission.grant", "checkin")
+    assert permissions.allows("permission.revoke", "checkin.*")
+    assert permissions.allows("checkin.delete", "checkin/1")
 
 
-def test_check_catch_all_resource_permission(permission_svc: PermissionService):
+def test_check_catch_all_resource_permission():
     """Tests that that all resource permissions can be given to a user using *"""
     p = Permission(action="permission.grant", resource="*")
-    assert permission_svc._check_permission(p, "permission.grant", "*")
-    assert permission_svc._check_permission(p, "permission.grant", "checkin")
-    assert (
-        permission_svc._check_permission(p, "permission.revoke", "checkin.*") is False
-    )
-    assert permission_svc._check_permission(p, "checkin.delete", "checkin/1") is False
+    permissions = compile_permissions([p])
+    assert permissions.allows("permission.grant", "*")
+    assert permissions.allows("permission.grant", "checkin")
+    assert permissions.allows("permission.revoke", "checkin.*") is False
+    assert permissions.allows("checkin.delete", "checkin/1") is False
 
 
-def test_check_specific_resource_permission(permission_svc: PermissionService):
+def test_check_specific_resource_permission():
     """Tests giving a specific resource permission to a user"""
     p = Permission(action="permission.grant", resource="checkin*")
-    assert permission_svc._check_permission(p, "permission.grant", "*") is False
-    assert permission_svc._check_permission(p, "permission.grant", "checkin")
-    assert (
-        permission_svc._check_permission(p, "permission.revoke", "checkin.*") is False
-    )
-    assert permission_svc._check_permission(p, "checkin.delete", "checkin/1") is False
+    permissions = compile_permissions([p])
+    assert permissions.allows("permission.grant", "*") is False
+    assert permissions.allows("permission.grant", "checkin")
+    assert permissions.allows("permission.revoke", "checkin.*") is False
+    assert permissions.allows("checkin.delete", "checkin/1") is False
 
 
-def test_check_specific_permission(permission_svc: PermissionService):
+def test_check_specific_permission():
     """Tests that you can create a user with a specific permission"""
     p = Permission(action="checkin.delete", resource="checkin/*")
-    assert permission_svc._check_permission(p, "checkin.delete", "checkin/1")
-    assert permission_svc._check_permission(p, "checkin.delete", "checkin/12")
-    assert permission_svc._check_permission(p, "checkin.create", "checkin/12") is False
-    assert (
-        permission_svc._check_permission(p, "permission.revoke", "checkin.*") is False
+    permissions = compile_permissions([p])
+    assert permissions.allows("checkin.delete", "checkin/1")
+    assert permissions.allows("checkin.delete", "checkin/12")
+    assert permissions.allows("checkin.create", "checkin/12") is False
+    assert permissions.allows("permission.revoke", "checkin.*") is False
+
+
+def test_get_permissions_of_nonexistent_user(permission_svc: PermissionService):
+    """Test covers an edge case of get_permissions when user does not exist"""
+    assert permission_svc.get_permissions(User(id=423)) == []
+
+
+def test_get_permissions_includes_roles(permission_svc: PermissionService):
+    """Tests that a user's permissions include those of the user's roles"""
+    assert ambassador_permission in permission_svc.get_permissions(ambassador)
+
+
+def test_check_loads_permissions_once(
+    permission_svc: PermissionService, session: Session
+):
+    """Tests that a subject's permissions are loaded by one query and then reused"""
+    with count_statements(session) as statements:
+        assert permission_svc.check(ambassador, "checkin.create", "checkin")
+        assert permission_svc.check(ambassador, "checkin.delete", "checkin") is False
+        permission_svc.enforce(ambassador, "checkin.create", "checkin")
+    # The version of permissions is read, then the permissions at that version
+    assert len(statements) == 2
+
+
+def test_check_reads_cached_permissions(session: Session):
+    """Tests that later requests only read the version of cached permissions"""
+    PermissionService(session).check(ambassador, "checkin.create", "checkin")
+    with count_statements(session) as statements:
+        assert PermissionService(session).check(ambassador, "checkin.create", "checkin")
+    assert len(statements) == 1
+
+
+def test_grant_invalidates_cached_permissions_of_other_processes(session: Session):
+    """Tests that a grant through one session is seen by the next request of another"""
+    with Session(session.get_bind()) as other_session:
+        assert (
+            PermissionService(other_session).check(user, "checkin.delete", "checkin")
+            is False
+        )
+        other_session.commit()
+        PermissionService(session).grant(
+            root, user, Permission(action="checkin.delete", resource="*")
+        )
+        assert PermissionService(other_session).check(user, "checkin.delete", "checkin")
+
+
+def test_grant_invalidates_loaded_permissions(permission_svc: PermissionService):
+    """Tests that permissions granted after a check are seen by the next check"""
+    assert permission_svc.check(user, "checkin.delete", "checkin") is False
+    permission_svc.grant(root, user, Permission(action="checkin.delete", resource="*"))
+    assert permission_svc.check(user, "checkin.delete", "checkin")
+
+
+def test_compiled_permission_set_allows():
+    """Tests that a compiled set allows what any one of its permissions allows"""
+    permission_set = compile_permissions(
+        [
+            Permission(action="checkin.delete", resource="checkin/*"),
+            Permission(action="checkin.*", resource="checkin/1"),
+            Permission(action="user.get", resource="*"),
+        ]
+    )
+    assert permission_set.allows("checkin.delete", "checkin/12")
+    assert permission_set.allows("checkin.create", "checkin/1")
+    assert permission_set.allows("checkin.create", "checkin/12") is False
+    assert permission_set.allows("user.get", "user/1")
+    assert permission_set.allows("user.delete", "user/1") is False
+
+
+def test_compiled_permission_set_shared_by_fingerprint():
+    """Tests that sets of the same permissions, in any order, are compiled once"""
+    first = Permission(id=1, action="checkin.delete", resource="*")
+    second = Permission(id=2, action="user.get", resource="user/*")
+    assert compile_permissions([first, second]) is compile_permissions(
+        [second, first, second]
     )
 
 
-def test_get_user_roles_permissions(permission_svc: PermissionService):
-    """Test covers an edge case of _get_user_roles_permissions when user does not exist"""
-    assert permission_svc._get_user_roles_permissions(User(id=423)) == []
+def test_services_share_compiled_permission_set(session: Session):
+    """Tests that the compiled permissions of a subject are shared across requests"""
+    first_request = PermissionService(session)
+    second_request = PermissionService(session)
+    assert first_request.check(ambassador, "checkin.create", "checkin")
+    assert second_request.check(ambassador, "checkin.create", "checkin")
+    assert first_request._get_permission_set(
+        ambassador
+    ) is second_request._get_permission_set(ambassador)
+
+
+def test_check_many(permission_svc: PermissionService, session: Session):
+    """Tests that many resources are checked against loaded permissions at once"""
+    permission_svc.check(ambassador, "checkin.create", "checkin")
+    with count_statements(session) as statements:
+        assert permission_svc.check_many(
+            ambassador, "checkin.create", ["checkin", "checkin/1", "checkin"]
+        ) == [True, False, True]
+        assert permission_svc.check_many(ambassador, "checkin.delete", ["checkin"]) == [
+            False
+        ]
+    assert len(statements) == 0
@@ -0,0 +1,23 @@
+"""Tests for the query_budget fixture detecting service calls executing too many statements."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+__authors__ = ["Embrey Morton", "Ishmael Percy", "Jayson Mbugua", "Alphonzo Dixon"]
+__copyright__ = "Copyright 2023"
+__license__ = "MIT"
+
+
+def test_query_budget_within_budget(session: Session, query_budget):
+    with query_budget(2) as statements:
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+    assert statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_query_budget_exceeded(session: Session, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="Executed 3 SQL statements"):
+        with query_budget(2):
+            for _ in range(3):
+                session.execute(text("SELECT 1"))
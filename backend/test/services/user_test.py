@@ -1,20 +1,29 @@
 """Tests for the UserService class."""
 
 import pytest
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
-from ...services import UserService, PermissionService
+from ...services import NewsPostService, UserService, PermissionService
 from ...services.exceptions import ResourceNotFoundException
+from ...services.news_post import news_feed_cache
+from ...services.user import registered_user_cache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
-from .fixtures import user_svc, user_svc_integration, permission_svc_mock
+from .fixtures import (
+    newspost_svc_integration,
+    user_svc,
+    user_svc_integration,
+    permission_svc_mock,
+)
 
 # Data Models for Fake Data Inserted in Setup
 from .user_data import root, ambassador, user
 from . import user_data
+from .conftest import count_statements
 from .permission_data import (
     ambassador_permission,
     ambassador_permission_coworking_reservation,
@@ -115,12 +124,14 @@ def test_search_by_pid_does_not_exist(user_svc: UserService):
     users = user_svc.search(ambassador, "123")
     assert len(users) == 0
 
+
 def test_search_by_pid_rhonda(user_svc: UserService):
     """Test searching for a partial PID that does exist."""
     users = user_svc.search(ambassador, "999")
     assert len(users) == 1
     assert users[0] == root
 
+
 def test_list(user_svc: UserService):
     """Test that a paginated list of users can be produced."""
     pagination_params = PaginationParams(page=0, page_size=2, order_by="id", filter="")
@@ -247,6 +258,65 @@ def test_update_user_enforces_permission(
     )
 
 
+def test_get_by_pid(user_svc_integration: UserService):
+    """Test that a user can be retrieved by PID without loading their permissions."""
+    fetched_user = user_svc_integration.get_by_pid(ambassador.pid)
+    assert fetched_user == ambassador
+    assert user_svc_integration.get_by_pid(423) is None
+
+
+def test_get_by_pid_cached(user_svc_integration: UserService, session: Session):
+    """Test that users retrieved by PID are cached, and protected from modification."""
+    user_svc_integration.get_by_pid(ambassador.pid).first_name = "Changed"
+    with count_statements(session) as statements:
+        fetched_user = user_svc_integration.get_by_pid(ambassador.pid)
+    assert len(statements) == 0
+    assert fetched_user.first_name == ambassador.first_name
+
+
+def test_get_by_pid_after_update(user_svc_integration: UserService):
+    """Test that updating a user invalidates the cached user."""
+    user_svc_integration.get_by_pid(ambassador.pid)
+    user_svc_integration.update(
+        root, ambassador.model_copy(update={"first_name": "Changed"})
+    )
+    assert user_svc_integration.get_by_pid(ambassador.pid).first_name == "Changed"
+
+
+def test_get_by_pid_after_create(user_svc_integration: UserService):
+    """Test that the absence of a user is not cached, so users registered by any process
+    are found at once."""
+    assert user_svc_integration.get_by_pid(123456789) is None
+    new_user = NewUser(pid=123456789, onyen="new_user", email="new_user@unc.edu")
+    user_svc_integration.create(root, new_user)
+    assert user_svc_integration.get_by_pid(123456789) is not None
+    assert registered_user_cache.statistics().hits == 0
+
+
+def test_update_evicts_only_updated_user(user_svc_integration: UserService):
+    """Test that updating a user evicts only that user from `registered_user_cache`."""
+    user_svc_integration.get_by_pid(ambassador.pid)
+    user_svc_integration.get_by_pid(root.pid)
+    user_svc_integration.update(
+        root, ambassador.model_copy(update={"pronouns": "they / them"})
+    )
+    assert registered_user_cache.statistics().size == 1
+    assert user_svc_integration.get_by_pid(ambassador.pid).pronouns == "they / them"
+
+
+def test_update_without_rename_keeps_feed_cache(
+    user_svc_integration: UserService, newspost_svc_integration: NewsPostService
+):
+    """Test that only renaming a user clears the cached public feed."""
+    newspost_svc_integration.get_published()
+    user_svc_integration.update(
+        root, root.model_copy(update={"pronouns": "they / them"})
+    )
+    assert news_feed_cache.statistics().size == 1
+    user_svc_integration.update(root, root.model_copy(update={"first_name": "Renamed"}))
+    assert news_feed_cache.statistics().size == 0
+
+
 def test_new_user_accepted_agreement_is_false(user_svc: UserService):
     """Test that makes sure newly registered users have not accepted the agreement"""
     new_user = NewUser(pid=123456789, onyen="new_user", email="new_user@unc.edu")